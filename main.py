@@ -1,9 +1,66 @@
 
-from orientacao_carreiras import CLI
+import sys
+
+def executar_lote(argumentos):
+    # Modo não interativo: recomendações para um arquivo de perfis.
+    # O pipeline (csv, json e validadores) só é importado neste modo
+    import argparse
+    import json
+
+    from orientacao_carreiras import SistemaRecomendacao, obter_carreiras_futuro
+    from orientacao_carreiras.pipeline import executar_recomendacao, TAMANHO_LOTE_PADRAO
+
+    parser = argparse.ArgumentParser(prog="main.py",
+                                     description="Sistema de Orientação de Carreiras")
+    comandos = parser.add_subparsers(dest="comando", required=True)
+
+    recomendar = comandos.add_parser("recomendar", help="Gera recomendações para um arquivo de perfis")
+    recomendar.add_argument("--entrada", required=True, help="Arquivo de perfis (.jsonl ou .csv)")
+    recomendar.add_argument("--saida", required=True, help="Arquivo de saída (.jsonl)")
+    recomendar.add_argument("--limite", type=int, default=3, help="Recomendações por perfil")
+    recomendar.add_argument("--lote", type=int, default=TAMANHO_LOTE_PADRAO,
+                            help="Perfis processados por vez (memória limitada)")
+    recomendar.add_argument("--metricas",
+                            help="Grava tempos por etapa em .json ou .prom (Prometheus)")
+    recomendar.add_argument("--catalogo",
+                            help="Arquivo de carreiras (.json, .jsonl ou .csv); compilado em snapshot")
+    recomendar.add_argument("--competencias", help="Arquivo de competências do catálogo")
+
+    args = parser.parse_args(argumentos)
+
+    if args.catalogo:
+        from orientacao_carreiras.catalogo import abrir_catalogo
+
+        sistema = abrir_catalogo(args.catalogo, args.competencias).criar_sistema()
+    else:
+        sistema = SistemaRecomendacao(obter_carreiras_futuro())
+    if args.metricas:
+        sistema.ativar_metricas()
+
+    totais = executar_recomendacao(args.entrada, args.saida, sistema,
+                                   limite=args.limite, tamanho_lote=args.lote)
+
+    if args.metricas:
+        with open(args.metricas, 'w', encoding='utf-8') as arquivo:
+            if args.metricas.endswith('.prom'):
+                arquivo.write(sistema.metricas.para_prometheus())
+            else:
+                json.dump(sistema.metricas.para_dict(), arquivo, ensure_ascii=False, indent=2)
+
+    print(f"Perfis processados: {totais['processados']} "
+          f"(validos: {totais['validos']}, invalidos: {totais['invalidos']})")
 
 def main():
     # Função principal que inicia o sistema.
 
+    # Com argumentos na linha de comando, executa o modo em lote
+    if len(sys.argv) > 1:
+        executar_lote(sys.argv[1:])
+        return
+
+    # A CLI (e os validadores) só são importados no modo interativo
+    from orientacao_carreiras import CLI
+
     try:
         # Cria e executa a interface CLI
         interface = CLI()
@@ -17,4 +74,3 @@ def main():
 
 if __name__ == "__main__":
     main()
-    
\ No newline at end of file
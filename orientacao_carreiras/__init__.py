@@ -1,25 +1,61 @@
 """
 Sistema de Orientação de Carreiras
 Análise de perfis profissionais e recomendações para o futuro do trabalho.
+
+Os nomes públicos são carregados sob demanda (PEP 562): importar o pacote
+não importa nenhum submódulo, e `from orientacao_carreiras import
+SistemaRecomendacao` carrega apenas os módulos de que o sistema depende
+(sem a CLI, os validadores ou o repositório em disco).
 """
 
-from .perfil import Perfil
-from .competencia import Competencia
-from .carreira import Carreira
-from .sistema_recomendacao import SistemaRecomendacao
-from .dados_mock import obter_competencias_base, obter_carreiras_futuro
-from .cli import CLI
-from .validadores import validar_idade, validar_nivel, validar_nome
+from importlib import import_module
+
+# Submódulo de cada nome público
+_MODULOS = {
+    'Perfil': 'perfil',
+    'PerfilCompacto': 'perfil',
+    'Competencia': 'competencia',
+    'Carreira': 'carreira',
+    'SistemaRecomendacao': 'sistema_recomendacao',
+    'VocabularioCompetencias': 'vocabulario',
+    'VOCABULARIO': 'vocabulario',
+    'RepositorioPerfis': 'repositorio_perfis',
+    'obter_competencias_base': 'dados_mock',
+    'obter_carreiras_futuro': 'dados_mock',
+    'CLI': 'cli',
+    'validar_idade': 'validadores',
+    'validar_nivel': 'validadores',
+    'validar_nome': 'validadores',
+}
 
 __all__ = [
     'Perfil',
-    'Competencia', 
+    'PerfilCompacto',
+    'Competencia',
     'Carreira',
     'SistemaRecomendacao',
+    'VocabularioCompetencias',
+    'VOCABULARIO',
+    'RepositorioPerfis',
     'obter_competencias_base',
     'obter_carreiras_futuro',
     'CLI',
     'validar_idade',
     'validar_nivel',
     'validar_nome'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(nome):
+    # Importa o submódulo do nome no primeiro acesso e guarda o valor no pacote.
+    modulo = _MODULOS.get(nome)
+    if modulo is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {nome!r}")
+
+    valor = getattr(import_module(f'.{modulo}', __name__), nome)
+    globals()[nome] = valor
+    return valor
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,198 @@
+# Análise de gaps em lote com trilha de aprendizado priorizada.
+#
+# Para cada perfil e cada carreira da lista curta (as recomendações do
+# perfil ou carreiras escolhidas), calcula o déficit de cada competência
+# exigida em relação a um nível mínimo (configurável por categoria de
+# requisito). Os déficits são ponderados pelo peso do requisito (3/2/1) e
+# pela demanda futura da competência (Competencia.nivel_demanda_futuro).
+#
+# A trilha ordena as competências pelo ganho de compatibilidade, somado em
+# todas as carreiras da lista curta, obtido ao elevar a competência até o
+# nível alvo. Os requisitos de cada carreira ficam pré-compilados em tuplas
+# (competencia, peso, nivel_minimo), então analisar um perfil é só percorrer
+# essas tuplas uma vez por carreira, sem montar listas intermediárias.
+# Como os caches do sistema, elas valem para uma versão do catálogo e ficam
+# em um cache LRU limitado (listas curtas passadas pelo chamador também
+# entram nele).
+
+from collections import namedtuple
+
+from .cache_recomendacoes import CacheLRU, TAMANHO_CACHE_PADRAO
+from .carreira import Carreira
+from .dados_mock import obter_competencias_base
+from .matriz_pesos import NIVEL_MAXIMO
+from .sistema_recomendacao import RecomendacaoCarreira
+
+# Demanda futura usada para competências fora do catálogo de competências
+DEMANDA_PADRAO = 3
+
+# Uma competência da trilha de aprendizado
+GapCompetencia = namedtuple('GapCompetencia', [
+    'competencia',            # Nome da competência
+    'nivel_atual',            # Nível atual no perfil (0 se não possui)
+    'nivel_alvo',             # Maior nível mínimo entre as carreiras que a exigem
+    'prioridade',             # Soma de déficit x peso do requisito x demanda futura
+    'ganho_compatibilidade',  # Pontos percentuais ganhos, somados nas carreiras
+    'carreiras',              # Nomes das carreiras da lista curta que a exigem
+])
+
+# Resultado da análise de um perfil
+AnaliseGaps = namedtuple('AnaliseGaps', ['perfil', 'recomendacoes', 'trilha'])
+
+
+class MotorGaps:
+    """
+    Calcula gaps e trilhas de aprendizado para muitos perfis.
+
+    Atributos:
+        sistema (SistemaRecomendacao): Sistema cujo catálogo é usado
+        niveis_minimos (dict): Nível mínimo por categoria de requisito
+        demandas (dict): {competencia: nivel_demanda_futuro}
+    """
+
+    def __init__(self, sistema, nivel_minimo=None, competencias=None,
+                 tamanho_cache=TAMANHO_CACHE_PADRAO):
+        """
+        Configura o motor.
+
+        Args:
+            sistema (SistemaRecomendacao): Sistema de recomendação
+            nivel_minimo (int ou dict): Nível mínimo adequado, único ou por
+                categoria ({'essenciais': 4, 'importantes': 3, 'desejaveis': 2});
+                padrão: SistemaRecomendacao.NIVEL_ADEQUADO
+            competencias (dict): {nome: Competencia} com a demanda futura
+                (padrão: obter_competencias_base())
+            tamanho_cache (int): Carreiras com requisitos pré-compilados guardados
+        """
+        if nivel_minimo is None:
+            nivel_minimo = sistema.NIVEL_ADEQUADO
+        if isinstance(nivel_minimo, int):
+            nivel_minimo = {categoria: nivel_minimo for categoria, _ in Carreira.PESOS_REQUISITOS}
+
+        for categoria, _ in Carreira.PESOS_REQUISITOS:
+            if not 1 <= nivel_minimo.get(categoria, 0) <= NIVEL_MAXIMO:
+                raise ValueError(f"Nível mínimo de '{categoria}' deve ser entre 1 e {NIVEL_MAXIMO}")
+
+        if competencias is None:
+            competencias = obter_competencias_base()
+
+        self.sistema = sistema
+        self.niveis_minimos = dict(nivel_minimo)
+        self.demandas = {nome: competencia.nivel_demanda_futuro
+                         for nome, competencia in competencias.items()}
+        # {carreira: (compilação usada, ((competencia, peso, nivel_minimo), ...))}
+        self._requisitos = CacheLRU(tamanho_cache)
+        self._versao_requisitos = None
+
+    def _sincronizar_requisitos(self):
+        # Descarta os requisitos guardados se o catálogo do sistema mudou.
+        matriz = self.sistema.obter_matriz()
+        versao = (matriz, matriz.versao)
+        if self._versao_requisitos != versao:
+            self._requisitos.limpar()
+            self._versao_requisitos = versao
+
+    def _requisitos_carreira(self, carreira):
+        # Requisitos da carreira com peso e nível mínimo, refeitos quando a carreira muda.
+        compilada = carreira.compilar()
+        guardado = self._requisitos.obter(carreira)
+        if guardado is not None and guardado[0] is compilada:
+            return guardado[1]
+
+        requisitos = tuple(
+            (competencia, peso, self.niveis_minimos[categoria])
+            for categoria, peso in Carreira.PESOS_REQUISITOS
+            for competencia in carreira.requisitos[categoria]
+        )
+        self._requisitos.guardar(carreira, (compilada, requisitos))
+        return requisitos
+
+    def analisar(self, perfil, carreiras=None, limite=3):
+        """
+        Analisa os gaps de um perfil em relação a uma lista curta de carreiras.
+
+        Args:
+            perfil (Perfil): Perfil do usuário
+            carreiras (list): Carreiras analisadas (padrão: as `limite` recomendações)
+            limite (int): Número de recomendações usadas quando `carreiras` é None
+
+        Returns:
+            AnaliseGaps: Recomendações (com os gaps de cada carreira) e trilha ordenada
+        """
+        if carreiras is None:
+            lista_curta = self.sistema.recomendar_carreiras(perfil, limite)
+        else:
+            calcular = self.sistema.calcular_compatibilidade
+            lista_curta = [(carreira, calcular(perfil, carreira)) for carreira in carreiras]
+
+        return self._analisar(perfil, lista_curta)
+
+    def analisar_lote(self, perfis, limite=3, carreiras=None):
+        """
+        Analisa os gaps de vários perfis.
+
+        Sem `carreiras`, a lista curta de cada perfil são as suas `limite`
+        recomendações, calculadas em lote pela matriz de pesos.
+
+        Args:
+            perfis (iterable): Perfis dos usuários
+            limite (int): Recomendações por perfil
+            carreiras (list): Mesma lista curta para todos os perfis (opcional)
+
+        Yields:
+            AnaliseGaps: Análise de cada perfil, na ordem da entrada
+        """
+        if carreiras is not None:
+            for perfil in perfis:
+                yield self.analisar(perfil, carreiras)
+            return
+
+        matriz = self.sistema.obter_matriz()
+        for perfil in perfis:
+            yield self._analisar(perfil, matriz.melhores(matriz.pontuar_esparso(perfil), limite))
+
+    def _analisar(self, perfil, lista_curta):
+        # Déficits por carreira e ganho de cada competência em toda a lista curta.
+        self._sincronizar_requisitos()
+        obter_nivel = perfil.competencias.get
+        demandas = self.demandas
+        alvos = {}            # {competencia: nível alvo}
+        prioridades = {}      # {competencia: prioridade}
+        exigida_por = {}      # {competencia: [nomes das carreiras]}
+        recomendacoes = []
+
+        for carreira, compatibilidade in lista_curta:
+            gaps = []
+
+            for competencia, peso, nivel_minimo in self._requisitos_carreira(carreira):
+                deficit = nivel_minimo - obter_nivel(competencia, 0)
+                if deficit <= 0:
+                    continue
+
+                gaps.append(competencia)
+                prioridades[competencia] = (prioridades.get(competencia, 0) + deficit * peso
+                                            * demandas.get(competencia, DEMANDA_PADRAO))
+                alvos[competencia] = max(alvos.get(competencia, 0), nivel_minimo)
+                nomes = exigida_por.setdefault(competencia, [])
+                if carreira.nome not in nomes:
+                    nomes.append(carreira.nome)
+
+            recomendacoes.append(RecomendacaoCarreira(carreira, compatibilidade, tuple(gaps)))
+
+        # Ganho ao elevar cada competência até o alvo, somado nas carreiras da lista curta
+        ganhos = dict.fromkeys(alvos, 0.0)
+        for carreira, _ in lista_curta:
+            maximo = carreira.compilar().pontos_maximos
+            for competencia, peso, _ in self._requisitos_carreira(carreira):
+                alvo = alvos.get(competencia)
+                if alvo is not None:
+                    ganhos[competencia] += (alvo - obter_nivel(competencia, 0)) * peso / maximo * 100
+
+        trilha = []
+        for competencia, alvo in alvos.items():
+            trilha.append(GapCompetencia(competencia, obter_nivel(competencia, 0), alvo,
+                                         prioridades[competencia], round(ganhos[competencia], 1),
+                                         tuple(exigida_por[competencia])))
+
+        trilha.sort(key=lambda gap: (-gap.ganho_compatibilidade, -gap.prioridade, gap.competencia))
+        return AnaliseGaps(perfil.nome, tuple(recomendacoes), tuple(trilha))
@@ -0,0 +1,421 @@
+# Indicadores agregados de populações de perfis (painéis).
+#
+# Agrega, em uma única passagem e com memória constante no número de perfis:
+#   - distribuição das classes de preparação para o futuro
+#     (Perfil.nivel_preparacao_futuro);
+#   - score total e média de competências (Perfil.calcular_score_total e
+#     Perfil.calcular_media_competencias) somados para as médias gerais;
+#   - histograma de níveis (1 a 5) de cada competência por área de atuação;
+#   - número de perfis com compatibilidade >= limiar em cada carreira.
+#
+# Os agregados parciais (AgregadoPopulacao) são combináveis: cada faixa de
+# um RepositorioPerfis pode ser agregada em um processo e os parciais são
+# somados no final, na ordem em que ficam prontos.
+#
+# Uso: python -m orientacao_carreiras.analise_populacao DIRETORIO
+#          [--limiar 70] [--trabalhadores 4] [--saida painel.json]
+
+import argparse
+import json
+import math
+import os
+import re
+from array import array
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+from .matriz_pesos import NIVEL_MAXIMO
+from .perfil import Perfil
+from .repositorio_perfis import RepositorioPerfis
+
+# Compatibilidade mínima (%) padrão para um perfil contar como compatível
+LIMIAR_PADRAO = 70.0
+
+# Perfis por tarefa na agregação paralela
+TAMANHO_BLOCO_PADRAO = 50_000
+
+# Encontra os níveis não nulos de uma linha do repositório sem percorrê-la em Python
+_NIVEL_NAO_NULO = re.compile(rb'[^\x00]')
+
+# Contexto do processo trabalhador (preenchido por _iniciar_trabalhador)
+_contexto = None
+
+
+class AgregadoPopulacao:
+    """
+    Indicadores somados de um conjunto de perfis.
+
+    Atributos:
+        limiar (float): Compatibilidade mínima (%) usada em `compativeis`
+        total (int): Perfis agregados
+        preparacao (dict): {classificacao: perfis}
+        soma_score (int): Soma de calcular_score_total dos perfis
+        soma_media (float): Soma de calcular_media_competencias dos perfis
+        perfis_area (dict): {area_atuacao: perfis}
+        histogramas (dict): {area_atuacao: {competencia: [perfis no nível 1, ..., 5]}}
+        compativeis (list): Perfis com compatibilidade >= limiar, por carreira do catálogo
+    """
+
+    def __init__(self, total_carreiras, limiar=LIMIAR_PADRAO):
+        """
+        Cria um agregado vazio.
+
+        Args:
+            total_carreiras (int): Número de carreiras do catálogo
+            limiar (float): Compatibilidade mínima (%)
+        """
+        self.limiar = limiar
+        self.total = 0
+        self.preparacao = {}
+        self.soma_score = 0
+        self.soma_media = 0.0
+        self.perfis_area = {}
+        self.histogramas = {}
+        self.compativeis = [0] * total_carreiras
+
+    def combinar(self, outro):
+        """
+        Soma outro agregado (do mesmo catálogo e limiar) a este.
+
+        Args:
+            outro (AgregadoPopulacao): Agregado parcial
+
+        Returns:
+            AgregadoPopulacao: Este agregado
+        """
+        if len(outro.compativeis) != len(self.compativeis) or outro.limiar != self.limiar:
+            raise ValueError("Agregados de catálogos ou limiares diferentes")
+
+        self.total += outro.total
+        self.soma_score += outro.soma_score
+        self.soma_media += outro.soma_media
+        for classificacao, quantidade in outro.preparacao.items():
+            self.preparacao[classificacao] = self.preparacao.get(classificacao, 0) + quantidade
+        for area, quantidade in outro.perfis_area.items():
+            self.perfis_area[area] = self.perfis_area.get(area, 0) + quantidade
+
+        for area, histogramas in outro.histogramas.items():
+            destino = self.histogramas.setdefault(area, {})
+            for competencia, contagens in histogramas.items():
+                atual = destino.get(competencia)
+                if atual is None:
+                    destino[competencia] = list(contagens)
+                else:
+                    destino[competencia] = [a + b for a, b in zip(atual, contagens)]
+
+        self.compativeis = [a + b for a, b in zip(self.compativeis, outro.compativeis)]
+        return self
+
+    def distribuicao_preparacao(self):
+        """
+        Retorna a fração de perfis em cada classe de preparação.
+
+        Returns:
+            dict: {classificacao: fração (0-1)}
+        """
+        if not self.total:
+            return {}
+        return {classificacao: quantidade / self.total
+                for classificacao, quantidade in sorted(self.preparacao.items())}
+
+    def proporcao_compativeis(self):
+        """
+        Retorna a fração de perfis com compatibilidade >= limiar em cada carreira.
+
+        Returns:
+            list: Frações (0-1), na ordem do catálogo
+        """
+        if not self.total:
+            return [0.0] * len(self.compativeis)
+        return [quantidade / self.total for quantidade in self.compativeis]
+
+    def para_dict(self, carreiras=None):
+        """
+        Exporta os indicadores em dicionário serializável em JSON.
+
+        Args:
+            carreiras (list): Carreiras do catálogo, para nomear `compatibilidade`
+
+        Returns:
+            dict: {total, score_medio, media_competencias, preparacao,
+                limiar, compatibilidade, areas}
+        """
+        total = self.total or 1
+        if carreiras is None:
+            nomes = [str(indice) for indice in range(len(self.compativeis))]
+        else:
+            nomes = [carreira.nome for carreira in carreiras]
+
+        return {
+            'total': self.total,
+            'score_medio': self.soma_score / total,
+            'media_competencias': self.soma_media / total,
+            'preparacao': self.distribuicao_preparacao(),
+            'limiar': self.limiar,
+            'compatibilidade': dict(zip(nomes, self.proporcao_compativeis())),
+            'areas': {
+                area: {
+                    'perfis': self.perfis_area[area],
+                    'niveis': dict(sorted(self.histogramas.get(area, {}).items())),
+                }
+                for area in sorted(self.perfis_area)
+            },
+        }
+
+    def __repr__(self):
+        return f"AgregadoPopulacao(perfis={self.total}, areas={len(self.perfis_area)})"
+
+
+def _pontos_minimos(maximos, limiar):
+    # Menor pontuação inteira de cada carreira cuja compatibilidade (com o mesmo
+    # arredondamento do sistema) atinge o limiar; acima do máximo se nenhuma atinge.
+    # A busca começa abaixo de limiar - 0.05 (o arredondamento para uma casa sobe
+    # valores a partir daí), então cobre a folga mesmo em carreiras com máximo grande.
+    minimos = []
+    for maximo in maximos:
+        pontos = max(0, math.floor((limiar - 0.05) * maximo / 100) - 1)
+        while pontos <= maximo and maximo and round((pontos / maximo) * 100, 1) < limiar:
+            pontos += 1
+        minimos.append(pontos)
+    return minimos
+
+
+def _contar_compativeis(compativeis, pontos, minimos):
+    # Conta as carreiras em que os pontos atingem o limiar.
+    for indice, valor in pontos.items():
+        if valor >= minimos[indice]:
+            compativeis[indice] += 1
+
+
+def _agregar_faixa(repositorio, inicio, fim, linhas, maximos, limiar):
+    # Agrega as linhas [inicio, fim) de um repositório em uma única passagem.
+    agregado = AgregadoPopulacao(len(maximos), limiar)
+    minimos = _pontos_minimos(maximos, limiar)
+    nomes = repositorio.vocabulario.nomes
+    ids_preparacao = {repositorio.vocabulario.buscar_id(competencia)
+                      for competencia in Perfil.COMPETENCIAS_PREPARACAO}
+    classificar = Perfil.classificar_preparacao
+    preparacao = agregado.preparacao
+    perfis_area = agregado.perfis_area
+    compativeis = agregado.compativeis
+    contagens_area = {}   # {area: array com NIVEL_MAXIMO contagens por id de competência}
+    soma_score = 0
+    soma_media = 0.0
+
+    for posicao in range(inicio, fim):
+        linha = repositorio.obter_niveis(posicao).tobytes()
+        area = repositorio.obter_area(posicao)
+        contagens = contagens_area.get(area)
+        if contagens is None:
+            contagens = contagens_area[area] = array('Q', bytes(8 * NIVEL_MAXIMO * len(nomes)))
+        perfis_area[area] = perfis_area.get(area, 0) + 1
+
+        pontos = {}
+        score = quantidade = total_preparacao = 0
+        for encontrado in _NIVEL_NAO_NULO.finditer(linha):
+            id_competencia = encontrado.start()
+            nivel = linha[id_competencia]
+            score += nivel
+            quantidade += 1
+            contagens[id_competencia * NIVEL_MAXIMO + nivel - 1] += 1
+            if id_competencia in ids_preparacao:
+                total_preparacao += nivel
+
+            linha_pesos = linhas[id_competencia] if id_competencia < len(linhas) else None
+            if linha_pesos:
+                for indice, peso in linha_pesos.items():
+                    pontos[indice] = pontos.get(indice, 0) + nivel * peso
+
+        soma_score += score
+        if quantidade:
+            soma_media += score / quantidade
+        classificacao = classificar(total_preparacao)[1]
+        preparacao[classificacao] = preparacao.get(classificacao, 0) + 1
+        _contar_compativeis(compativeis, pontos, minimos)
+
+    # Troca os ids pelos nomes, guardando só as competências presentes
+    for area, contagens in contagens_area.items():
+        histogramas = agregado.histogramas[area] = {}
+        for id_competencia, nome in enumerate(nomes):
+            base = id_competencia * NIVEL_MAXIMO
+            niveis = contagens[base:base + NIVEL_MAXIMO]
+            if any(niveis):
+                histogramas[nome] = niveis.tolist()
+
+    agregado.total = fim - inicio
+    agregado.soma_score = soma_score
+    agregado.soma_media = soma_media
+    return agregado
+
+
+def _iniciar_trabalhador(diretorio, linhas, maximos, limiar):
+    # Abre o repositório no processo trabalhador e guarda o catálogo compilado.
+    global _contexto
+    _contexto = (RepositorioPerfis(diretorio), linhas, maximos, limiar)
+
+
+def _agregar_bloco(inicio, fim):
+    # Tarefa executada no trabalhador para uma faixa de perfis.
+    repositorio, linhas, maximos, limiar = _contexto
+    return _agregar_faixa(repositorio, inicio, fim, linhas, maximos, limiar)
+
+
+class AnalisadorPopulacao:
+    """
+    Calcula os indicadores de painel de muitos perfis contra um catálogo.
+
+    Atributos:
+        sistema (SistemaRecomendacao): Sistema cujo catálogo é usado
+        limiar (float): Compatibilidade mínima (%) para contar um perfil como compatível
+    """
+
+    def __init__(self, sistema, limiar=LIMIAR_PADRAO):
+        """
+        Configura o analisador.
+
+        Args:
+            sistema (SistemaRecomendacao): Sistema de recomendação
+            limiar (float): Compatibilidade mínima (%), maior que 0 e até 100
+        """
+        if not 0 < limiar <= 100:
+            raise ValueError("Limiar de compatibilidade deve estar entre 0 (exclusivo) e 100")
+
+        self.sistema = sistema
+        self.limiar = limiar
+
+    def agregar(self, perfis):
+        """
+        Agrega um fluxo de objetos Perfil (pode ser um gerador).
+
+        Args:
+            perfis (iterable): Perfis dos usuários
+
+        Returns:
+            AgregadoPopulacao: Indicadores dos perfis
+        """
+        matriz = self.sistema.obter_matriz()
+        minimos = _pontos_minimos(matriz.pontos_maximos, self.limiar)
+        agregado = AgregadoPopulacao(len(matriz), self.limiar)
+        preparacao = agregado.preparacao
+        perfis_area = agregado.perfis_area
+
+        for perfil in perfis:
+            area = perfil.area_atuacao
+            perfis_area[area] = perfis_area.get(area, 0) + 1
+            histogramas = agregado.histogramas.setdefault(area, {})
+            for competencia, nivel in perfil.competencias.items():
+                contagens = histogramas.get(competencia)
+                if contagens is None:
+                    contagens = histogramas[competencia] = [0] * NIVEL_MAXIMO
+                contagens[nivel - 1] += 1
+
+            classificacao = perfil.nivel_preparacao_futuro()[1]
+            preparacao[classificacao] = preparacao.get(classificacao, 0) + 1
+            agregado.soma_score += perfil.calcular_score_total()
+            agregado.soma_media += perfil.calcular_media_competencias()
+            agregado.total += 1
+            _contar_compativeis(agregado.compativeis, matriz.pontuar_esparso(perfil), minimos)
+
+        return agregado
+
+    def agregar_repositorio(self, repositorio, inicio=0, fim=None):
+        """
+        Agrega os perfis de um RepositorioPerfis sem criar objetos Perfil.
+
+        Cada linha de níveis é lida do arquivo mapeado e percorrida uma vez
+        (só as competências com nível) para todos os indicadores.
+
+        Args:
+            repositorio (RepositorioPerfis): Repositório aberto
+            inicio (int): Primeira posição a agregar
+            fim (int): Posição final (exclusiva); padrão: até o fim
+
+        Returns:
+            AgregadoPopulacao: Indicadores da faixa
+        """
+        fim = len(repositorio) if fim is None else min(fim, len(repositorio))
+        matriz = self.sistema.obter_matriz()
+        return _agregar_faixa(repositorio, min(inicio, fim), fim,
+                              matriz.linhas_alinhadas(repositorio.vocabulario),
+                              matriz.pontos_maximos, self.limiar)
+
+    def agregar_paralelo(self, diretorio, trabalhadores=None, tamanho_bloco=TAMANHO_BLOCO_PADRAO):
+        """
+        Agrega um repositório dividindo-o em faixas entre vários processos.
+
+        Cada processo abre o repositório (os arquivos mapeados são
+        compartilhados pelo sistema operacional) e devolve um agregado
+        parcial; os parciais são combinados à medida que ficam prontos.
+
+        Args:
+            diretorio (str): Diretório do RepositorioPerfis
+            trabalhadores (int): Número de processos (padrão: número de CPUs)
+            tamanho_bloco (int): Perfis por tarefa
+
+        Returns:
+            AgregadoPopulacao: Indicadores de todo o repositório
+        """
+        if tamanho_bloco < 1:
+            raise ValueError("Tamanho do bloco deve ser pelo menos 1")
+
+        matriz = self.sistema.obter_matriz()
+        with RepositorioPerfis(diretorio) as repositorio:
+            total = len(repositorio)
+            linhas = matriz.linhas_alinhadas(repositorio.vocabulario)
+
+        trabalhadores = trabalhadores or os.cpu_count() or 1
+        resultado = AgregadoPopulacao(len(matriz), self.limiar)
+        blocos = iter(range(0, total, tamanho_bloco))
+
+        with ProcessPoolExecutor(max_workers=trabalhadores, initializer=_iniciar_trabalhador,
+                                 initargs=(diretorio, linhas, list(matriz.pontos_maximos),
+                                           self.limiar)) as executor:
+            # No máximo 2 blocos por processo ficam pendentes ao mesmo tempo
+            pendentes = set()
+            for inicio in blocos:
+                pendentes.add(executor.submit(_agregar_bloco, inicio,
+                                              min(inicio + tamanho_bloco, total)))
+                if len(pendentes) >= 2 * trabalhadores:
+                    prontos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+                    for futuro in prontos:
+                        resultado.combinar(futuro.result())
+
+            for futuro in pendentes:
+                resultado.combinar(futuro.result())
+
+        return resultado
+
+
+def main(argumentos=None):
+    # Agrega um repositório colunar contra o catálogo padrão e grava o painel em JSON.
+    from .dados_mock import obter_carreiras_futuro
+    from .sistema_recomendacao import SistemaRecomendacao
+
+    parser = argparse.ArgumentParser(description="Indicadores de uma população de perfis")
+    parser.add_argument('diretorio', help="Diretório do repositório colunar")
+    parser.add_argument('--limiar', type=float, default=LIMIAR_PADRAO,
+                        help="Compatibilidade mínima (%%) por carreira")
+    parser.add_argument('--trabalhadores', type=int, default=1,
+                        help="Processos (1 = agregação no processo atual)")
+    parser.add_argument('--saida', help="Arquivo JSON de saída (padrão: saída padrão)")
+    args = parser.parse_args(argumentos)
+
+    sistema = SistemaRecomendacao(obter_carreiras_futuro())
+    analisador = AnalisadorPopulacao(sistema, args.limiar)
+
+    if args.trabalhadores > 1:
+        agregado = analisador.agregar_paralelo(args.diretorio, args.trabalhadores)
+    else:
+        with RepositorioPerfis(args.diretorio) as repositorio:
+            agregado = analisador.agregar_repositorio(repositorio)
+
+    texto = json.dumps(agregado.para_dict(sistema.obter_matriz().carreiras),
+                       ensure_ascii=False, indent=2)
+    if args.saida:
+        with open(args.saida, 'w', encoding='utf-8') as arquivo:
+            arquivo.write(texto + '\n')
+    else:
+        print(texto)
+
+
+if __name__ == "__main__":
+    main()
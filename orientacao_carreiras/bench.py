@@ -0,0 +1,648 @@
+# Benchmarks dos trechos críticos do Sistema de Orientação de Carreiras.
+#
+# Uso: python -m orientacao_carreiras.bench [cenario ...] [--escala rapida|padrao|grande]
+#          [--json resultados.json] [--baseline anterior.json] [--tolerancia 0.25]
+#
+# Com --baseline, as métricas são comparadas às de uma execução anterior
+# (gravada com --json) e o comando termina com código 1 se alguma piorar
+# mais que a tolerância.
+
+import argparse
+import heapq
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+from datetime import datetime
+
+from .dados_mock import obter_competencias_base
+from .dados_sinteticos import gerar_carreiras, gerar_competencias, gerar_perfis
+from .perfil import Perfil, PerfilCompacto
+from .sistema_recomendacao import SistemaRecomendacao
+
+
+def _medir(funcao, repeticoes=5):
+    # Retorna o menor tempo (em segundos) de uma execução da função.
+    return min(timeit.repeat(funcao, number=1, repeat=repeticoes))
+
+
+def _catalogo_sintetico(total_carreiras, total_competencias, semente=42):
+    # Catálogo do gerador de dados sintéticos (popularidade de Zipf).
+    competencias = list(gerar_competencias(total_competencias, semente))
+    carreiras = list(gerar_carreiras(competencias, total_carreiras, semente))
+    return carreiras, competencias
+
+
+def _perfis_sinteticos(total, competencias, por_perfil=8, semente=7):
+    # Gera perfis com `por_perfil` competências.
+    return gerar_perfis(competencias, total, semente, por_perfil)
+
+
+def bench_top_k(tamanhos=(1_000, 10_000, 100_000), semente=42):
+    """
+    Compara seleção parcial com heap e ordenação completa para vários limites.
+
+    Args:
+        tamanhos (tuple): Tamanhos de catálogo a testar
+        semente (int): Semente do gerador aleatório
+
+    Returns:
+        list: Dicionários {catalogo, limite, heap_ms, sort_ms}
+    """
+    gerador = random.Random(semente)
+    resultados = []
+
+    for total in tamanhos:
+        compatibilidades = [round(gerador.random() * 100, 1) for _ in range(total)]
+        chave = compatibilidades.__getitem__
+        limites = sorted({1, 3, 10, total // 100, total // 50, total // 20, total // 10} - {0})
+
+        for limite in limites:
+            tempo_heap = _medir(lambda: heapq.nlargest(limite, range(total), key=chave))
+            tempo_sort = _medir(lambda: sorted(range(total), key=chave, reverse=True)[:limite])
+            resultados.append({
+                'catalogo': total,
+                'limite': limite,
+                'heap_ms': tempo_heap * 1000,
+                'sort_ms': tempo_sort * 1000,
+            })
+
+    return resultados
+
+
+def _mostrar_top_k(resultados):
+    print(f"{'catalogo':>9} {'limite':>7} {'heap (ms)':>10} {'sort (ms)':>10}  melhor")
+    for r in resultados:
+        melhor = 'heap' if r['heap_ms'] < r['sort_ms'] else 'sort'
+        print(f"{r['catalogo']:>9} {r['limite']:>7} {r['heap_ms']:>10.3f} {r['sort_ms']:>10.3f}  {melhor}")
+
+    # Ponto de virada: menor fração limite/catalogo em que a ordenação vence
+    print("\nPonto de virada (limite/catalogo):")
+    for total in sorted({r['catalogo'] for r in resultados}):
+        virada = [r['limite'] / total for r in resultados
+                  if r['catalogo'] == total and r['sort_ms'] <= r['heap_ms']]
+        texto = f"{min(virada):.3f}" if virada else "heap sempre melhor"
+        print(f"  {total:>9}: {texto}")
+
+
+class _PerfilSemSlots:
+    # Réplica do layout anterior do Perfil (com __dict__, datetime e lista de
+    # objetivos sempre alocados), usada como referência de memória.
+
+    def __init__(self, nome, idade=0, area_atuacao=""):
+        self.nome = nome
+        self.idade = idade
+        self.area_atuacao = area_atuacao
+        self.competencias = {}
+        self.objetivos = []
+        self.data_criacao = datetime.now()
+
+    def adicionar_competencia(self, nome_competencia, nivel):
+        self.competencias[nome_competencia] = nivel
+
+
+def _bytes_por_perfil(classe, total, competencias):
+    # Mede com tracemalloc a memória alocada por perfil de uma classe.
+    tracemalloc.start()
+    inicio = tracemalloc.get_traced_memory()[0]
+
+    perfis = []
+    for i in range(total):
+        perfil = classe(f"Usuario {i}", 30, "Tecnologia")
+        for j, competencia in enumerate(competencias):
+            perfil.adicionar_competencia(competencia, (i + j) % 5 + 1)
+        perfis.append(perfil)
+
+    usado = tracemalloc.get_traced_memory()[0] - inicio
+    tracemalloc.stop()
+
+    # Desconta a lista que guarda os perfis
+    return (usado - (len(perfis) * 8)) / total
+
+
+def bench_memoria(total=20_000):
+    """
+    Mede bytes por perfil (8 competências) antes e depois de __slots__.
+
+    Args:
+        total (int): Número de perfis criados por medição
+
+    Returns:
+        list: Dicionários {layout, bytes_por_perfil}
+    """
+    competencias = list(obter_competencias_base())
+    layouts = (
+        ('sem_slots (anterior)', _PerfilSemSlots),
+        ('Perfil', Perfil),
+        ('PerfilCompacto', PerfilCompacto),
+    )
+
+    return [{'layout': nome, 'bytes_por_perfil': _bytes_por_perfil(classe, total, competencias)}
+            for nome, classe in layouts]
+
+
+def _mostrar_memoria(resultados):
+    referencia = resultados[0]['bytes_por_perfil']
+    print(f"{'layout':<22} {'bytes/perfil':>12} {'reducao':>8}")
+    for r in resultados:
+        reducao = 1 - r['bytes_por_perfil'] / referencia
+        print(f"{r['layout']:<22} {r['bytes_por_perfil']:>12.0f} {reducao:>8.0%}")
+
+
+def bench_paralelo(total_perfis=40_000, trabalhadores=(1, 2, 4, 8), tamanho_lote=500):
+    """
+    Mede a vazão (perfis/s) do RecomendadorParalelo com vários processos.
+
+    Args:
+        total_perfis (int): Perfis recomendados por medição
+        trabalhadores (tuple): Números de processos a testar
+        tamanho_lote (int): Perfis por tarefa
+
+    Returns:
+        list: Dicionários {trabalhadores, segundos, perfis_por_segundo}
+    """
+    from .processamento_paralelo import RecomendadorParalelo
+
+    carreiras, competencias = _catalogo_sintetico(2_000, 300)
+    sistema = SistemaRecomendacao(carreiras)
+    perfis = list(_perfis_sinteticos(total_perfis, competencias))
+    resultados = []
+
+    for quantidade in trabalhadores:
+        with RecomendadorParalelo(sistema, quantidade, tamanho_lote) as recomendador:
+            # Aquece os processos antes de medir
+            for _ in recomendador.recomendar(perfis[:quantidade * tamanho_lote]):
+                pass
+
+            inicio = time.perf_counter()
+            for _ in recomendador.recomendar(perfis):
+                pass
+            segundos = time.perf_counter() - inicio
+
+        resultados.append({
+            'trabalhadores': quantidade,
+            'segundos': segundos,
+            'perfis_por_segundo': total_perfis / segundos,
+        })
+
+    return resultados
+
+
+def _mostrar_paralelo(resultados):
+    base = resultados[0]['perfis_por_segundo']
+    print(f"{'processos':>9} {'segundos':>9} {'perfis/s':>10} {'ganho':>6}")
+    for r in resultados:
+        ganho = r['perfis_por_segundo'] / base
+        print(f"{r['trabalhadores']:>9} {r['segundos']:>9.2f} {r['perfis_por_segundo']:>10.0f} {ganho:>5.1f}x")
+
+
+def bench_operacoes(catalogos=(10, 1_000, 10_000), competencias_por_perfil=(2, 8, 32),
+                    total_perfis=200):
+    """
+    Mede o tempo por chamada das operações principais do sistema.
+
+    Cobre calcular_compatibilidade, recomendar_carreiras, recomendar_ranqueado,
+    recomendar_pareto, identificar_gaps, gerar_relatorio_simples e
+    Perfil.to_dict, com o cache de recomendações desativado, para vários
+    tamanhos de catálogo e perfis mais ou menos esparsos (competências por perfil).
+
+    Args:
+        catalogos (tuple): Números de carreiras a testar
+        competencias_por_perfil (tuple): Competências de cada perfil
+        total_perfis (int): Perfis usados em cada medição
+
+    Returns:
+        list: Dicionários {operacao, carreiras, competencias_por_perfil, us_por_chamada}
+    """
+    resultados = []
+
+    for total_carreiras in catalogos:
+        carreiras, competencias = _catalogo_sintetico(total_carreiras,
+                                                      max(100, total_carreiras // 20))
+        sistema = SistemaRecomendacao(carreiras, tamanho_cache=0)
+        amostra = carreiras[:100]
+
+        for por_perfil in competencias_por_perfil:
+            perfis = list(_perfis_sinteticos(total_perfis, competencias, por_perfil))
+            melhores = [sistema.recomendar_carreiras(perfil, 1)[0][0] for perfil in perfis]
+
+            operacoes = {
+                'calcular_compatibilidade': (
+                    lambda: [sistema.calcular_compatibilidade(perfil, carreira)
+                             for perfil in perfis for carreira in amostra],
+                    len(perfis) * len(amostra)),
+                'recomendar_carreiras': (
+                    lambda: [sistema.recomendar_carreiras(perfil) for perfil in perfis],
+                    len(perfis)),
+                'recomendar_ranqueado': (
+                    lambda: [sistema.recomendar_ranqueado(perfil) for perfil in perfis],
+                    len(perfis)),
+                'recomendar_pareto': (
+                    lambda: [sistema.recomendar_pareto(perfil) for perfil in perfis],
+                    len(perfis)),
+                'identificar_gaps': (
+                    lambda: [sistema.identificar_gaps(perfil, carreira)
+                             for perfil, carreira in zip(perfis, melhores)],
+                    len(perfis)),
+                'gerar_relatorio_simples': (
+                    lambda: [sistema.gerar_relatorio_simples(perfil) for perfil in perfis],
+                    len(perfis)),
+                'Perfil.to_dict': (
+                    lambda: [perfil.to_dict() for perfil in perfis],
+                    len(perfis)),
+            }
+
+            for operacao, (funcao, chamadas) in operacoes.items():
+                resultados.append({
+                    'operacao': operacao,
+                    'carreiras': total_carreiras,
+                    'competencias_por_perfil': por_perfil,
+                    'us_por_chamada': _medir(funcao, 3) / chamadas * 1e6,
+                })
+
+    return resultados
+
+
+def _mostrar_operacoes(resultados):
+    print(f"{'operacao':<26} {'carreiras':>9} {'comp/perfil':>11} {'us/chamada':>11}")
+    for r in resultados:
+        print(f"{r['operacao']:<26} {r['carreiras']:>9} {r['competencias_por_perfil']:>11}"
+              f" {r['us_por_chamada']:>11.2f}")
+
+
+def bench_aproximado(catalogos=(20_000, 100_000), sondas=(1, 4, 16, 64), limite=10,
+                     total_perfis=200):
+    """
+    Mede latência e recall@k da busca aproximada (IVF) contra a busca exata.
+
+    A busca exata é a da matriz de pesos (pontuar_esparso + melhores); o
+    recall@k é a fração das `limite` carreiras exatas presentes no
+    resultado aproximado, na média dos perfis.
+
+    Args:
+        catalogos (tuple): Números de carreiras a testar
+        sondas (tuple): Grupos pontuados por consulta
+        limite (int): k do recall@k
+        total_perfis (int): Perfis consultados em cada medição
+
+    Returns:
+        list: Dicionários {modo, carreiras, sondas, us_por_chamada, recall}
+    """
+    from .indice_aproximado import IndiceAproximado
+
+    resultados = []
+
+    for total_carreiras in catalogos:
+        carreiras, competencias = _catalogo_sintetico(total_carreiras,
+                                                      max(100, total_carreiras // 20))
+        matriz = SistemaRecomendacao(carreiras, tamanho_cache=0).obter_matriz()
+        perfis = list(_perfis_sinteticos(total_perfis, competencias))
+        exatos = [{id(c) for c, _ in matriz.melhores(matriz.pontuar_esparso(perfil), limite)}
+                  for perfil in perfis]
+
+        tempo = _medir(lambda: [matriz.melhores(matriz.pontuar_esparso(perfil), limite)
+                                for perfil in perfis], 3)
+        resultados.append({'modo': 'exato', 'carreiras': total_carreiras, 'sondas': 0,
+                           'us_por_chamada': tempo / len(perfis) * 1e6, 'recall': 1.0})
+
+        inicio = time.perf_counter()
+        indice = IndiceAproximado(matriz)
+        resultados.append({'modo': 'construcao', 'carreiras': total_carreiras,
+                           'sondas': 0, 'construcao_s': time.perf_counter() - inicio})
+
+        for quantidade in sondas:
+            aproximados = [indice.recomendar(perfil, limite, quantidade) for perfil in perfis]
+            acertos = sum(len(exato.intersection(id(c) for c, _ in aproximado))
+                          for exato, aproximado in zip(exatos, aproximados))
+            tempo = _medir(lambda: [indice.recomendar(perfil, limite, quantidade)
+                                    for perfil in perfis], 3)
+            resultados.append({
+                'modo': 'ivf',
+                'carreiras': total_carreiras,
+                'sondas': quantidade,
+                'us_por_chamada': tempo / len(perfis) * 1e6,
+                'recall': acertos / (limite * len(perfis)),
+            })
+
+    return resultados
+
+
+def _mostrar_aproximado(resultados):
+    print(f"{'modo':<10} {'carreiras':>9} {'sondas':>6} {'us/chamada':>11} {'recall@k':>9}")
+    for r in resultados:
+        if r['modo'] == 'construcao':
+            print(f"{'construcao':<10} {r['carreiras']:>9} {'':>6} {r['construcao_s']:>10.2f}s")
+        else:
+            print(f"{r['modo']:<10} {r['carreiras']:>9} {r['sondas']:>6}"
+                  f" {r['us_por_chamada']:>11.1f} {r['recall']:>9.3f}")
+
+
+def bench_serializacao(total_perfis=20_000, total_carreiras=2_000):
+    """
+    Compara json.dumps(to_dict()) com o formato binário de serializacao.
+
+    Mede codificação e decodificação (json.loads + from_dict contra
+    DecodificadorBinario) de perfis, carreiras e relatórios em lista, e o
+    tamanho médio de cada item.
+
+    Args:
+        total_perfis (int): Perfis (e relatórios) serializados
+        total_carreiras (int): Carreiras do catálogo serializadas
+
+    Returns:
+        list: Dicionários {item, formato, operacao, us_por_chamada} e
+            {item, formato, operacao='tamanho', bytes_por_item}
+    """
+    from .carreira import Carreira
+    from .serializacao import CodificadorBinario, DecodificadorBinario, relatorio_para_dict
+
+    carreiras, competencias = _catalogo_sintetico(total_carreiras, 300)
+    sistema = SistemaRecomendacao(carreiras, tamanho_cache=0)
+    perfis = list(_perfis_sinteticos(total_perfis, competencias))
+    relatorios = [sistema.gerar_relatorio_completo(perfil) for perfil in perfis]
+
+    conjuntos = (
+        ('perfil', perfis, Perfil.to_dict, Perfil.from_dict),
+        ('carreira', carreiras, Carreira.to_dict, Carreira.from_dict),
+        ('relatorio', relatorios, relatorio_para_dict, None),
+    )
+    resultados = []
+
+    for item, itens, para_dict, de_dict in conjuntos:
+        textos = [json.dumps(para_dict(i), ensure_ascii=False) for i in itens]
+        codificador = CodificadorBinario()
+        codificador.escrever_varios(itens)
+        binario = codificador.obter_bytes()
+
+        def codificar_binario():
+            CodificadorBinario().escrever_varios(itens)
+
+        if de_dict is None:
+            decodificar_json = lambda: [json.loads(texto) for texto in textos]
+        else:
+            decodificar_json = lambda: [de_dict(json.loads(texto)) for texto in textos]
+
+        medicoes = (
+            ('json', 'codificar', lambda: [json.dumps(para_dict(i), ensure_ascii=False)
+                                           for i in itens]),
+            ('binario', 'codificar', codificar_binario),
+            ('json', 'decodificar', decodificar_json),
+            ('binario', 'decodificar', lambda: list(DecodificadorBinario(binario))),
+        )
+        for formato, operacao, funcao in medicoes:
+            resultados.append({'item': item, 'formato': formato, 'operacao': operacao,
+                               'us_por_chamada': _medir(funcao, 3) / len(itens) * 1e6})
+
+        tamanhos = (('json', sum(len(texto.encode('utf-8')) + 1 for texto in textos)),
+                    ('binario', len(binario)))
+        for formato, total in tamanhos:
+            resultados.append({'item': item, 'formato': formato, 'operacao': 'tamanho',
+                               'bytes_por_item': total / len(itens)})
+
+    return resultados
+
+
+def _mostrar_serializacao(resultados):
+    print(f"{'item':<10} {'operacao':<12} {'json':>10} {'binario':>10} {'ganho':>6}")
+    linhas = {}
+    for r in resultados:
+        valor = r.get('us_por_chamada', r.get('bytes_por_item'))
+        linhas.setdefault((r['item'], r['operacao']), {})[r['formato']] = valor
+    for (item, operacao), valores in linhas.items():
+        unidade = 'B' if operacao == 'tamanho' else 'us'
+        print(f"{item:<10} {operacao:<12} {valores['json']:>8.1f}{unidade:>2}"
+              f" {valores['binario']:>8.1f}{unidade:>2} {valores['json'] / valores['binario']:>5.1f}x")
+
+
+# Pontos de entrada medidos por bench_inicializacao: (nome, código executado)
+ENTRADAS_INICIALIZACAO = (
+    ('pacote', 'import orientacao_carreiras'),
+    ('sistema', 'from orientacao_carreiras import SistemaRecomendacao'),
+    ('cli', 'from orientacao_carreiras import CLI'),
+    ('catalogo', 'from orientacao_carreiras.catalogo import abrir_catalogo'),
+    ('servidor', 'import orientacao_carreiras.servidor'),
+    ('main', 'import main'),
+)
+
+
+def _importtime(codigo, raiz):
+    # Executa o código em um novo interpretador com -X importtime.
+    # Retorna (total_us, pacote_us, modulos, processo_s) somando o tempo próprio de cada módulo.
+    ambiente = dict(os.environ, PYTHONPATH=raiz)
+    inicio = time.perf_counter()
+    processo = subprocess.run([sys.executable, '-X', 'importtime', '-c', codigo],
+                              capture_output=True, text=True, env=ambiente, check=True)
+    duracao = time.perf_counter() - inicio
+
+    total = pacote = modulos = 0
+    for linha in processo.stderr.splitlines():
+        partes = linha.split('|')
+        if not linha.startswith('import time:') or not partes[0][12:].strip().isdigit():
+            continue  # Cabeçalho "self [us] | cumulative | imported package"
+        proprio = int(partes[0][12:])
+        total += proprio
+        modulos += 1
+        if partes[2].strip().startswith('orientacao_carreiras'):
+            pacote += proprio
+
+    return total, pacote, modulos, duracao
+
+
+def bench_inicializacao(repeticoes=5):
+    """
+    Mede o tempo de importação de cada ponto de entrada (python -X importtime).
+
+    Cada entrada roda em um interpretador novo; vale a menor de `repeticoes`
+    execuções. importacao_ms soma o tempo próprio de todos os módulos
+    importados, pacote_ms só o dos módulos de orientacao_carreiras e
+    processo_ms inclui o início e o fim do interpretador.
+
+    Args:
+        repeticoes (int): Execuções por ponto de entrada
+
+    Returns:
+        list: Dicionários {entrada, importacao_ms, pacote_ms, processo_ms, total_modulos}
+    """
+    raiz = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    resultados = []
+
+    for entrada, codigo in ENTRADAS_INICIALIZACAO:
+        medicoes = [_importtime(codigo, raiz) for _ in range(repeticoes)]
+        total, pacote, modulos, _ = min(medicoes)
+        resultados.append({
+            'entrada': entrada,
+            'importacao_ms': total / 1000,
+            'pacote_ms': pacote / 1000,
+            'processo_ms': min(medicao[3] for medicao in medicoes) * 1000,
+            'total_modulos': float(modulos),
+        })
+
+    return resultados
+
+
+def _mostrar_inicializacao(resultados):
+    print(f"{'entrada':<10} {'importacao (ms)':>15} {'pacote (ms)':>12} {'processo (ms)':>14} "
+          f"{'modulos':>8}")
+    for r in resultados:
+        print(f"{r['entrada']:<10} {r['importacao_ms']:>15.2f} {r['pacote_ms']:>12.2f} "
+              f"{r['processo_ms']:>14.1f} {r['total_modulos']:>8.0f}")
+
+
+CENARIOS = {
+    'operacoes': (bench_operacoes, _mostrar_operacoes),
+    'top_k': (bench_top_k, _mostrar_top_k),
+    'memoria': (bench_memoria, _mostrar_memoria),
+    'paralelo': (bench_paralelo, _mostrar_paralelo),
+    'aproximado': (bench_aproximado, _mostrar_aproximado),
+    'serializacao': (bench_serializacao, _mostrar_serializacao),
+    'inicializacao': (bench_inicializacao, _mostrar_inicializacao),
+}
+
+# Parâmetros de cada cenário por escala ('padrao' usa os valores das funções)
+ESCALAS = {
+    'rapida': {
+        'operacoes': {'catalogos': (10, 1_000), 'total_perfis': 50},
+        'top_k': {'tamanhos': (1_000, 10_000)},
+        'memoria': {'total': 2_000},
+        'paralelo': {'total_perfis': 2_000, 'trabalhadores': (1, 2)},
+        'aproximado': {'catalogos': (5_000,), 'total_perfis': 50},
+        'serializacao': {'total_perfis': 2_000, 'total_carreiras': 500},
+        'inicializacao': {'repeticoes': 3},
+    },
+    'padrao': {},
+    'grande': {
+        'operacoes': {'catalogos': (10, 1_000, 10_000, 100_000), 'total_perfis': 1_000},
+        'paralelo': {'total_perfis': 1_000_000},
+        'aproximado': {'catalogos': (20_000, 100_000, 500_000), 'total_perfis': 1_000},
+        'serializacao': {'total_perfis': 200_000, 'total_carreiras': 20_000},
+        'inicializacao': {'repeticoes': 15},
+    },
+}
+
+# Sufixos das métricas comparadas com a baseline e se valores menores são melhores
+METRICAS = (
+    ('us_por_chamada', True),
+    ('_ms', True),
+    ('bytes_por_perfil', True),
+    ('bytes_por_item', True),
+    ('_modulos', True),
+    ('_por_segundo', False),
+    ('recall', False),
+)
+
+
+def _metrica(campo):
+    # Retorna True/False (menor é melhor?) para campos de métrica, None para os demais.
+    for sufixo, menor_melhor in METRICAS:
+        if campo.endswith(sufixo):
+            return menor_melhor
+    return None
+
+
+def _chave_resultado(resultado):
+    # Identifica uma linha de resultado pelos campos que não são métricas.
+    return tuple(sorted((campo, valor) for campo, valor in resultado.items()
+                        if _metrica(campo) is None and not isinstance(valor, float)))
+
+
+def comparar_baseline(atual, baseline, tolerancia=0.25):
+    """
+    Compara os resultados atuais com os de uma execução anterior.
+
+    Args:
+        atual (dict): {cenario: resultados} da execução atual
+        baseline (dict): {cenario: resultados} da execução anterior
+        tolerancia (float): Piora relativa aceita (0.25 = 25%)
+
+    Returns:
+        list: Dicionários {cenario, chave, metrica, baseline, atual, variacao}
+            das métricas que pioraram além da tolerância
+    """
+    regressoes = []
+
+    for cenario, resultados in atual.items():
+        anteriores = {_chave_resultado(r): r for r in baseline.get(cenario, ())}
+
+        for resultado in resultados:
+            anterior = anteriores.get(_chave_resultado(resultado))
+            if anterior is None:
+                continue
+
+            for campo, valor in resultado.items():
+                menor_melhor = _metrica(campo)
+                referencia = anterior.get(campo)
+                if menor_melhor is None or not referencia:
+                    continue
+
+                variacao = valor / referencia - 1
+                piora = variacao if menor_melhor else -variacao
+                if piora > tolerancia:
+                    regressoes.append({
+                        'cenario': cenario,
+                        'chave': dict(_chave_resultado(resultado)),
+                        'metrica': campo,
+                        'baseline': referencia,
+                        'atual': valor,
+                        'variacao': variacao,
+                    })
+
+    return regressoes
+
+
+def main(argumentos=None):
+    # Executa os cenários escolhidos e mostra os resultados.
+    parser = argparse.ArgumentParser(description="Benchmarks do sistema de recomendação")
+    parser.add_argument('cenarios', nargs='*',
+                        help=f"Cenários a executar (padrão: todos): {', '.join(CENARIOS)}")
+    parser.add_argument('--escala', choices=ESCALAS, default='padrao',
+                        help="Tamanho dos dados sintéticos")
+    parser.add_argument('--json', help="Grava os resultados neste arquivo JSON")
+    parser.add_argument('--baseline', help="Compara com os resultados JSON de uma execução anterior")
+    parser.add_argument('--tolerancia', type=float, default=0.25,
+                        help="Piora relativa aceita na comparação (padrão: 0.25)")
+    args = parser.parse_args(argumentos)
+
+    invalidos = [nome for nome in args.cenarios if nome not in CENARIOS]
+    if invalidos:
+        parser.error(f"cenário desconhecido: {', '.join(invalidos)}")
+
+    resultados = {}
+    for nome in args.cenarios or CENARIOS:
+        executar, mostrar = CENARIOS[nome]
+        print(f"== {nome}")
+        resultados[nome] = executar(**ESCALAS[args.escala].get(nome, {}))
+        mostrar(resultados[nome])
+        print()
+
+    if args.json:
+        documento = {
+            'python': platform.python_version(),
+            'plataforma': platform.platform(),
+            'escala': args.escala,
+            'data': datetime.now().isoformat(timespec='seconds'),
+            'cenarios': resultados,
+        }
+        with open(args.json, 'w', encoding='utf-8') as arquivo:
+            json.dump(documento, arquivo, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as arquivo:
+            baseline = json.load(arquivo)['cenarios']
+
+        regressoes = comparar_baseline(resultados, baseline, args.tolerancia)
+        for r in regressoes:
+            chave = ', '.join(f"{campo}={valor}" for campo, valor in r['chave'].items())
+            print(f"REGRESSAO {r['cenario']} [{chave}] {r['metrica']}: "
+                  f"{r['baseline']:.3f} -> {r['atual']:.3f} ({r['variacao']:+.0%})")
+        if regressoes:
+            raise SystemExit(1)
+        print(f"Sem regressões em relação a {args.baseline} (tolerância {args.tolerancia:.0%})")
+
+
+if __name__ == "__main__":
+    main()
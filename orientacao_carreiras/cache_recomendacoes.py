@@ -0,0 +1,140 @@
+# Cache LRU com validade (TTL) para resultados de recomendação.
+#
+# Perfis com as mesmas competências e níveis recebem as mesmas recomendações,
+# então o resultado é guardado pela assinatura das competências do perfil.
+
+import time
+from collections import OrderedDict
+
+# Tamanho padrão do cache (número de resultados guardados)
+TAMANHO_CACHE_PADRAO = 1024
+
+
+def assinatura_competencias(competencias):
+    """
+    Gera a assinatura canônica de um conjunto de competências.
+
+    A assinatura não depende da ordem de inserção: dois perfis com as mesmas
+    competências e níveis têm a mesma assinatura.
+
+    Args:
+        competencias (dict): Dicionário {nome_competencia: nivel}
+
+    Returns:
+        tuple: Pares (competencia, nivel) ordenados pelo nome
+    """
+    return tuple(sorted(competencias.items()))
+
+
+class CacheLRU:
+    """
+    Cache de tamanho limitado que descarta o item usado há mais tempo.
+
+    Opcionalmente, cada item vale por `validade` segundos após ser guardado.
+
+    Atributos:
+        tamanho_maximo (int): Número máximo de itens guardados
+        validade (float): Segundos de validade de cada item (None = sem limite)
+        acertos (int): Consultas atendidas pelo cache
+        falhas (int): Consultas sem item válido
+        remocoes (int): Itens descartados por falta de espaço
+        expiracoes (int): Itens descartados por validade vencida
+    """
+
+    def __init__(self, tamanho_maximo=TAMANHO_CACHE_PADRAO, validade=None, relogio=time.monotonic):
+        """
+        Cria o cache vazio.
+
+        Args:
+            tamanho_maximo (int): Número máximo de itens (pelo menos 1)
+            validade (float): Segundos de validade de cada item (None = sem limite)
+            relogio (callable): Função que retorna o tempo atual em segundos
+        """
+        if tamanho_maximo < 1:
+            raise ValueError("Tamanho do cache deve ser pelo menos 1")
+        if validade is not None and validade <= 0:
+            raise ValueError("Validade do cache deve ser positiva")
+
+        self.tamanho_maximo = tamanho_maximo
+        self.validade = validade
+        self._relogio = relogio
+        self._itens = OrderedDict()  # chave -> (valor, instante de expiração)
+
+        self.acertos = 0
+        self.falhas = 0
+        self.remocoes = 0
+        self.expiracoes = 0
+
+    def obter(self, chave, padrao=None):
+        """
+        Retorna o valor guardado para a chave, marcando-o como usado.
+
+        Args:
+            chave: Chave consultada
+            padrao: Valor retornado se não houver item válido
+
+        Returns:
+            Valor guardado ou `padrao`
+        """
+        item = self._itens.get(chave)
+        if item is None:
+            self.falhas += 1
+            return padrao
+
+        valor, expira = item
+        if expira is not None and self._relogio() >= expira:
+            del self._itens[chave]
+            self.expiracoes += 1
+            self.falhas += 1
+            return padrao
+
+        self._itens.move_to_end(chave)
+        self.acertos += 1
+        return valor
+
+    def guardar(self, chave, valor):
+        """
+        Guarda um valor, descartando o item usado há mais tempo se necessário.
+
+        Args:
+            chave: Chave do item
+            valor: Valor a guardar
+        """
+        expira = self._relogio() + self.validade if self.validade is not None else None
+        self._itens[chave] = (valor, expira)
+        self._itens.move_to_end(chave)
+
+        while len(self._itens) > self.tamanho_maximo:
+            self._itens.popitem(last=False)
+            self.remocoes += 1
+
+    def limpar(self):
+        """Descarta todos os itens (os contadores são mantidos)."""
+        self._itens.clear()
+
+    def estatisticas(self):
+        """
+        Retorna os contadores do cache.
+
+        Returns:
+            dict: {itens, tamanho_maximo, acertos, falhas, remocoes, expiracoes, taxa_acertos}
+        """
+        consultas = self.acertos + self.falhas
+        return {
+            'itens': len(self._itens),
+            'tamanho_maximo': self.tamanho_maximo,
+            'acertos': self.acertos,
+            'falhas': self.falhas,
+            'remocoes': self.remocoes,
+            'expiracoes': self.expiracoes,
+            'taxa_acertos': self.acertos / consultas if consultas else 0.0,
+        }
+
+    def __len__(self):
+        return len(self._itens)
+
+    def __contains__(self, chave):
+        return chave in self._itens
+
+    def __repr__(self):
+        return f"CacheLRU(itens={len(self._itens)}, tamanho_maximo={self.tamanho_maximo})"
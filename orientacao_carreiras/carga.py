@@ -0,0 +1,135 @@
+# Gerador de carga para o serviço HTTP de recomendações.
+#
+# Abre várias conexões keep-alive em paralelo, envia perfis aleatórios e
+# mede vazão e latências (p50, p95, p99).
+#
+# Uso: python -m orientacao_carreiras.carga --url http://127.0.0.1:8000/recomendacoes
+#          --concorrencia 50 --requisicoes 5000
+
+import argparse
+import asyncio
+import json
+import random
+import time
+from urllib.parse import urlsplit
+
+from .dados_mock import obter_competencias_base
+
+
+def percentil(valores, p):
+    """
+    Retorna o percentil p (0-100) de uma lista de valores.
+
+    Args:
+        valores (list): Valores medidos
+        p (float): Percentil desejado
+
+    Returns:
+        float: Valor do percentil (0 se a lista estiver vazia)
+    """
+    if not valores:
+        return 0
+    ordenados = sorted(valores)
+    posicao = min(len(ordenados) - 1, max(0, round(p / 100 * len(ordenados)) - 1))
+    return ordenados[posicao]
+
+
+def _corpo_aleatorio(gerador, competencias, i):
+    # Monta o JSON de um perfil com 2 a 6 competências aleatórias.
+    escolhidas = gerador.sample(competencias, gerador.randint(2, min(6, len(competencias))))
+    perfil = {
+        'nome': f"Usuario {chr(65 + i % 26)}",
+        'idade': gerador.randint(18, 65),
+        'competencias': {nome: gerador.randint(1, 5) for nome in escolhidas},
+    }
+    return json.dumps({'perfil': perfil}).encode('utf-8')
+
+
+async def _cliente(host, porta, caminho, corpos, latencias, erros):
+    # Envia os corpos em sequência por uma conexão keep-alive.
+    leitor, escritor = await asyncio.open_connection(host, porta)
+    try:
+        for corpo in corpos:
+            inicio = time.perf_counter()
+            escritor.write(
+                f"POST {caminho} HTTP/1.1\r\nHost: {host}\r\n"
+                f"Content-Type: application/json\r\nContent-Length: {len(corpo)}\r\n\r\n"
+                .encode('latin-1') + corpo
+            )
+            await escritor.drain()
+
+            status = int((await leitor.readline()).split()[1])
+            tamanho = 0
+            while True:
+                linha = await leitor.readline()
+                if linha in (b'\r\n', b''):
+                    break
+                nome, _, valor = linha.decode('latin-1').partition(':')
+                if nome.strip().lower() == 'content-length':
+                    tamanho = int(valor)
+            await leitor.readexactly(tamanho)
+
+            latencias.append(time.perf_counter() - inicio)
+            if status != 200:
+                erros.append(status)
+    finally:
+        escritor.close()
+
+
+async def gerar_carga(url, concorrencia=50, requisicoes=5000, semente=42):
+    """
+    Executa o teste de carga.
+
+    Args:
+        url (str): URL da rota (ex.: http://127.0.0.1:8000/recomendacoes)
+        concorrencia (int): Conexões simultâneas
+        requisicoes (int): Total de requisições
+        semente (int): Semente dos perfis aleatórios
+
+    Returns:
+        dict: {requisicoes, erros, segundos, req_por_segundo, p50_ms, p95_ms, p99_ms}
+    """
+    partes = urlsplit(url)
+    gerador = random.Random(semente)
+    competencias = list(obter_competencias_base())
+    corpos = [_corpo_aleatorio(gerador, competencias, i) for i in range(requisicoes)]
+
+    latencias = []
+    erros = []
+    inicio = time.perf_counter()
+    await asyncio.gather(*(
+        _cliente(partes.hostname, partes.port or 80, partes.path or '/',
+                 corpos[i::concorrencia], latencias, erros)
+        for i in range(concorrencia)
+    ))
+    segundos = time.perf_counter() - inicio
+
+    return {
+        'requisicoes': len(latencias),
+        'erros': len(erros),
+        'segundos': segundos,
+        'req_por_segundo': len(latencias) / segundos if segundos else 0,
+        'p50_ms': percentil(latencias, 50) * 1000,
+        'p95_ms': percentil(latencias, 95) * 1000,
+        'p99_ms': percentil(latencias, 99) * 1000,
+    }
+
+
+def main(argumentos=None):
+    # Executa o gerador de carga e mostra o resumo.
+    parser = argparse.ArgumentParser(description="Gerador de carga do serviço de recomendações")
+    parser.add_argument('--url', default='http://127.0.0.1:8000/recomendacoes')
+    parser.add_argument('--concorrencia', type=int, default=50)
+    parser.add_argument('--requisicoes', type=int, default=5000)
+    args = parser.parse_args(argumentos)
+
+    resultado = asyncio.run(gerar_carga(args.url, args.concorrencia, args.requisicoes))
+
+    print(f"Requisicoes: {resultado['requisicoes']} (erros: {resultado['erros']})")
+    print(f"Vazao: {resultado['req_por_segundo']:.0f} req/s em {resultado['segundos']:.2f}s")
+    print(f"Latencia: p50 {resultado['p50_ms']:.1f} ms | p95 {resultado['p95_ms']:.1f} ms"
+          f" | p99 {resultado['p99_ms']:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,14 @@
 # Classe Carreira = uma carreira profissional do futuro.
 
+from collections import namedtuple
+
+# Forma compilada (imutável) dos requisitos de uma carreira:
+#   competencias (tuple): nomes das competências, na ordem essenciais/importantes/desejáveis
+#   pesos (tuple): peso de cada competência (3, 2 ou 1)
+#   pontos_maximos (int): soma de 5 * peso, pontuação de um perfil com nível máximo em tudo
+RequisitosCompilados = namedtuple('RequisitosCompilados',
+                                  ['competencias', 'pesos', 'pontos_maximos'])
+
 class Carreira:
     """
     Representa uma carreira profissional.
@@ -14,6 +23,13 @@ class Carreira:
         salario_medio (float): Salário médio estimado
     """
     
+    # Sem __dict__ por instância (catálogos com dezenas de milhares de carreiras)
+    __slots__ = ('nome', 'descricao', 'crescimento_projetado', 'salario_medio',
+                 'requisitos', '_observadores', '_compilada')
+    
+    # Tupla com (categoria, peso) dos requisitos, da maior para a menor importância
+    PESOS_REQUISITOS = (('essenciais', 3), ('importantes', 2), ('desejaveis', 1))
+    
     def __init__(self, nome, descricao="", crescimento_projetado=0, salario_medio=0.0):
         """
         Inicializa uma carreira.
@@ -35,21 +51,72 @@ class Carreira:
             'importantes': [],     # Lista de competências importantes  
             'desejaveis': []       # Lista de competências desejáveis
         }
+        
+        # Funções avisadas quando um requisito é adicionado (ex.: índices de busca)
+        self._observadores = []
+        
+        # Cache de compilar(), descartado a cada alteração dos requisitos
+        self._compilada = None
+    
+    def _adicionar_requisito(self, categoria, competencia):
+        # Adiciona o requisito na categoria e avisa os observadores.
+        if competencia not in self.requisitos[categoria]:
+            self.requisitos[categoria].append(competencia)
+            self._compilada = None
+            for observador in list(self._observadores):
+                observador(self, categoria, competencia)
     
     def adicionar_competencia_essencial(self, competencia):
         """Adiciona uma competência essencial."""
-        if competencia not in self.requisitos['essenciais']:
-            self.requisitos['essenciais'].append(competencia)
+        self._adicionar_requisito('essenciais', competencia)
     
     def adicionar_competencia_importante(self, competencia):
         """Adiciona uma competência importante."""
-        if competencia not in self.requisitos['importantes']:
-            self.requisitos['importantes'].append(competencia)
+        self._adicionar_requisito('importantes', competencia)
     
     def adicionar_competencia_desejavel(self, competencia):
         """Adiciona uma competência desejável."""
-        if competencia not in self.requisitos['desejaveis']:
-            self.requisitos['desejaveis'].append(competencia)
+        self._adicionar_requisito('desejaveis', competencia)
+    
+    def compilar(self):
+        """
+        Retorna os requisitos compilados, montando-os na primeira chamada.
+        
+        Returns:
+            RequisitosCompilados: Competências, pesos e pontuação máxima
+        """
+        if self._compilada is None:
+            competencias = []
+            pesos = []
+            for categoria, peso in self.PESOS_REQUISITOS:
+                for competencia in self.requisitos[categoria]:
+                    competencias.append(competencia)
+                    pesos.append(peso)
+            
+            self._compilada = RequisitosCompilados(
+                tuple(competencias), tuple(pesos), 5 * sum(pesos)
+            )
+        
+        return self._compilada
+    
+    def descartar_compilacao(self):
+        """Descarta a forma compilada (usar após alterar self.requisitos diretamente)."""
+        self._compilada = None
+    
+    def registrar_observador(self, observador):
+        """
+        Registra uma função chamada a cada requisito adicionado.
+        
+        Args:
+            observador (callable): Recebe (carreira, categoria, competencia)
+        """
+        if observador not in self._observadores:
+            self._observadores.append(observador)
+    
+    def remover_observador(self, observador):
+        """Remove uma função registrada com registrar_observador."""
+        if observador in self._observadores:
+            self._observadores.remove(observador)
     
     def obter_todas_competencias(self):
         """Retorna lista com todas as competências necessárias."""
@@ -96,12 +163,46 @@ class Carreira:
         return f"Carreira(nome='{self.nome}', crescimento={self.crescimento_projetado}%)"
     
     def to_dict(self):
-        """Converte a carreira para dicionário."""
+        """Converte a carreira para dicionário (com cópias das listas de requisitos)."""
         return {
             'nome': self.nome,
             'descricao': self.descricao,
             'crescimento_projetado': self.crescimento_projetado,
             'salario_medio': self.salario_medio,
-            'requisitos': self.requisitos,
+            'requisitos': {categoria: list(competencias)
+                           for categoria, competencias in self.requisitos.items()},
             'atratividade': self.nivel_atratividade()
-        }
\ No newline at end of file
+        }
+    
+    @classmethod
+    def from_dict(cls, dados):
+        """
+        Cria uma carreira a partir de um dicionário de to_dict.
+        
+        Args:
+            dados (dict): Dicionário com nome, descricao, crescimento_projetado,
+                salario_medio e requisitos ({categoria: [competencias]})
+        
+        Returns:
+            Carreira: Carreira reconstruída ('atratividade' é recalculada)
+        """
+        carreira = cls(dados['nome'], dados.get('descricao', ''),
+                       dados.get('crescimento_projetado', 0), dados.get('salario_medio', 0.0))
+        requisitos = dados.get('requisitos', {})
+        for categoria, _ in cls.PESOS_REQUISITOS:
+            for competencia in requisitos.get(categoria, ()):
+                carreira._adicionar_requisito(categoria, competencia)
+        return carreira
+    
+    def to_bytes(self):
+        """Codifica a carreira no formato binário de serializacao."""
+        from .serializacao import codificar
+        
+        return codificar(self)
+    
+    @classmethod
+    def from_bytes(cls, dados):
+        """Cria uma carreira a partir do resultado de to_bytes."""
+        from .serializacao import decodificar_carreira
+        
+        return decodificar_carreira(dados, cls)
\ No newline at end of file
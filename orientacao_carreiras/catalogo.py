@@ -0,0 +1,745 @@
+# Carga de catálogos de carreiras e competências de arquivos, com snapshot compilado.
+#
+# O catálogo é lido de JSON, JSONL ou CSV e validado uma única vez; em seguida
+# é gravado em um diretório de snapshot que outros processos abrem via mmap
+# sem reler nem revalidar os arquivos de origem:
+#   meta.json                -> versão, hash da origem, vocabulário e competências
+#   linhas_inicios.bin       -> início da linha de cada competência (CSR, uint32)
+#   linhas_carreiras.bin     -> índice da carreira de cada célula (uint32)
+#   linhas_pesos.bin         -> peso de cada célula (uint32)
+#   maximos.bin              -> pontuação máxima de cada carreira (uint32)
+#   requisitos_inicios.bin   -> início dos requisitos de cada carreira (uint32)
+#   requisitos.bin           -> id de cada requisito, na ordem de compilar() (uint32)
+#   requisitos_pesos.bin     -> peso de cada requisito (3, 2 ou 1; uint8)
+#   crescimentos.bin         -> crescimento projetado de cada carreira (int64)
+#   salarios.bin             -> salário médio de cada carreira (float64)
+#   offsets.bin              -> 2 offsets por carreira em textos.bin: nome, descrição, fim
+#   textos.bin               -> nomes e descrições em UTF-8
+#
+# As linhas CSR são as mesmas de processamento_paralelo, então o snapshot
+# recomenda direto sobre os arquivos mapeados. O hash SHA-256 do conteúdo dos
+# arquivos de origem fica em meta.json; abrir_catalogo recompila o snapshot
+# quando a origem muda.
+#
+# Um snapshot nunca é reescrito no lugar: o novo é gravado em um diretório
+# temporário ao lado e trocado com o antigo por os.replace. Processos que
+# ainda mapeiam os arquivos antigos continuam lendo os dados antigos.
+#
+# Formatos de entrada:
+#   Carreiras JSON/JSONL: {"nome": "...", "descricao": "...", "crescimento_projetado": 40,
+#       "salario_medio": 9000.0, "requisitos": {"essenciais": ["programacao"], ...}}
+#       (o JSON é uma lista desses objetos; o JSONL, um por linha)
+#   Carreiras CSV: colunas nome, descricao, crescimento_projetado, salario_medio,
+#       essenciais, importantes, desejaveis, com competências separadas por ";"
+#   Competências JSON/JSONL/CSV: nome, categoria, descricao, nivel_demanda_futuro
+
+import argparse
+import csv
+import gc
+import hashlib
+import json
+import mmap
+import os
+import shutil
+import tempfile
+from array import array
+from collections import namedtuple
+from contextlib import contextmanager
+
+from .carreira import Carreira
+from .competencia import Competencia
+from .matriz_pesos import MatrizPesos, selecionar_esparso
+from .vocabulario import VocabularioCompetencias
+
+VERSAO_FORMATO = 1
+
+# Erros listados na mensagem de carregar_catalogo
+MAXIMO_ERROS_EXIBIDOS = 10
+
+# Nome, arquivo e typecode de cada vetor do snapshot
+ARQUIVOS = {
+    'inicios': ('linhas_inicios.bin', 'I'),
+    'indices': ('linhas_carreiras.bin', 'I'),
+    'pesos': ('linhas_pesos.bin', 'I'),
+    'maximos': ('maximos.bin', 'I'),
+    'requisitos_inicios': ('requisitos_inicios.bin', 'I'),
+    'requisitos': ('requisitos.bin', 'I'),
+    'requisitos_pesos': ('requisitos_pesos.bin', 'B'),
+    'crescimentos': ('crescimentos.bin', 'q'),
+    'salarios': ('salarios.bin', 'd'),
+    'offsets': ('offsets.bin', 'Q'),
+    'textos': ('textos.bin', None),
+}
+
+# Todos os arquivos de um diretório de snapshot
+NOMES_SNAPSHOT = {nome for nome, _ in ARQUIVOS.values()} | {'meta.json'}
+
+# Categoria de requisito de cada peso
+CATEGORIAS_PESO = {peso: categoria for categoria, peso in Carreira.PESOS_REQUISITOS}
+
+# Catálogo validado por carregar_catalogo
+CatalogoCarreiras = namedtuple('CatalogoCarreiras', ['carreiras', 'competencias'])
+
+
+def _formato(caminho):
+    # Formato do arquivo pela extensão.
+    extensao = os.path.splitext(caminho)[1].lower().lstrip('.')
+    if extensao not in ('json', 'jsonl', 'csv'):
+        raise ValueError(f"Formato de catálogo não suportado: {caminho}")
+    return extensao
+
+
+def _ler_json(caminho, formato):
+    # Gera (numero, registro) de um JSON (lista de objetos) ou JSONL.
+    with open(caminho, encoding='utf-8') as arquivo:
+        if formato == 'json':
+            try:
+                registros = json.load(arquivo)
+            except json.JSONDecodeError as erro:
+                yield erro.lineno, {'_erro': f"JSON inválido: {erro.msg}"}
+                return
+            if not isinstance(registros, list):
+                yield 1, {'_erro': "O arquivo JSON deve conter uma lista de objetos"}
+                return
+            linhas = enumerate(registros, 1)
+        else:
+            linhas = ((numero, linha) for numero, linha in enumerate(arquivo, 1) if linha.strip())
+
+        for numero, registro in linhas:
+            if formato == 'jsonl':
+                try:
+                    registro = json.loads(registro)
+                except json.JSONDecodeError as erro:
+                    registro = {'_erro': f"JSON inválido: {erro.msg}"}
+            if not isinstance(registro, dict):
+                registro = {'_erro': "Cada carreira ou competência deve ser um objeto JSON"}
+            yield numero, registro
+
+
+def ler_carreiras(caminho):
+    """
+    Lê os registros de carreiras de um arquivo .json, .jsonl ou .csv.
+
+    Args:
+        caminho (str): Arquivo do catálogo de carreiras
+
+    Yields:
+        tuple: (numero, registro), onde numero é a linha (ou a posição na lista JSON)
+    """
+    formato = _formato(caminho)
+    if formato != 'csv':
+        yield from _ler_json(caminho, formato)
+        return
+
+    with open(caminho, encoding='utf-8', newline='') as arquivo:
+        for numero, linha in enumerate(csv.DictReader(arquivo), 2):
+            registro = {
+                'nome': linha.get('nome'),
+                'descricao': linha.get('descricao') or '',
+                'requisitos': {
+                    categoria: [nome.strip() for nome in (linha.get(categoria) or '').split(';')
+                                if nome.strip()]
+                    for categoria, _ in Carreira.PESOS_REQUISITOS
+                },
+            }
+            try:
+                registro['crescimento_projetado'] = int(linha.get('crescimento_projetado') or 0)
+                registro['salario_medio'] = float(linha.get('salario_medio') or 0)
+            except ValueError:
+                registro = {'_erro': "Valores numéricos inválidos"}
+            yield numero, registro
+
+
+def ler_competencias(caminho):
+    """
+    Lê os registros de competências de um arquivo .json, .jsonl ou .csv.
+
+    Args:
+        caminho (str): Arquivo do catálogo de competências
+
+    Yields:
+        tuple: (numero, registro)
+    """
+    formato = _formato(caminho)
+    if formato != 'csv':
+        yield from _ler_json(caminho, formato)
+        return
+
+    with open(caminho, encoding='utf-8', newline='') as arquivo:
+        for numero, linha in enumerate(csv.DictReader(arquivo), 2):
+            registro = dict(linha)
+            try:
+                registro['nivel_demanda_futuro'] = int(linha.get('nivel_demanda_futuro') or 3)
+            except ValueError:
+                registro = {'_erro': "Nível de demanda futura inválido"}
+            yield numero, registro
+
+
+def validar_competencia(registro):
+    """
+    Valida um registro e cria a Competencia correspondente.
+
+    Args:
+        registro (dict): Registro lido do catálogo
+
+    Returns:
+        tuple: (competencia ou None, lista de mensagens de erro)
+    """
+    if '_erro' in registro:
+        return None, [registro['_erro']]
+
+    nome = registro.get('nome')
+    if not isinstance(nome, str) or not nome.strip():
+        return None, ["Nome da competência não pode ser vazio"]
+
+    try:
+        return Competencia.from_dict({**registro, 'nome': nome.strip()}), []
+    except (KeyError, ValueError) as erro:
+        return None, [f"{nome}: {erro}"]
+
+
+def validar_carreira(registro, competencias=None):
+    """
+    Valida um registro e cria a Carreira correspondente.
+
+    Args:
+        registro (dict): Registro lido do catálogo
+        competencias (dict): Catálogo de competências; se informado, todos os
+            requisitos precisam estar nele
+
+    Returns:
+        tuple: (carreira ou None, lista de mensagens de erro)
+    """
+    if '_erro' in registro:
+        return None, [registro['_erro']]
+
+    erros = []
+    nome = registro.get('nome')
+    descricao = registro.get('descricao') or ''
+    crescimento = registro.get('crescimento_projetado', 0)
+    salario = registro.get('salario_medio', 0.0)
+
+    if not isinstance(nome, str) or not nome.strip():
+        erros.append("Nome da carreira não pode ser vazio")
+    if not isinstance(descricao, str):
+        erros.append("Descrição deve ser um texto")
+    if isinstance(crescimento, bool) or not isinstance(crescimento, int):
+        erros.append("Crescimento projetado deve ser um número inteiro")
+    if isinstance(salario, bool) or not isinstance(salario, (int, float)) or salario < 0:
+        erros.append("Salário médio deve ser um número não negativo")
+
+    requisitos = registro.get('requisitos') or {}
+    if not isinstance(requisitos, dict):
+        erros.append("Requisitos devem ser um objeto {categoria: [competencias]}")
+        requisitos = {}
+
+    for categoria, nomes in requisitos.items():
+        if categoria not in CATEGORIAS_PESO.values():
+            erros.append(f"Categoria de requisito inválida: {categoria}")
+        elif (not isinstance(nomes, list)
+              or not all(isinstance(competencia, str) and competencia for competencia in nomes)):
+            erros.append(f"Requisitos '{categoria}' devem ser uma lista de nomes")
+        elif competencias is not None:
+            desconhecidas = [competencia for competencia in nomes if competencia not in competencias]
+            if desconhecidas:
+                erros.append(f"Competências fora do catálogo em '{categoria}': "
+                             f"{', '.join(desconhecidas)}")
+
+    if erros:
+        return None, erros
+
+    carreira = Carreira(nome.strip(), descricao, crescimento, float(salario))
+    for categoria, _ in Carreira.PESOS_REQUISITOS:
+        for competencia in requisitos.get(categoria, ()):
+            carreira._adicionar_requisito(categoria, competencia)
+
+    return carreira, []
+
+
+def _mensagem_erros(caminho, erros):
+    # Resume os erros de validação de um arquivo em uma mensagem.
+    linhas = [f"  linha {numero}: {mensagem}" for numero, mensagem in erros[:MAXIMO_ERROS_EXIBIDOS]]
+    if len(erros) > MAXIMO_ERROS_EXIBIDOS:
+        linhas.append(f"  ... e mais {len(erros) - MAXIMO_ERROS_EXIBIDOS} erros")
+    return f"Catálogo inválido em {caminho}:\n" + '\n'.join(linhas)
+
+
+def carregar_catalogo(caminho_carreiras, caminho_competencias=None):
+    """
+    Lê e valida um catálogo de carreiras (e, opcionalmente, de competências).
+
+    Args:
+        caminho_carreiras (str): Arquivo de carreiras (.json, .jsonl ou .csv)
+        caminho_competencias (str): Arquivo de competências (opcional)
+
+    Returns:
+        CatalogoCarreiras: Carreiras (na ordem do arquivo) e {nome: Competencia}
+
+    Raises:
+        ValueError: Se algum registro for inválido (a mensagem lista os erros)
+    """
+    competencias = None
+    if caminho_competencias is not None:
+        competencias = {}
+        erros = []
+        for numero, registro in ler_competencias(caminho_competencias):
+            competencia, mensagens = validar_competencia(registro)
+            if competencia is not None and competencia.nome in competencias:
+                mensagens = [f"Competência duplicada: {competencia.nome}"]
+            if mensagens:
+                erros.extend((numero, mensagem) for mensagem in mensagens)
+            else:
+                competencias[competencia.nome] = competencia
+        if erros:
+            raise ValueError(_mensagem_erros(caminho_competencias, erros))
+
+    carreiras = []
+    nomes = set()
+    erros = []
+    for numero, registro in ler_carreiras(caminho_carreiras):
+        carreira, mensagens = validar_carreira(registro, competencias)
+        if carreira is not None and carreira.nome in nomes:
+            mensagens = [f"Carreira duplicada: {carreira.nome}"]
+        if mensagens:
+            erros.extend((numero, mensagem) for mensagem in mensagens)
+        else:
+            nomes.add(carreira.nome)
+            carreiras.append(carreira)
+    if erros:
+        raise ValueError(_mensagem_erros(caminho_carreiras, erros))
+
+    return CatalogoCarreiras(carreiras, competencias or {})
+
+
+def hash_conteudo(*caminhos):
+    """
+    Calcula o hash SHA-256 do conteúdo dos arquivos (e da versão do formato).
+
+    Args:
+        *caminhos (str): Arquivos de origem do catálogo (None é ignorado)
+
+    Returns:
+        str: Hash em hexadecimal
+    """
+    resumo = hashlib.sha256(f"catalogo-v{VERSAO_FORMATO}".encode())
+    for caminho in caminhos:
+        if caminho is None:
+            continue
+        resumo.update(b'\0')
+        with open(caminho, 'rb') as arquivo:
+            for bloco in iter(lambda: arquivo.read(1 << 20), b''):
+                resumo.update(bloco)
+    return resumo.hexdigest()
+
+
+def gravar_snapshot(diretorio, carreiras, competencias=None, hash_origem=''):
+    """
+    Compila um catálogo e o grava como snapshot (substitui um existente).
+
+    O snapshot é gravado em um diretório temporário e só então colocado no
+    lugar do antigo; os arquivos antigos não são alterados.
+
+    Args:
+        diretorio (str): Diretório do snapshot
+        carreiras (list): Carreiras validadas
+        competencias (dict): {nome: Competencia} (opcional)
+        hash_origem (str): Hash dos arquivos de origem (ver hash_conteudo)
+
+    Returns:
+        CatalogoCompilado: Snapshot aberto para leitura
+
+    Raises:
+        ValueError: Se o diretório existir e tiver arquivos que não são do snapshot
+    """
+    if os.path.isdir(diretorio):
+        estranhos = set(os.listdir(diretorio)) - NOMES_SNAPSHOT
+        if estranhos:
+            raise ValueError(f"{diretorio} não é um diretório de snapshot "
+                             f"(contém {', '.join(sorted(estranhos))})")
+
+    pai = os.path.dirname(os.path.abspath(diretorio))
+    os.makedirs(pai, exist_ok=True)
+    temporario = tempfile.mkdtemp(prefix=f".{os.path.basename(diretorio)}.", dir=pai)
+    try:
+        os.chmod(temporario, 0o755)
+        _gravar_arquivos(temporario, carreiras, competencias, hash_origem)
+        _substituir_diretorio(temporario, diretorio)
+    finally:
+        if os.path.exists(temporario):
+            shutil.rmtree(temporario, ignore_errors=True)
+
+    return CatalogoCompilado(diretorio)
+
+
+def _substituir_diretorio(novo, diretorio):
+    # Coloca o diretório novo no lugar do existente (se houver) e apaga o antigo.
+    antigo = novo + '.antigo'
+    try:
+        os.replace(diretorio, antigo)
+    except FileNotFoundError:
+        antigo = None
+    try:
+        os.replace(novo, diretorio)
+    except OSError:
+        # Outro processo colocou o seu snapshot no lugar primeiro: mantém o dele
+        if not os.path.isdir(diretorio):
+            raise
+    if antigo is not None:
+        shutil.rmtree(antigo, ignore_errors=True)
+
+
+def _gravar_arquivos(diretorio, carreiras, competencias, hash_origem):
+    # Compila as carreiras e grava os vetores e meta.json em um diretório vazio.
+    vocabulario = VocabularioCompetencias()
+    matriz = MatrizPesos(carreiras, vocabulario)
+    matriz.desconectar()
+    vetores = matriz.para_csr()
+
+    requisitos_inicios = array('I', [0])
+    requisitos = array('I')
+    requisitos_pesos = array('B')
+    offsets = array('Q', [0])
+    textos = []
+    for carreira in carreiras:
+        compilados = carreira.compilar()
+        requisitos.extend(map(vocabulario.buscar_id, compilados.competencias))
+        requisitos_pesos.extend(compilados.pesos)
+        requisitos_inicios.append(len(requisitos))
+        for texto in (carreira.nome, carreira.descricao or ''):
+            dados = texto.encode('utf-8')
+            textos.append(dados)
+            offsets.append(offsets[-1] + len(dados))
+
+    vetores.update({
+        'requisitos_inicios': requisitos_inicios,
+        'requisitos': requisitos,
+        'requisitos_pesos': requisitos_pesos,
+        'crescimentos': array('q', (carreira.crescimento_projetado for carreira in carreiras)),
+        'salarios': array('d', (carreira.salario_medio for carreira in carreiras)),
+        'offsets': offsets,
+    })
+
+    for chave, (nome, _) in ARQUIVOS.items():
+        with open(os.path.join(diretorio, nome), 'wb') as arquivo:
+            if chave == 'textos':
+                arquivo.write(b''.join(textos))
+            else:
+                arquivo.write(vetores[chave].tobytes())
+
+    meta = {
+        'versao': VERSAO_FORMATO,
+        'hash': hash_origem,
+        'total': len(carreiras),
+        'vocabulario': vocabulario.nomes,
+        'competencias': [competencia.to_dict() for competencia in (competencias or {}).values()],
+    }
+    with open(os.path.join(diretorio, 'meta.json'), 'w', encoding='utf-8') as arquivo:
+        json.dump(meta, arquivo, ensure_ascii=False)
+
+
+@contextmanager
+def _coletor_pausado():
+    # Pausa o coletor de ciclos durante alocações em massa: sem isso, criar
+    # dezenas de milhares de carreiras dispara varreduras completas repetidas.
+    ativo = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if ativo:
+            gc.enable()
+
+
+class CatalogoCompilado:
+    """
+    Snapshot de um catálogo de carreiras lido via mmap.
+
+    Abrir o snapshot só lê meta.json e mapeia os vetores; as recomendações de
+    recomendar() são calculadas direto sobre as linhas CSR mapeadas e as
+    carreiras são materializadas sob demanda. criar_sistema() monta um
+    SistemaRecomendacao completo sem recompilar as carreiras.
+
+    Atributos:
+        diretorio (str): Diretório do snapshot
+        hash (str): Hash dos arquivos de origem na compilação
+        vocabulario (VocabularioCompetencias): Competências exigidas, na ordem das linhas
+    """
+
+    def __init__(self, diretorio):
+        """
+        Abre um snapshot gravado por gravar_snapshot.
+
+        Args:
+            diretorio (str): Diretório do snapshot
+        """
+        self.diretorio = diretorio
+
+        with open(os.path.join(diretorio, 'meta.json'), encoding='utf-8') as arquivo:
+            meta = json.load(arquivo)
+        if meta['versao'] != VERSAO_FORMATO:
+            raise ValueError(f"Versão de snapshot não suportada: {meta['versao']}")
+
+        self.hash = meta['hash']
+        self.vocabulario = VocabularioCompetencias(meta['vocabulario'])
+        self._total = meta['total']
+        self._competencias = meta['competencias']
+        self._carreiras = {}   # Carreiras já materializadas, por índice
+
+        self._mapas = {}
+        self._vetores = {}
+        for chave, (nome, tipo) in ARQUIVOS.items():
+            with open(os.path.join(diretorio, nome), 'rb') as arquivo:
+                if os.fstat(arquivo.fileno()).st_size:
+                    self._mapas[chave] = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+                else:
+                    self._mapas[chave] = b''
+            if tipo is not None:
+                self._vetores[chave] = memoryview(self._mapas[chave]).cast(tipo)
+
+    def desatualizado(self, caminho_carreiras, caminho_competencias=None):
+        """
+        Verifica se os arquivos de origem mudaram desde a compilação.
+
+        Args:
+            caminho_carreiras (str): Arquivo de carreiras
+            caminho_competencias (str): Arquivo de competências (opcional)
+
+        Returns:
+            bool: True se o hash do conteúdo atual for diferente do snapshot
+        """
+        return hash_conteudo(caminho_carreiras, caminho_competencias) != self.hash
+
+    def _obter_texto(self, posicao, campo):
+        # Decodifica o campo (0 nome, 1 descrição) de uma carreira.
+        base = posicao * 2 + campo
+        offsets = self._vetores['offsets']
+        return str(self._mapas['textos'][offsets[base]:offsets[base + 1]], 'utf-8')
+
+    def obter_nome(self, indice):
+        """Retorna o nome da carreira no índice informado, sem materializá-la."""
+        return self._obter_texto(indice, 0)
+
+    def obter_carreira(self, indice):
+        """
+        Retorna a Carreira de um índice do catálogo, materializando-a na primeira vez.
+
+        Args:
+            indice (int): Índice da carreira
+
+        Returns:
+            Carreira: Carreira com os mesmos dados e requisitos da origem
+        """
+        carreira = self._carreiras.get(indice)
+        if carreira is not None:
+            return carreira
+
+        if not 0 <= indice < self._total:
+            raise IndexError(f"Carreira fora do catálogo: {indice}")
+
+        vetores = self._vetores
+        carreira = Carreira(self._obter_texto(indice, 0), self._obter_texto(indice, 1),
+                            vetores['crescimentos'][indice], vetores['salarios'][indice])
+
+        nomes = self.vocabulario.nomes
+        inicio, fim = vetores['requisitos_inicios'][indice], vetores['requisitos_inicios'][indice + 1]
+        for id_competencia, peso in zip(vetores['requisitos'][inicio:fim],
+                                        vetores['requisitos_pesos'][inicio:fim]):
+            carreira.requisitos[CATEGORIAS_PESO[peso]].append(nomes[id_competencia])
+
+        self._carreiras[indice] = carreira
+        return carreira
+
+    def _materializar_todas(self):
+        # Materialização em bloco: converte cada vetor para lista uma vez só.
+        vetores = self._vetores
+        textos = self._mapas['textos']
+        offsets = vetores['offsets'].tolist()
+        inicios = vetores['requisitos_inicios'].tolist()
+        nomes = self.vocabulario.nomes
+        competencias = [nomes[id_competencia] for id_competencia in vetores['requisitos'].tolist()]
+        categorias = [CATEGORIAS_PESO[peso] for peso in vetores['requisitos_pesos'].tolist()]
+        crescimentos = vetores['crescimentos'].tolist()
+        salarios = vetores['salarios'].tolist()
+
+        for indice in range(self._total):
+            if indice in self._carreiras:
+                continue
+            base = indice * 2
+            carreira = Carreira(str(textos[offsets[base]:offsets[base + 1]], 'utf-8'),
+                                str(textos[offsets[base + 1]:offsets[base + 2]], 'utf-8'),
+                                crescimentos[indice], salarios[indice])
+            requisitos = carreira.requisitos
+            for j in range(inicios[indice], inicios[indice + 1]):
+                requisitos[categorias[j]].append(competencias[j])
+            self._carreiras[indice] = carreira
+
+    def carreiras(self):
+        """
+        Materializa todas as carreiras do catálogo.
+
+        Returns:
+            list: Carreiras na ordem da origem (as mesmas instâncias a cada chamada)
+        """
+        if len(self._carreiras) < self._total:
+            with _coletor_pausado():
+                self._materializar_todas()
+        return [self._carreiras[indice] for indice in range(self._total)]
+
+    def competencias(self):
+        """
+        Retorna o catálogo de competências gravado no snapshot.
+
+        Returns:
+            dict: {nome: Competencia} (vazio se o catálogo não tinha competências)
+        """
+        return {dados['nome']: Competencia.from_dict(dados) for dados in self._competencias}
+
+    def criar_matriz(self, carreiras=None):
+        """
+        Monta a MatrizPesos do catálogo a partir das linhas CSR, sem compilar as carreiras.
+
+        Args:
+            carreiras (list): Carreiras das colunas (padrão: carreiras())
+
+        Returns:
+            MatrizPesos: Matriz no vocabulário do snapshot
+        """
+        if carreiras is None:
+            carreiras = self.carreiras()
+        vetores = self._vetores
+        with _coletor_pausado():
+            return MatrizPesos.de_csr(carreiras, self.vocabulario, vetores['inicios'],
+                                      vetores['indices'], vetores['pesos'], vetores['maximos'])
+
+    def criar_sistema(self, **opcoes):
+        """
+        Cria um SistemaRecomendacao com o catálogo do snapshot.
+
+        Args:
+            **opcoes: Argumentos adicionais de SistemaRecomendacao (ex.: tamanho_cache)
+
+        Returns:
+            SistemaRecomendacao: Sistema com as carreiras e a matriz já compilada
+        """
+        from .sistema_recomendacao import SistemaRecomendacao
+
+        carreiras = self.carreiras()
+        return SistemaRecomendacao(carreiras, matriz=self.criar_matriz(carreiras), **opcoes)
+
+    def pontuar_esparso(self, perfil_usuario):
+        """
+        Multiplica o vetor de níveis do perfil pelas linhas mapeadas.
+
+        Args:
+            perfil_usuario (Perfil): Perfil do usuário
+
+        Returns:
+            dict: {indice_carreira: pontos} só das carreiras com pontos
+        """
+        vetores = self._vetores
+        inicios, indices, pesos = vetores['inicios'], vetores['indices'], vetores['pesos']
+        buscar_id = self.vocabulario.buscar_id
+        pontos = {}
+
+        for competencia, nivel in perfil_usuario.competencias.items():
+            id_competencia = buscar_id(competencia)
+            if id_competencia is not None and nivel:
+                for j in range(inicios[id_competencia], inicios[id_competencia + 1]):
+                    indice = indices[j]
+                    pontos[indice] = pontos.get(indice, 0) + nivel * pesos[j]
+
+        return pontos
+
+    def recomendar(self, perfil_usuario, limite=3):
+        """
+        Recomenda carreiras direto sobre o snapshot.
+
+        O resultado é idêntico ao de SistemaRecomendacao.recomendar_carreiras
+        com o mesmo catálogo; só as carreiras retornadas são materializadas.
+
+        Args:
+            perfil_usuario (Perfil): Perfil do usuário
+            limite (int): Número de recomendações
+
+        Returns:
+            list: Tuplas (carreira, compatibilidade)
+        """
+        selecionadas = selecionar_esparso(self.pontuar_esparso(perfil_usuario),
+                                          self._vetores['maximos'], limite)
+        return [(self.obter_carreira(indice), compatibilidade)
+                for indice, compatibilidade in selecionadas]
+
+    def __len__(self):
+        return self._total
+
+    def fechar(self):
+        """Libera as views e fecha os mapeamentos."""
+        for view in self._vetores.values():
+            view.release()
+        for mapa in self._mapas.values():
+            if isinstance(mapa, mmap.mmap):
+                mapa.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def __repr__(self):
+        return f"CatalogoCompilado(diretorio='{self.diretorio}', carreiras={self._total})"
+
+
+def abrir_catalogo(caminho_carreiras, caminho_competencias=None, diretorio=None):
+    """
+    Abre o snapshot de um catálogo, compilando-o se não existir ou estiver desatualizado.
+
+    Args:
+        caminho_carreiras (str): Arquivo de carreiras (.json, .jsonl ou .csv)
+        caminho_competencias (str): Arquivo de competências (opcional)
+        diretorio (str): Diretório do snapshot (padrão: caminho_carreiras + '.snapshot')
+
+    Returns:
+        CatalogoCompilado: Snapshot aberto, com o mesmo hash da origem atual
+
+    Raises:
+        ValueError: Se a origem precisar ser compilada e tiver registros inválidos
+    """
+    if diretorio is None:
+        diretorio = caminho_carreiras + '.snapshot'
+    hash_origem = hash_conteudo(caminho_carreiras, caminho_competencias)
+
+    try:
+        catalogo = CatalogoCompilado(diretorio)
+    except (OSError, ValueError, KeyError):
+        catalogo = None  # Snapshot ausente, incompleto ou de outra versão
+
+    if catalogo is not None:
+        if catalogo.hash == hash_origem:
+            return catalogo
+        catalogo.fechar()
+
+    carreiras, competencias = carregar_catalogo(caminho_carreiras, caminho_competencias)
+    return gravar_snapshot(diretorio, carreiras, competencias, hash_origem)
+
+
+def main(argumentos=None):
+    # Valida um catálogo e grava (ou atualiza) o seu snapshot.
+    parser = argparse.ArgumentParser(description="Compila um catálogo de carreiras")
+    parser.add_argument('carreiras', help="Arquivo de carreiras (.json, .jsonl ou .csv)")
+    parser.add_argument('--competencias', help="Arquivo de competências (opcional)")
+    parser.add_argument('--snapshot', help="Diretório do snapshot (padrão: <carreiras>.snapshot)")
+    args = parser.parse_args(argumentos)
+
+    try:
+        catalogo = abrir_catalogo(args.carreiras, args.competencias, args.snapshot)
+    except ValueError as erro:
+        parser.exit(1, f"{erro}\n")
+
+    with catalogo:
+        print(f"{len(catalogo)} carreiras e {len(catalogo.vocabulario)} competências "
+              f"em {catalogo.diretorio} (hash {catalogo.hash[:12]})")
+
+
+if __name__ == "__main__":
+    main()
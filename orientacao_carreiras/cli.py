@@ -9,11 +9,16 @@ from .validadores import validar_nome, validar_idade, validar_nivel
 class CLI:
     # Interface de linha de comando para interação com o usuário.
     
-    def __init__(self):
-        # Inicia a interface CLI.
-        self.sistema = SistemaRecomendacao(obter_carreiras_futuro())
-        self.competencias_disponiveis = obter_competencias_base()
+    def __init__(self, catalogo=None):
+        # Inicia a interface CLI, com o catálogo padrão ou um CatalogoCompilado (snapshot).
+        if catalogo is None:
+            self.sistema = SistemaRecomendacao(obter_carreiras_futuro())
+            self.competencias_disponiveis = obter_competencias_base()
+        else:
+            self.sistema = catalogo.criar_sistema()
+            self.competencias_disponiveis = catalogo.competencias() or obter_competencias_base()
         self.perfil_atual = None
+        self.sessao = None  # Recalcula as recomendações a cada competência alterada
     
     def limpar_tela(self):
         # Limpa a tela do terminal.
@@ -77,6 +82,9 @@ class CLI:
         
         # Cria o perfil
         self.perfil_atual = Perfil(nome, idade, area)
+        if self.sessao:
+            self.sessao.fechar()
+        self.sessao = self.sistema.iniciar_sessao(self.perfil_atual)
         
         print(f"\nSUCESSO: Perfil criado com sucesso!")
         print(f"Nome: {nome}")
@@ -186,15 +194,15 @@ class CLI:
         print(f"\nRECOMENDACOES PARA {self.perfil_atual.nome}")
         print("-" * 40)
         
-        # Gera recomendações
-        recomendacoes = self.sistema.recomendar_carreiras(self.perfil_atual)
+        # Gera recomendações com os gaps de cada carreira
+        recomendacoes = self.sessao.relatorio().recomendacoes
         
         if not recomendacoes:
             print("ERRO: Nenhuma carreira encontrada!")
             return
         
         print("TOP 3 CARREIRAS RECOMENDADAS:")
-        for i, (carreira, compatibilidade) in enumerate(recomendacoes, 1):
+        for i, (carreira, compatibilidade, _) in enumerate(recomendacoes, 1):
             print(f"\n{i}. {carreira.nome}")
             print(f"   Compatibilidade: {compatibilidade}%")
             print(f"   Crescimento: {carreira.crescimento_projetado}%")
@@ -202,8 +210,7 @@ class CLI:
             print(f"   Descricao: {carreira.descricao}")
         
         # Mostra gaps da melhor recomendação
-        melhor_carreira = recomendacoes[0][0]
-        gaps = self.sistema.identificar_gaps(self.perfil_atual, melhor_carreira)
+        melhor_carreira, _, gaps = recomendacoes[0]
         
         if gaps:
             print(f"\nCOMPETENCIAS PARA DESENVOLVER ({melhor_carreira.nome}):")
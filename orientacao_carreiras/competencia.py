@@ -8,6 +8,9 @@ class Competencia:
         descricao (str): Descrição da competência
         nivel_demanda_futuro (int): Nível de demanda previsto (1-5)
     """
+
+    # Sem __dict__ por instância (catálogos com milhares de competências)
+    __slots__ = ('nome', 'categoria', 'descricao', 'nivel_demanda_futuro')
     
     # Tupla com categorias 
     CATEGORIAS_VALIDAS = ('tecnica', 'comportamental', 'hibrida')
@@ -64,4 +67,10 @@ class Competencia:
             'categoria': self.categoria,
             'descricao': self.descricao,
             'nivel_demanda_futuro': self.nivel_demanda_futuro
-        }
\ No newline at end of file
+        }
+    
+    @classmethod
+    def from_dict(cls, dados):
+        """Cria uma competência a partir de um dicionário de to_dict."""
+        return cls(dados['nome'], dados['categoria'], dados.get('descricao', ''),
+                   dados.get('nivel_demanda_futuro', 3))
\ No newline at end of file
@@ -0,0 +1,300 @@
+# Gerador determinístico de dados sintéticos em grande escala.
+#
+# Amplia dados_mock para testes de carga: milhares de competências nas
+# categorias de Competencia.CATEGORIAS_VALIDAS, dezenas de milhares de
+# carreiras com requisitos essenciais/importantes/desejáveis e milhões de
+# perfis. A popularidade das competências segue uma distribuição de Zipf
+# (poucas muito usadas, muitas raras). Com a mesma semente, os dados são
+# sempre os mesmos.
+#
+# Os perfis são gerados sob demanda e podem ser gravados direto em JSONL
+# (formato do pipeline) ou no repositório colunar, sem ficar todos em memória.
+#
+# Uso: python -m orientacao_carreiras.dados_sinteticos --perfis 1000000
+#          --saida perfis.jsonl [--formato jsonl|colunar] [--semente 42]
+
+import argparse
+import json
+import random
+from bisect import bisect
+from itertools import accumulate, islice
+
+from .carreira import Carreira
+from .competencia import Competencia
+from .dados_mock import obter_competencias_base
+from .perfil import Perfil, PerfilCompacto
+from .validadores import AREAS_ATUACAO_COMUNS, OBJETIVOS_PROFISSIONAIS_SUGERIDOS
+
+# Expoente padrão da distribuição de Zipf (popularidade da competência de posição r ~ 1 / r^s)
+EXPOENTE_ZIPF = 0.8
+
+# Faixas (mínimo, máximo) de requisitos por categoria em cada carreira
+REQUISITOS_POR_CARREIRA = (('essenciais', 2, 4), ('importantes', 1, 3), ('desejaveis', 0, 3))
+
+# Faixa padrão de competências por perfil
+COMPETENCIAS_POR_PERFIL = (2, 12)
+
+
+class SorteadorZipf:
+    """
+    Sorteia posições 0..n-1 com probabilidade proporcional a 1 / (posição + 1)^expoente.
+
+    Atributos:
+        total (int): Número de posições
+        expoente (float): Expoente da distribuição
+    """
+
+    def __init__(self, total, expoente=EXPOENTE_ZIPF):
+        """
+        Pré-calcula os pesos acumulados.
+
+        Args:
+            total (int): Número de posições (pelo menos 1)
+            expoente (float): Expoente da distribuição (0 = uniforme)
+        """
+        if total < 1:
+            raise ValueError("O sorteador precisa de pelo menos uma posição")
+
+        self.total = total
+        self.expoente = expoente
+        self._acumulados = list(accumulate(1 / (posicao ** expoente)
+                                           for posicao in range(1, total + 1)))
+
+    def sortear(self, gerador):
+        """Sorteia uma posição."""
+        return bisect(self._acumulados, gerador.random() * self._acumulados[-1])
+
+    def sortear_distintos(self, gerador, quantidade):
+        """
+        Sorteia posições distintas, na ordem em que foram sorteadas.
+
+        Args:
+            gerador (random.Random): Gerador de números aleatórios
+            quantidade (int): Número de posições (limitado a self.total)
+
+        Returns:
+            list: Posições sorteadas
+        """
+        quantidade = min(quantidade, self.total)
+        escolhidas = {}
+        while len(escolhidas) < quantidade:
+            escolhidas[self.sortear(gerador)] = None
+        return list(escolhidas)
+
+
+def gerar_competencias(total=2_000, semente=42):
+    """
+    Gera um catálogo de competências que começa pelas de dados_mock.
+
+    As competências sintéticas são distribuídas entre as categorias válidas
+    e recebem uma demanda futura de 1 a 5.
+
+    Args:
+        total (int): Número de competências (pelo menos as 8 de dados_mock)
+        semente (int): Semente do gerador aleatório
+
+    Returns:
+        dict: Dicionário {nome_competencia: objeto_Competencia}, da mais para a menos popular
+    """
+    gerador = random.Random(semente)
+    competencias = obter_competencias_base()
+    categorias = Competencia.CATEGORIAS_VALIDAS
+
+    for i in range(total - len(competencias)):
+        categoria = categorias[i % len(categorias)]
+        nome = f"{categoria}_{i}"
+        competencias[nome] = Competencia(nome, categoria, f"Competência sintética {i}",
+                                         gerador.randint(1, 5))
+
+    return competencias
+
+
+def gerar_carreiras(competencias, total=20_000, semente=42, expoente=EXPOENTE_ZIPF):
+    """
+    Gera carreiras com requisitos sorteados pela popularidade das competências.
+
+    Cada carreira tem de 2 a 4 competências essenciais, de 1 a 3 importantes
+    e até 3 desejáveis (REQUISITOS_POR_CARREIRA).
+
+    Args:
+        competencias (iterable): Nomes das competências, da mais para a menos popular
+        total (int): Número de carreiras
+        semente (int): Semente do gerador aleatório
+        expoente (float): Expoente da distribuição de Zipf
+
+    Yields:
+        Carreira: Carreiras geradas
+    """
+    gerador = random.Random(semente)
+    nomes = list(competencias)
+    sorteador = SorteadorZipf(len(nomes), expoente)
+    adicionar = {
+        'essenciais': Carreira.adicionar_competencia_essencial,
+        'importantes': Carreira.adicionar_competencia_importante,
+        'desejaveis': Carreira.adicionar_competencia_desejavel,
+    }
+
+    for i in range(total):
+        carreira = Carreira(
+            f"Carreira {i}",
+            f"Carreira sintética {i}",
+            crescimento_projetado=gerador.randint(0, 300),
+            salario_medio=float(round(gerador.lognormvariate(8.8, 0.4), -1)),
+        )
+
+        quantidades = [(categoria, gerador.randint(minimo, maximo))
+                       for categoria, minimo, maximo in REQUISITOS_POR_CARREIRA]
+        posicoes = iter(sorteador.sortear_distintos(gerador, sum(q for _, q in quantidades)))
+
+        for categoria, quantidade in quantidades:
+            for posicao in islice(posicoes, quantidade):
+                adicionar[categoria](carreira, nomes[posicao])
+
+        yield carreira
+
+
+def _nome_usuario(indice):
+    # Nome válido para validar_nome (apenas letras): Usuario A, ..., Usuario BA...
+    letras = ''
+    indice += 1
+    while indice:
+        indice, resto = divmod(indice - 1, 26)
+        letras = chr(65 + resto) + letras
+    return f"Usuario {letras}"
+
+
+def gerar_registros_perfis(competencias, total, semente=7, por_perfil=COMPETENCIAS_POR_PERFIL,
+                           expoente=EXPOENTE_ZIPF):
+    """
+    Gera registros de perfis no formato de entrada do pipeline em lote.
+
+    Args:
+        competencias (iterable): Nomes das competências, da mais para a menos popular
+        total (int): Número de perfis
+        semente (int): Semente do gerador aleatório
+        por_perfil (int ou tuple): Competências por perfil, fixo ou (mínimo, máximo)
+        expoente (float): Expoente da distribuição de Zipf
+
+    Yields:
+        dict: {nome, idade, area_atuacao, competencias, objetivos}
+    """
+    gerador = random.Random(semente)
+    nomes = list(competencias)
+    sorteador = SorteadorZipf(len(nomes), expoente)
+    minimo, maximo = (por_perfil, por_perfil) if isinstance(por_perfil, int) else por_perfil
+
+    for i in range(total):
+        posicoes = sorteador.sortear_distintos(gerador, gerador.randint(minimo, maximo))
+        yield {
+            'nome': _nome_usuario(i),
+            'idade': gerador.randint(18, 65),
+            'area_atuacao': gerador.choice(AREAS_ATUACAO_COMUNS),
+            'competencias': {nomes[posicao]: gerador.randint(1, 5) for posicao in posicoes},
+            'objetivos': gerador.sample(OBJETIVOS_PROFISSIONAIS_SUGERIDOS, gerador.randint(0, 2)),
+        }
+
+
+def gerar_perfis(competencias, total, semente=7, por_perfil=COMPETENCIAS_POR_PERFIL,
+                 expoente=EXPOENTE_ZIPF, compacto=False):
+    """
+    Gera objetos Perfil a partir de gerar_registros_perfis.
+
+    Args:
+        competencias (iterable): Nomes das competências, da mais para a menos popular
+        total (int): Número de perfis
+        semente (int): Semente do gerador aleatório
+        por_perfil (int ou tuple): Competências por perfil, fixo ou (mínimo, máximo)
+        expoente (float): Expoente da distribuição de Zipf
+        compacto (bool): Se True, gera PerfilCompacto
+
+    Yields:
+        Perfil: Perfis gerados
+    """
+    classe = PerfilCompacto if compacto else Perfil
+
+    for registro in gerar_registros_perfis(competencias, total, semente, por_perfil, expoente):
+        perfil = classe(registro['nome'], registro['idade'], registro['area_atuacao'])
+        for competencia, nivel in registro['competencias'].items():
+            perfil.adicionar_competencia(competencia, nivel)
+        if registro['objetivos']:
+            perfil.objetivos = registro['objetivos']
+        yield perfil
+
+
+def gravar_jsonl(caminho, registros):
+    """
+    Grava registros (dicionários) em um arquivo JSONL, um por linha.
+
+    Args:
+        caminho (str): Arquivo de saída
+        registros (iterable): Dicionários a gravar
+
+    Returns:
+        int: Número de registros gravados
+    """
+    total = 0
+    with open(caminho, 'w', encoding='utf-8') as arquivo:
+        for registro in registros:
+            arquivo.write(json.dumps(registro, ensure_ascii=False) + '\n')
+            total += 1
+    return total
+
+
+def registro_carreira(carreira):
+    """
+    Converte uma carreira em dicionário serializável em JSON.
+
+    Args:
+        carreira (Carreira): Carreira a converter
+
+    Returns:
+        dict: {nome, descricao, crescimento_projetado, salario_medio, requisitos}
+    """
+    return {
+        'nome': carreira.nome,
+        'descricao': carreira.descricao,
+        'crescimento_projetado': carreira.crescimento_projetado,
+        'salario_medio': carreira.salario_medio,
+        'requisitos': {categoria: list(nomes) for categoria, nomes in carreira.requisitos.items()},
+    }
+
+
+def main(argumentos=None):
+    # Gera perfis (e opcionalmente o catálogo de carreiras) em arquivos.
+    parser = argparse.ArgumentParser(description="Gerador de dados sintéticos")
+    parser.add_argument('--perfis', type=int, default=100_000, help="Número de perfis")
+    parser.add_argument('--saida', required=True,
+                        help="Arquivo .jsonl ou diretório do repositório colunar")
+    parser.add_argument('--formato', choices=('jsonl', 'colunar'), default='jsonl')
+    parser.add_argument('--competencias', type=int, default=2_000, help="Número de competências")
+    parser.add_argument('--carreiras', type=int, default=0,
+                        help="Número de carreiras (gravadas em --saida-carreiras)")
+    parser.add_argument('--saida-carreiras', default='carreiras.jsonl')
+    parser.add_argument('--semente', type=int, default=42)
+    args = parser.parse_args(argumentos)
+
+    competencias = gerar_competencias(args.competencias, args.semente)
+
+    if args.carreiras:
+        total = gravar_jsonl(args.saida_carreiras,
+                             map(registro_carreira,
+                                 gerar_carreiras(competencias, args.carreiras, args.semente)))
+        print(f"{total} carreiras gravadas em {args.saida_carreiras}")
+
+    if args.formato == 'jsonl':
+        total = gravar_jsonl(args.saida, gerar_registros_perfis(competencias, args.perfis,
+                                                                args.semente))
+    else:
+        from .repositorio_perfis import RepositorioPerfis
+        from .vocabulario import VocabularioCompetencias
+
+        vocabulario = VocabularioCompetencias(competencias)
+        perfis = gerar_perfis(competencias, args.perfis, args.semente)
+        with RepositorioPerfis.gravar(args.saida, perfis, vocabulario) as repositorio:
+            total = len(repositorio)
+
+    print(f"{total} perfis gravados em {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
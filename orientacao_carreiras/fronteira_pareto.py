@@ -0,0 +1,166 @@
+# Lista curta de Pareto: carreiras não dominadas em compatibilidade,
+# crescimento projetado e salário médio.
+#
+# Uma carreira domina outra se não é pior em nenhum dos três objetivos e é
+# melhor em pelo menos um. A fronteira é calculada por varredura (skyline):
+# os pontos são ordenados do maior para o menor no primeiro objetivo e cada
+# um é comparado só com uma "escada" dos pares (segundo, terceiro objetivo)
+# não dominados já vistos, consultada por busca binária.
+#
+# Crescimento e salário não dependem do perfil. Uma carreira que o perfil não
+# alcança (compatibilidade 0) só pode estar na fronteira se também estiver na
+# fronteira estática de (crescimento, salário), calculada uma vez por versão
+# do catálogo; então cada consulta varre apenas as carreiras alcançadas mais
+# essa fronteira estática, em O(m log m).
+
+from bisect import bisect_left
+from collections import namedtuple
+
+# Estado de FronteiraPareto para uma versão da matriz
+_Preparacao = namedtuple('_Preparacao', ['matriz', 'versao', 'crescimentos', 'salarios',
+                                         'estaticas'])
+
+
+def fronteira_pareto(pontos):
+    """
+    Retorna os pontos não dominados (maximizando todos os objetivos).
+
+    Aceita pontos de 2 ou 3 objetivos. Pontos idênticos não se dominam, então
+    todas as cópias de um ponto da fronteira são mantidas.
+
+    Args:
+        pontos (list): Tuplas (a, b) ou (a, b, c) de valores numéricos
+
+    Returns:
+        list: Posições dos pontos da fronteira, em ordem crescente
+    """
+    # Escada dos pares (b, c) não dominados já vistos: b crescente e c
+    # decrescente (guardado negativo, para a busca binária)
+    escada_b = []
+    escada_c = []
+    fronteira = []
+
+    tres_objetivos = bool(pontos) and len(pontos[0]) > 2
+    anterior = None
+    incluido = False
+    for posicao in sorted(range(len(pontos)), key=pontos.__getitem__, reverse=True):
+        ponto = pontos[posicao]
+        # Cópias de um ponto já decidido têm a mesma decisão (não se dominam)
+        if ponto == anterior:
+            if incluido:
+                fronteira.append(posicao)
+            continue
+        anterior = ponto
+
+        b = ponto[1]
+        c = ponto[2] if tres_objetivos else 0
+        # Todos os pontos já vistos têm a maior ou igual e são diferentes deste;
+        # o de maior c entre os com b' >= b é o primeiro da escada a partir de b
+        j = bisect_left(escada_b, b)
+        incluido = j == len(escada_b) or -escada_c[j] < c
+        if incluido:
+            fronteira.append(posicao)
+
+            # Remove da escada os pares que (b, c) domina e insere o novo
+            k = bisect_left(escada_c, -c, 0, j)
+            if j < len(escada_b) and escada_b[j] == b:
+                j += 1
+            escada_b[k:j] = [b]
+            escada_c[k:j] = [-c]
+
+    fronteira.sort()
+    return fronteira
+
+
+class FronteiraPareto:
+    """
+    Calcula a lista curta de Pareto de perfis sobre o catálogo de uma matriz.
+
+    As colunas de crescimento e salário e a fronteira estática são refeitas
+    quando a versão da matriz muda; se crescimento ou salário forem alterados
+    diretamente nas carreiras, chame descartar_preparacao().
+    """
+
+    def __init__(self):
+        self._preparacao = None
+
+    def descartar_preparacao(self):
+        """Descarta as colunas guardadas (recalculadas na próxima consulta)."""
+        self._preparacao = None
+
+    def _preparar(self, matriz):
+        # Colunas estáticas e fronteira de (crescimento, salário) da versão atual.
+        preparacao = self._preparacao
+        if (preparacao is not None and preparacao.matriz is matriz
+                and preparacao.versao == matriz.versao):
+            return preparacao
+
+        crescimentos = [carreira.crescimento_projetado for carreira in matriz.carreiras]
+        salarios = [carreira.salario_medio for carreira in matriz.carreiras]
+        estaticas = fronteira_pareto(list(zip(crescimentos, salarios)))
+
+        self._preparacao = _Preparacao(matriz, matriz.versao, crescimentos, salarios, estaticas)
+        return self._preparacao
+
+    def calcular(self, perfil, matriz, compatibilidade_minima=0, pontos=None):
+        """
+        Retorna as carreiras não dominadas para um perfil.
+
+        Args:
+            perfil (Perfil): Perfil do usuário
+            matriz (MatrizPesos): Catálogo compilado
+            compatibilidade_minima (float): Considera só carreiras com pelo menos
+                essa compatibilidade (0 = todo o catálogo)
+            pontos (dict): matriz.pontuar_esparso(perfil), se já calculado
+
+        Returns:
+            list: Tuplas (carreira, compatibilidade), da maior para a menor
+                compatibilidade (em empates, na ordem do catálogo)
+        """
+        preparacao = self._preparar(matriz)
+        if pontos is None:
+            pontos = matriz.pontuar_esparso(perfil)
+
+        maximos = matriz.pontos_maximos
+        compatibilidades = {}
+        for indice, valor in pontos.items():
+            compatibilidade = round((valor / maximos[indice]) * 100, 1)
+            if compatibilidade > 0 and compatibilidade >= compatibilidade_minima:
+                compatibilidades[indice] = compatibilidade
+
+        # Sem compatibilidade mínima, as não alcançadas da fronteira estática também concorrem
+        crescimentos, salarios = preparacao.crescimentos, preparacao.salarios
+        candidatas = list(compatibilidades)
+        valores = [(compatibilidade, crescimentos[indice], salarios[indice])
+                   for indice, compatibilidade in compatibilidades.items()]
+        if compatibilidade_minima <= 0:
+            for indice in preparacao.estaticas:
+                if indice not in compatibilidades:
+                    candidatas.append(indice)
+                    valores.append((0.0, crescimentos[indice], salarios[indice]))
+
+        carreiras = matriz.carreiras
+        selecionadas = sorted((candidatas[posicao] for posicao in fronteira_pareto(valores)),
+                              key=lambda indice: (-compatibilidades.get(indice, 0.0), indice))
+        return [(carreiras[indice], compatibilidades.get(indice, 0.0 if maximos[indice] else 0))
+                for indice in selecionadas]
+
+    def calcular_lote(self, perfis, matriz, compatibilidade_minima=0):
+        """
+        Calcula a lista curta de Pareto de vários perfis, com a preparação feita uma vez.
+
+        Args:
+            perfis (iterable): Perfis dos usuários
+            matriz (MatrizPesos): Catálogo compilado
+            compatibilidade_minima (float): Ver calcular()
+
+        Yields:
+            list: Resultado de calcular() de cada perfil, na ordem da entrada
+        """
+        for perfil in perfis:
+            yield self.calcular(perfil, matriz, compatibilidade_minima)
+
+    def __repr__(self):
+        preparacao = self._preparacao
+        estaticas = len(preparacao.estaticas) if preparacao is not None else None
+        return f"FronteiraPareto(fronteira_estatica={estaticas})"
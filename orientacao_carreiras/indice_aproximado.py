@@ -0,0 +1,235 @@
+# Índice aproximado (IVF) para catálogos muito grandes.
+#
+# As carreiras são agrupadas por k-means esférico sobre os vetores de
+# requisitos (competência -> peso 3/2/1 x IDF, normalizados). Cada grupo ("lista
+# invertida") guarda sua própria submatriz de pesos, no mesmo formato das
+# linhas da MatrizPesos, e o limite superior de cada competência no grupo
+# (maior peso / pontos máximos), como MatrizPesos.limite_superior.
+#
+# Na consulta, os grupos são ordenados pela compatibilidade máxima que o
+# perfil pode atingir neles e só os `sondas` primeiros são pontuados. Os
+# pontos das carreiras sondadas são exatos (mesma fórmula e arredondamento
+# de calcular_compatibilidade); a aproximação está apenas em quais carreiras
+# são avaliadas. A busca para antes se nenhum grupo restante pode superar as
+# carreiras já selecionadas, e nesse caso o resultado é exato.
+
+import heapq
+import math
+import random
+
+# Número de sondas (grupos pontuados por consulta) padrão
+SONDAS_PADRAO = 8
+
+# Iterações do k-means
+ITERACOES_PADRAO = 6
+
+# Termos mantidos em cada centróide (os de maior peso) durante o agrupamento
+TERMOS_CENTROIDE = 24
+
+# Carreiras usadas para treinar os centróides, por grupo
+AMOSTRA_POR_GRUPO = 20
+
+
+def _normalizar(vetor):
+    # Divide o vetor esparso pela sua norma euclidiana.
+    norma = math.sqrt(sum(valor * valor for valor in vetor.values()))
+    return {chave: valor / norma for chave, valor in vetor.items()} if norma else vetor
+
+
+def _indexar_centroides(centroides):
+    # Índice invertido competência -> [(grupo, peso)] dos centróides truncados.
+    indice = {}
+    for grupo, centroide in enumerate(centroides):
+        for competencia, valor in centroide.items():
+            indice.setdefault(competencia, []).append((grupo, valor))
+    return indice
+
+
+def _mais_proximo(vetor, indice, padrao):
+    # Grupo de maior similaridade (produto interno) com o vetor normalizado.
+    similaridades = {}
+    for competencia, valor in vetor.items():
+        for grupo, peso in indice.get(competencia, ()):
+            similaridades[grupo] = similaridades.get(grupo, 0.0) + valor * peso
+    if not similaridades:
+        return padrao
+    return max(similaridades, key=similaridades.__getitem__)
+
+
+class IndiceAproximado:
+    """
+    Índice IVF sobre as carreiras de uma MatrizPesos.
+
+    O índice é uma fotografia da matriz: se o catálogo mudar, `desatualizado`
+    passa a ser True e um novo índice deve ser construído.
+
+    Atributos:
+        matriz (MatrizPesos): Matriz indexada
+        versao (int): Versão da matriz na construção
+        total_grupos (int): Número de listas invertidas
+        sondas (int): Grupos pontuados por consulta (padrão das consultas)
+        tamanhos (list): Número de carreiras de cada grupo
+    """
+
+    def __init__(self, matriz, grupos=None, sondas=SONDAS_PADRAO, iteracoes=ITERACOES_PADRAO,
+                 semente=42):
+        """
+        Agrupa as carreiras e monta as listas invertidas.
+
+        Args:
+            matriz (MatrizPesos): Catálogo compilado
+            grupos (int): Número de grupos (padrão: raiz quadrada do catálogo)
+            sondas (int): Grupos pontuados por consulta
+            iteracoes (int): Iterações do k-means
+            semente (int): Semente do gerador aleatório
+        """
+        if sondas < 1:
+            raise ValueError("Número de sondas deve ser pelo menos 1")
+
+        total = len(matriz)
+        if grupos is None:
+            grupos = round(math.sqrt(total))
+        # Catálogo vazio: nenhum grupo (recomendar recorre à matriz completa)
+        grupos = max(1, min(grupos, total)) if total else 0
+
+        self.matriz = matriz
+        self.versao = matriz.versao
+        self.total_grupos = grupos
+        self.sondas = sondas
+
+        # Vetor de requisitos de cada carreira (colunas da matriz). No agrupamento,
+        # cada peso é multiplicado pelo IDF da competência para que as muito
+        # comuns não coloquem quase todas as carreiras no mesmo grupo.
+        colunas = [{} for _ in range(total)]
+        raridades = {}
+        for competencia, linha in matriz.linhas.items():
+            raridades[competencia] = math.log(total / len(linha)) + 1
+            for indice, peso in linha.items():
+                colunas[indice][competencia] = peso
+        vetores = [_normalizar({competencia: peso * raridades[competencia]
+                                for competencia, peso in coluna.items()})
+                   for coluna in colunas]
+
+        atribuicoes = []
+        if total:
+            atribuicoes = self._agrupar(vetores, grupos, iteracoes, random.Random(semente))
+
+        # Submatriz e limites superiores de cada grupo
+        self._linhas = [{} for _ in range(grupos)]     # [{competencia: {indice: peso}}]
+        self._limites = {}                              # {competencia: {grupo: limite}}
+        self.tamanhos = [0] * grupos
+        maximos = matriz.pontos_maximos
+
+        for indice, grupo in enumerate(atribuicoes):
+            self.tamanhos[grupo] += 1
+            linhas = self._linhas[grupo]
+            for competencia, peso in colunas[indice].items():
+                linhas.setdefault(competencia, {})[indice] = peso
+                limite = peso / maximos[indice] * 100
+                limites = self._limites.setdefault(competencia, {})
+                if limite > limites.get(grupo, 0):
+                    limites[grupo] = limite
+
+    def _agrupar(self, vetores, grupos, iteracoes, gerador):
+        # k-means esférico: treina os centróides em uma amostra e atribui todas as carreiras.
+        total = len(vetores)
+        amostra = gerador.sample(range(total), min(total, grupos * AMOSTRA_POR_GRUPO))
+        centroides = [vetores[indice] for indice in amostra[:grupos]]
+
+        for _ in range(iteracoes):
+            indice = _indexar_centroides(centroides)
+            somas = [{} for _ in range(grupos)]
+            for posicao, carreira in enumerate(amostra):
+                soma = somas[_mais_proximo(vetores[carreira], indice, posicao % grupos)]
+                for competencia, valor in vetores[carreira].items():
+                    soma[competencia] = soma.get(competencia, 0.0) + valor
+
+            centroides = []
+            for soma in somas:
+                if not soma:
+                    # Grupo vazio: recomeça em uma carreira sorteada
+                    soma = vetores[gerador.choice(amostra)]
+                termos = heapq.nlargest(TERMOS_CENTROIDE, soma.items(), key=lambda item: item[1])
+                centroides.append(_normalizar(dict(termos)))
+
+        indice = _indexar_centroides(centroides)
+        return [_mais_proximo(vetor, indice, posicao % grupos)
+                for posicao, vetor in enumerate(vetores)]
+
+    @property
+    def desatualizado(self):
+        """True se a matriz mudou depois da construção do índice."""
+        return self.matriz.versao != self.versao
+
+    def recomendar(self, perfil_usuario, limite=3, sondas=None):
+        """
+        Recomenda carreiras pontuando apenas os grupos mais promissores.
+
+        As compatibilidades retornadas são exatas; carreiras de grupos não
+        sondados podem ficar de fora. Se menos de `limite` carreiras sondadas
+        tiverem compatibilidade positiva (ou com limite não positivo), usa a
+        matriz completa.
+
+        Args:
+            perfil_usuario (Perfil): Perfil do usuário
+            limite (int): Número de recomendações
+            sondas (int): Grupos pontuados (padrão: self.sondas)
+
+        Returns:
+            list: Tuplas (carreira, compatibilidade), da maior para a menor
+        """
+        matriz = self.matriz
+        if limite <= 0:
+            return matriz.melhores(matriz.pontuar_esparso(perfil_usuario), limite)
+
+        sondas = self.sondas if sondas is None else sondas
+        competencias = [(competencia, nivel)
+                        for competencia, nivel in perfil_usuario.competencias.items()
+                        if nivel and competencia in self._limites]
+
+        # Compatibilidade máxima possível em cada grupo
+        cotas = {}
+        for competencia, nivel in competencias:
+            for grupo, limite_grupo in self._limites[competencia].items():
+                cotas[grupo] = cotas.get(grupo, 0) + nivel * limite_grupo
+
+        maximos = matriz.pontos_maximos
+        melhores = []  # heap mínimo de (compatibilidade, -indice)
+
+        for sondados, (grupo, cota) in enumerate(sorted(cotas.items(),
+                                                         key=lambda item: item[1], reverse=True)):
+            if sondados >= sondas:
+                break
+            # Nenhuma carreira dos grupos restantes supera as selecionadas: resultado exato.
+            # A cota é uma soma em ponto flutuante e pode ficar logo abaixo de um
+            # empate exato (61.2499... para 49/80 = 61.25); a folga evita parar antes dele.
+            if len(melhores) == limite and melhores[0][0] > round(cota + 1e-9, 1):
+                break
+
+            linhas = self._linhas[grupo]
+            pontos = {}
+            for competencia, nivel in competencias:
+                linha = linhas.get(competencia)
+                if linha:
+                    for indice, peso in linha.items():
+                        pontos[indice] = pontos.get(indice, 0) + nivel * peso
+
+            for indice, valor in pontos.items():
+                item = (round((valor / maximos[indice]) * 100, 1), -indice)
+                if item[0] <= 0:
+                    continue
+                if len(melhores) < limite:
+                    heapq.heappush(melhores, item)
+                elif item > melhores[0]:
+                    heapq.heapreplace(melhores, item)
+
+        if len(melhores) < limite:
+            return matriz.melhores(matriz.pontuar_esparso(perfil_usuario), limite)
+
+        carreiras = matriz.carreiras
+        return [(carreiras[-indice], compatibilidade)
+                for compatibilidade, indice in sorted(melhores, reverse=True)]
+
+    def __repr__(self):
+        return (f"IndiceAproximado(carreiras={len(self.matriz)}, grupos={self.total_grupos}, "
+                f"sondas={self.sondas})")
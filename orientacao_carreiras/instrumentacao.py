@@ -0,0 +1,172 @@
+# Métricas opcionais dos trechos críticos (tempos por etapa e contadores).
+#
+# Desativadas por padrão: o sistema guarda `metricas = None` e cada etapa
+# instrumentada só faz um teste `if metricas is not None` antes de medir.
+# Quando ativadas, cada etapa registra sua duração em um histograma com
+# limites fixos (como os histogramas do Prometheus) e os contadores somam
+# carreiras pontuadas, competências consultadas etc.
+#
+# Etapas usadas pelo sistema e pelo pipeline:
+#   selecao_candidatos, pontuacao, ordenacao, gaps, relatorio,
+#   busca_aproximada, validacao, serializacao
+
+import time
+from bisect import bisect_left
+
+# Limites superiores (em segundos) dos baldes dos histogramas
+LIMITES_PADRAO = (0.00001, 0.000025, 0.00005, 0.0001, 0.00025, 0.0005,
+                  0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+# Relógio usado nas medições
+relogio = time.perf_counter
+
+
+class Histograma:
+    """
+    Distribuição de durações em baldes de limites fixos.
+
+    Atributos:
+        limites (tuple): Limite superior de cada balde, em segundos
+        contagens (list): Observações de cada balde (o último é +Inf)
+        soma (float): Soma das durações
+        total (int): Número de observações
+    """
+
+    __slots__ = ('limites', 'contagens', 'soma', 'total')
+
+    def __init__(self, limites=LIMITES_PADRAO):
+        self.limites = tuple(limites)
+        self.contagens = [0] * (len(self.limites) + 1)
+        self.soma = 0.0
+        self.total = 0
+
+    def observar(self, duracao):
+        """Registra uma duração em segundos."""
+        self.contagens[bisect_left(self.limites, duracao)] += 1
+        self.soma += duracao
+        self.total += 1
+
+    def acumuladas(self):
+        """Retorna as contagens acumuladas por limite (a última inclui +Inf)."""
+        acumuladas = []
+        total = 0
+        for contagem in self.contagens:
+            total += contagem
+            acumuladas.append(total)
+        return acumuladas
+
+    def percentil(self, p):
+        """
+        Estima o percentil p (0-100) pelo limite do balde que o contém.
+
+        Returns:
+            float: Limite superior do balde (inf se cair no último)
+        """
+        if not self.total:
+            return 0.0
+        alvo = self.total * p / 100
+        for limite, acumulada in zip(self.limites + (float('inf'),), self.acumuladas()):
+            if acumulada >= alvo:
+                return limite
+        return float('inf')
+
+    def combinar(self, outro):
+        """Soma outro histograma com os mesmos limites a este."""
+        if outro.limites != self.limites:
+            raise ValueError("Histogramas com limites diferentes")
+        self.contagens = [a + b for a, b in zip(self.contagens, outro.contagens)]
+        self.soma += outro.soma
+        self.total += outro.total
+
+
+class Metricas:
+    """
+    Conjunto de histogramas por etapa e contadores.
+
+    Atributos:
+        histogramas (dict): {etapa: Histograma}
+        contadores (dict): {nome: valor}
+        limites (tuple): Limites dos histogramas criados
+    """
+
+    def __init__(self, limites=LIMITES_PADRAO):
+        self.limites = tuple(limites)
+        self.histogramas = {}
+        self.contadores = {}
+
+    def registrar(self, etapa, duracao):
+        """
+        Registra a duração de uma etapa.
+
+        Args:
+            etapa (str): Nome da etapa
+            duracao (float): Duração em segundos
+        """
+        histograma = self.histogramas.get(etapa)
+        if histograma is None:
+            histograma = self.histogramas[etapa] = Histograma(self.limites)
+        histograma.observar(duracao)
+
+    def contar(self, nome, quantidade=1):
+        """Soma `quantidade` ao contador `nome`."""
+        self.contadores[nome] = self.contadores.get(nome, 0) + quantidade
+
+    def limpar(self):
+        """Zera histogramas e contadores."""
+        self.histogramas.clear()
+        self.contadores.clear()
+
+    def para_dict(self):
+        """
+        Exporta as métricas em dicionário serializável em JSON.
+
+        Returns:
+            dict: {etapas: {etapa: {total, soma_s, media_s, p50_s, p95_s, p99_s, baldes}},
+                contadores: {...}}
+        """
+        etapas = {}
+        for etapa, histograma in sorted(self.histogramas.items()):
+            etapas[etapa] = {
+                'total': histograma.total,
+                'soma_s': histograma.soma,
+                'media_s': histograma.soma / histograma.total if histograma.total else 0.0,
+                'p50_s': histograma.percentil(50),
+                'p95_s': histograma.percentil(95),
+                'p99_s': histograma.percentil(99),
+                'baldes': {str(limite): acumulada for limite, acumulada
+                           in zip(histograma.limites + ('+Inf',), histograma.acumuladas())},
+            }
+        return {'etapas': etapas, 'contadores': dict(sorted(self.contadores.items()))}
+
+    def para_prometheus(self, prefixo='orientacao_carreiras'):
+        """
+        Exporta as métricas no formato de texto do Prometheus.
+
+        Args:
+            prefixo (str): Prefixo dos nomes das métricas
+
+        Returns:
+            str: Texto com um histograma (por etapa) e um contador por nome
+        """
+        linhas = []
+
+        if self.histogramas:
+            nome = f"{prefixo}_etapa_segundos"
+            linhas.append(f"# HELP {nome} Duração das etapas do sistema de recomendação.")
+            linhas.append(f"# TYPE {nome} histogram")
+            for etapa, histograma in sorted(self.histogramas.items()):
+                for limite, acumulada in zip(histograma.limites + ('+Inf',),
+                                             histograma.acumuladas()):
+                    linhas.append(f'{nome}_bucket{{etapa="{etapa}",le="{limite}"}} {acumulada}')
+                linhas.append(f'{nome}_sum{{etapa="{etapa}"}} {histograma.soma!r}')
+                linhas.append(f'{nome}_count{{etapa="{etapa}"}} {histograma.total}')
+
+        for contador, valor in sorted(self.contadores.items()):
+            nome = f"{prefixo}_{contador}_total"
+            linhas.append(f"# TYPE {nome} counter")
+            linhas.append(f"{nome} {valor}")
+
+        return '\n'.join(linhas) + '\n'
+
+    def __repr__(self):
+        return f"Metricas(etapas={len(self.histogramas)}, contadores={len(self.contadores)})"
@@ -0,0 +1,435 @@
+# Matriz de pesos (competências x carreiras) para cálculo de compatibilidade em lote.
+
+import heapq
+from array import array
+
+from .carreira import Carreira
+from .vocabulario import VOCABULARIO, CompetenciasCompactas
+
+# Nível máximo de uma competência
+NIVEL_MAXIMO = 5
+
+# Fração do catálogo a partir da qual ordenar tudo é mais rápido que o heap
+# (medido com `python -m orientacao_carreiras.bench top_k`)
+FRACAO_TOP_K_HEAP = 0.03
+
+
+def selecionar_melhores(compatibilidades, limite):
+    """
+    Retorna os índices das `limite` maiores compatibilidades, da maior para a menor.
+
+    Em caso de empate vence o menor índice, ou seja, o resultado é sempre igual
+    a uma ordenação estável decrescente seguida de [:limite]. Para limites
+    pequenos em relação ao catálogo usa seleção parcial com heap (O(n log k));
+    caso contrário, ou com limite não positivo, faz a ordenação completa.
+
+    Args:
+        compatibilidades (list): Compatibilidade de cada carreira
+        limite (int): Número de itens desejados
+
+    Returns:
+        list: Índices selecionados
+    """
+    total = len(compatibilidades)
+
+    if 0 < limite < total * FRACAO_TOP_K_HEAP:
+        return heapq.nlargest(limite, range(total), key=compatibilidades.__getitem__)
+
+    indices = sorted(range(total), key=compatibilidades.__getitem__, reverse=True)
+    return indices[:limite]
+
+
+def selecionar_esparso(pontos, pontos_maximos, limite):
+    """
+    Seleciona as melhores carreiras a partir dos pontos das carreiras pontuadas.
+
+    Carreiras ausentes de `pontos` têm compatibilidade 0. O resultado é o
+    mesmo de calcular a compatibilidade de todas as carreiras e usar
+    selecionar_melhores, mas só arredonda e compara as carreiras pontuadas.
+
+    Args:
+        pontos (dict): {indice_carreira: pontos} das carreiras pontuadas
+        pontos_maximos (sequence): Pontuação máxima de cada carreira
+        limite (int): Número de itens desejados
+
+    Returns:
+        list: Tuplas (indice_carreira, compatibilidade), da maior para a menor
+    """
+    if limite <= 0:
+        compatibilidades = [round((pontos.get(i, 0) / m) * 100, 1) if m else 0
+                            for i, m in enumerate(pontos_maximos)]
+        return [(i, compatibilidades[i]) for i in selecionar_melhores(compatibilidades, limite)]
+
+    # (compatibilidade, -indice): em empates vence o menor índice
+    positivas = []
+    for indice, valor in pontos.items():
+        compatibilidade = round((valor / pontos_maximos[indice]) * 100, 1)
+        if compatibilidade > 0:
+            positivas.append((compatibilidade, -indice))
+
+    resultado = [(-i, c) for c, i in heapq.nlargest(limite, positivas)]
+
+    # Completa com carreiras sem pontos, na ordem do catálogo
+    if len(resultado) < limite:
+        escolhidas = {indice for indice, _ in resultado}
+        for indice, maximo in enumerate(pontos_maximos):
+            if len(resultado) == limite:
+                break
+            if indice not in escolhidas:
+                resultado.append((indice, 0.0 if maximo else 0))
+
+    return resultado
+
+
+
+class MatrizPesos:
+    """
+    Catálogo de carreiras compilado em uma matriz de pesos competência x carreira.
+
+    Cada linha corresponde a uma competência e guarda apenas as carreiras que
+    a exigem (formato esparso), com o peso do requisito (3 essencial,
+    2 importante, 1 desejável). As linhas funcionam também como índice
+    invertido competência -> carreiras. Multiplicar o vetor de níveis de um
+    perfil pela matriz fornece os pontos do perfil em todas as carreiras.
+
+    A matriz se registra como observadora das carreiras e é atualizada
+    incrementalmente quando um requisito é adicionado com
+    Carreira.adicionar_competencia_*.
+
+    As linhas também ficam acessíveis pelo id da competência no vocabulário,
+    o que permite pontuar perfis compactos e vetores de níveis sem
+    consultar nomes.
+
+    Atributos:
+        carreiras (list): Carreiras na ordem das colunas da matriz
+        vocabulario (VocabularioCompetencias): Vocabulário dos ids das linhas
+        linhas (dict): {nome_competencia: {indice_carreira: peso}}
+        linhas_id (list): Mesmas linhas indexadas pelo id (None se vazia)
+        pontos_maximos (list): Pontuação máxima de cada carreira
+        versao (int): Incrementada a cada alteração do catálogo
+    """
+
+    def __init__(self, carreiras, vocabulario=None):
+        """
+        Compila as carreiras na matriz.
+
+        Args:
+            carreiras (list): Lista de objetos Carreira
+            vocabulario (VocabularioCompetencias): Vocabulário (padrão: VOCABULARIO)
+        """
+        self.carreiras = []
+        self.vocabulario = vocabulario if vocabulario is not None else VOCABULARIO
+        self.linhas = {}
+        self.linhas_id = []
+        self.pontos_maximos = []
+        self.versao = 0
+        self._posicoes = {}   # {id(carreira): [indices]}
+        self._limites = {}    # Cache de limite_superior por competência
+
+        for carreira in carreiras:
+            self.adicionar_carreira(carreira)
+
+    @classmethod
+    def de_csr(cls, carreiras, vocabulario, inicios, indices, pesos, pontos_maximos):
+        """
+        Monta a matriz a partir de linhas já compiladas em vetores CSR.
+
+        A linha do id i do vocabulário é formada pelas carreiras
+        indices[inicios[i]:inicios[i + 1]] com os pesos correspondentes. As
+        carreiras não são compiladas; elas precisam ter exatamente os
+        requisitos descritos pelos vetores (ex.: CatalogoCompilado).
+
+        Args:
+            carreiras (list): Carreiras na ordem das colunas
+            vocabulario (VocabularioCompetencias): Vocabulário dos ids das linhas
+            inicios (sequence): Início de cada linha em indices/pesos (len = linhas + 1)
+            indices (sequence): Índice da carreira de cada célula
+            pesos (sequence): Peso de cada célula
+            pontos_maximos (sequence): Pontuação máxima de cada carreira
+
+        Returns:
+            MatrizPesos: Matriz equivalente à compilada a partir das carreiras
+        """
+        matriz = cls([], vocabulario)
+        matriz.carreiras = list(carreiras)
+        matriz.pontos_maximos = list(pontos_maximos)
+        nomes = vocabulario.nomes
+
+        for id_competencia in range(len(inicios) - 1):
+            inicio, fim = inicios[id_competencia], inicios[id_competencia + 1]
+            linha = dict(zip(indices[inicio:fim], pesos[inicio:fim])) if fim > inicio else None
+            if linha:
+                matriz.linhas[nomes[id_competencia]] = linha
+            matriz.linhas_id.append(linha)
+
+        for indice, carreira in enumerate(matriz.carreiras):
+            matriz._posicoes.setdefault(id(carreira), []).append(indice)
+            carreira.registrar_observador(matriz._ao_adicionar_requisito)
+
+        matriz.versao = 1
+        return matriz
+
+    def para_csr(self):
+        """
+        Converte as linhas da matriz em vetores CSR (inverso de de_csr).
+
+        A linha do id i do vocabulário ocupa indices[inicios[i]:inicios[i + 1]]
+        e pesos[inicios[i]:inicios[i + 1]].
+
+        Returns:
+            dict: {'inicios', 'indices', 'pesos', 'maximos'}, cada um um array('I')
+        """
+        inicios = array('I', [0])
+        indices = array('I')
+        pesos = array('I')
+
+        for linha in self.linhas_id:
+            if linha:
+                indices.extend(linha.keys())
+                pesos.extend(linha.values())
+            inicios.append(len(indices))
+
+        return {
+            'inicios': inicios,
+            'indices': indices,
+            'pesos': pesos,
+            'maximos': array('I', self.pontos_maximos),
+        }
+
+    def adicionar_carreira(self, carreira):
+        """
+        Adiciona uma carreira como nova coluna da matriz.
+
+        Args:
+            carreira (Carreira): Carreira a indexar
+
+        Returns:
+            int: Índice da coluna criada
+        """
+        indice = len(self.carreiras)
+        self.carreiras.append(carreira)
+        self.pontos_maximos.append(0)
+        self._posicoes.setdefault(id(carreira), []).append(indice)
+
+        requisitos = carreira.compilar()
+        for competencia, peso in zip(requisitos.competencias, requisitos.pesos):
+            self._adicionar_peso(indice, competencia, peso)
+            # A nova coluna pode aumentar o limite superior da competência
+            self._limites.pop(competencia, None)
+
+        carreira.registrar_observador(self._ao_adicionar_requisito)
+        self.versao += 1
+        return indice
+
+    def _adicionar_peso(self, indice, competencia, peso):
+        # Soma o peso na célula (competencia, carreira) e no máximo da carreira.
+        linha = self.linhas.get(competencia)
+        if linha is None:
+            linha = self.linhas[competencia] = {}
+            id_competencia = self.vocabulario.obter_id(competencia)
+            if id_competencia >= len(self.linhas_id):
+                self.linhas_id.extend([None] * (id_competencia + 1 - len(self.linhas_id)))
+            self.linhas_id[id_competencia] = linha
+
+        linha[indice] = linha.get(indice, 0) + peso
+        self.pontos_maximos[indice] += NIVEL_MAXIMO * peso
+
+    def _ao_adicionar_requisito(self, carreira, categoria, competencia):
+        # Observador das carreiras: atualiza apenas as células afetadas.
+        peso = dict(Carreira.PESOS_REQUISITOS)[categoria]
+
+        for indice in self._posicoes.get(id(carreira), ()):
+            self._adicionar_peso(indice, competencia, peso)
+
+        # O máximo da carreira mudou, então os limites das suas competências também
+        for nome in carreira.compilar().competencias:
+            self._limites.pop(nome, None)
+
+        self.versao += 1
+
+    def desconectar(self):
+        """Deixa de observar as carreiras (usar ao descartar a matriz)."""
+        for carreira in self.carreiras:
+            carreira.remover_observador(self._ao_adicionar_requisito)
+
+    def limite_superior(self, competencia):
+        """
+        Maior contribuição possível, por nível, de uma competência na compatibilidade.
+
+        Para qualquer carreira, a compatibilidade é no máximo a soma de
+        nivel * limite_superior(competencia) das competências em comum com o perfil.
+
+        Args:
+            competencia (str): Nome da competência
+
+        Returns:
+            float: Pontos percentuais por nível (0 se nenhuma carreira a exige)
+        """
+        limite = self._limites.get(competencia)
+
+        if limite is None:
+            linha = self.linhas.get(competencia)
+            if not linha:
+                return 0
+            limite = max(peso / self.pontos_maximos[indice]
+                         for indice, peso in linha.items()) * 100
+            self._limites[competencia] = limite
+
+        return limite
+
+    def pontuar_esparso(self, perfil_usuario):
+        """
+        Multiplica o vetor de níveis do perfil pela matriz de pesos.
+
+        Args:
+            perfil_usuario (Perfil): Perfil do usuário
+
+        Returns:
+            dict: {indice_carreira: pontos} só das carreiras com pontos
+        """
+        competencias = perfil_usuario.competencias
+
+        # Perfil compacto no mesmo vocabulário: usa os ids, sem consultar nomes
+        if (isinstance(competencias, CompetenciasCompactas)
+                and competencias.vocabulario is self.vocabulario):
+            return self.pontuar_niveis_esparso(competencias.niveis)
+
+        pontos = {}
+        linhas = self.linhas
+
+        for competencia, nivel in competencias.items():
+            linha = linhas.get(competencia)
+            if linha and nivel:
+                for indice, peso in linha.items():
+                    pontos[indice] = pontos.get(indice, 0) + nivel * peso
+
+        return pontos
+
+    def linhas_alinhadas(self, vocabulario):
+        """
+        Retorna as linhas da matriz na ordem dos ids de outro vocabulário.
+
+        Args:
+            vocabulario (VocabularioCompetencias): Vocabulário dos vetores de níveis
+
+        Returns:
+            list: Linha de cada id (None se nenhuma carreira exige a competência)
+        """
+        if vocabulario is self.vocabulario:
+            return self.linhas_id
+        return [self.linhas.get(nome) for nome in vocabulario.nomes]
+
+    def pontuar_niveis_esparso(self, niveis, linhas_id=None):
+        """
+        Multiplica um vetor de níveis indexado pelo id da competência pela matriz.
+
+        Args:
+            niveis (sequence): Níveis por id no vocabulário (array, bytes, memoryview...)
+            linhas_id (list): Linhas alinhadas ao vocabulário dos níveis
+                (padrão: vocabulário da matriz; ver linhas_alinhadas)
+
+        Returns:
+            dict: {indice_carreira: pontos} só das carreiras com pontos
+        """
+        pontos = {}
+        if linhas_id is None:
+            linhas_id = self.linhas_id
+
+        for id_competencia, nivel in enumerate(niveis[:len(linhas_id)]):
+            if nivel:
+                linha = linhas_id[id_competencia]
+                if linha:
+                    for indice, peso in linha.items():
+                        pontos[indice] = pontos.get(indice, 0) + nivel * peso
+
+        return pontos
+
+    def densificar(self, pontos):
+        """
+        Converte pontos esparsos em uma lista com todas as carreiras.
+
+        Args:
+            pontos (dict): {indice_carreira: pontos}, como em pontuar_esparso
+
+        Returns:
+            list: Pontos de cada carreira, na ordem do catálogo (0 se ausente)
+        """
+        densos = [0] * len(self.carreiras)
+        for indice, valor in pontos.items():
+            densos[indice] = valor
+        return densos
+
+    def pontuar(self, perfil_usuario):
+        """
+        Retorna os pontos do perfil em cada carreira (vetor de níveis x matriz).
+
+        Args:
+            perfil_usuario (Perfil): Perfil do usuário
+
+        Returns:
+            list: Pontos inteiros do perfil em cada carreira
+        """
+        return self.densificar(self.pontuar_esparso(perfil_usuario))
+
+    def pontuar_niveis(self, niveis, linhas_id=None):
+        """
+        Retorna os pontos de um vetor de níveis (indexado por id) em cada carreira.
+
+        Args:
+            niveis (sequence): Níveis por id no vocabulário
+            linhas_id (list): Linhas alinhadas ao vocabulário dos níveis
+
+        Returns:
+            list: Pontos inteiros em cada carreira
+        """
+        return self.densificar(self.pontuar_niveis_esparso(niveis, linhas_id))
+
+    def melhores(self, pontos, limite):
+        """
+        Seleciona as melhores carreiras a partir de pontos esparsos.
+
+        Args:
+            pontos (dict): Resultado de pontuar_esparso ou pontuar_niveis_esparso
+            limite (int): Número de carreiras
+
+        Returns:
+            list: Tuplas (carreira, compatibilidade), da maior para a menor
+        """
+        carreiras = self.carreiras
+        return [(carreiras[i], compatibilidade)
+                for i, compatibilidade in selecionar_esparso(pontos, self.pontos_maximos, limite)]
+
+    def compatibilidades_pontos(self, pontos):
+        """
+        Converte pontos por carreira em percentuais de compatibilidade.
+
+        Args:
+            pontos (list): Pontos inteiros em cada carreira
+
+        Returns:
+            list: Percentuais de compatibilidade (0-100), um por carreira
+        """
+        return [round((p / m) * 100, 1) if m else 0
+                for p, m in zip(pontos, self.pontos_maximos)]
+
+    def compatibilidades(self, perfil_usuario):
+        """
+        Calcula a compatibilidade do perfil com todas as carreiras.
+
+        Usa a mesma fórmula e arredondamento de
+        SistemaRecomendacao.calcular_compatibilidade, então os valores são
+        idênticos aos do cálculo individual.
+
+        Args:
+            perfil_usuario (Perfil): Perfil do usuário
+
+        Returns:
+            list: Percentuais de compatibilidade (0-100), um por carreira
+        """
+        return self.compatibilidades_pontos(self.pontuar(perfil_usuario))
+
+    def __len__(self):
+        return len(self.carreiras)
+
+    def __repr__(self):
+        return f"MatrizPesos(competencias={len(self.linhas)}, carreiras={len(self.carreiras)})"
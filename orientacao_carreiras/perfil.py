@@ -1,6 +1,18 @@
 # Classe Perfil = o perfil profissional de um usuário.
 
-from datetime import datetime
+import time
+from functools import lru_cache
+from .vocabulario import CompetenciasCompactas
+
+# Formato de data_criacao em to_dict/from_dict
+FORMATO_DATA = '%Y-%m-%d %H:%M:%S'
+
+
+@lru_cache(maxsize=4096)
+def _formatar_data(timestamp):
+    # Formata um timestamp (hora local); perfis criados no mesmo segundo reaproveitam o texto.
+    return time.strftime(FORMATO_DATA, time.localtime(timestamp))
+
 
 class Perfil:
     """
@@ -15,9 +27,19 @@ class Perfil:
         data_criacao (datetime): Data de criação do perfil
     """
     
+    # Sem __dict__ por instância: reduz a memória de lotes com milhões de perfis
+    __slots__ = ('nome', 'idade', 'area_atuacao', 'competencias',
+                 '_objetivos', '_data_criacao', '_observadores')
+    
     # Tupla com níveis válidos
     NIVEIS_VALIDOS = (1, 2, 3, 4, 5)
     
+    # Competências consideradas em nivel_preparacao_futuro
+    COMPETENCIAS_PREPARACAO = (
+        'programacao', 'analise_dados', 'criatividade',
+        'adaptabilidade', 'lideranca', 'comunicacao'
+    )
+    
     def __init__(self, nome, idade=0, area_atuacao=""):
         """
         Inicializa um perfil.
@@ -31,8 +53,48 @@ class Perfil:
         self.idade = idade
         self.area_atuacao = area_atuacao
         self.competencias = {}  # Dicionário: {nome_competencia: nivel}
-        self.objetivos = []     # Lista de objetivos
-        self.data_criacao = datetime.now()
+        self._objetivos = None  # Lista de objetivos, criada só quando usada
+        self._data_criacao = int(time.time())  # Segundos desde a época (epoch)
+        self._observadores = None  # Funções avisadas quando uma competência muda
+    
+    @property
+    def objetivos(self):
+        """Lista de objetivos profissionais (alocada no primeiro acesso)."""
+        if self._objetivos is None:
+            self._objetivos = []
+        return self._objetivos
+    
+    @objetivos.setter
+    def objetivos(self, objetivos):
+        self._objetivos = list(objetivos)
+    
+    def obter_objetivos(self):
+        """
+        Retorna os objetivos profissionais sem alocar a lista de objetivos.
+        
+        Returns:
+            tuple: Objetivos, na ordem em que foram adicionados (vazia se não houver)
+        """
+        return tuple(self._objetivos) if self._objetivos else ()
+    
+    @property
+    def data_criacao(self):
+        """Data de criação do perfil como datetime (hora local)."""
+        from datetime import datetime
+        
+        return datetime.fromtimestamp(self._data_criacao)
+    
+    @data_criacao.setter
+    def data_criacao(self, data):
+        # datetime informado (sem importar o módulo datetime aqui): usa o seu timestamp
+        if hasattr(data, 'timestamp'):
+            data = data.timestamp()
+        self._data_criacao = int(data)
+    
+    @property
+    def timestamp_criacao(self):
+        """Data de criação em segundos desde a época (epoch)."""
+        return self._data_criacao
     
     def adicionar_competencia(self, nome_competencia, nivel):
         """
@@ -45,12 +107,44 @@ class Perfil:
         if nivel not in self.NIVEIS_VALIDOS:
             raise ValueError(f"Nível deve ser um dos: {self.NIVEIS_VALIDOS}")
         
+        nivel_anterior = self.competencias.get(nome_competencia, 0)
         self.competencias[nome_competencia] = nivel
+        if self._observadores and nivel != nivel_anterior:
+            self._notificar(nome_competencia, nivel_anterior, nivel)
     
     def remover_competencia(self, nome_competencia):
         """Remove uma competência do perfil."""
         if nome_competencia in self.competencias:
+            nivel_anterior = self.competencias[nome_competencia]
             del self.competencias[nome_competencia]
+            if self._observadores:
+                self._notificar(nome_competencia, nivel_anterior, 0)
+    
+    def registrar_observador(self, observador):
+        """
+        Registra uma função chamada quando o nível de uma competência muda.
+        
+        Só alterações feitas com adicionar_competencia e remover_competencia
+        são avisadas (não escritas diretas em self.competencias).
+        
+        Args:
+            observador (callable): Recebe (perfil, competencia, nivel_anterior, nivel_novo),
+                com nível 0 para competência ausente
+        """
+        if self._observadores is None:
+            self._observadores = []
+        if observador not in self._observadores:
+            self._observadores.append(observador)
+    
+    def remover_observador(self, observador):
+        """Remove uma função registrada com registrar_observador."""
+        if self._observadores and observador in self._observadores:
+            self._observadores.remove(observador)
+    
+    def _notificar(self, nome_competencia, nivel_anterior, nivel):
+        # Avisa os observadores sobre a mudança de nível de uma competência.
+        for observador in list(self._observadores):
+            observador(self, nome_competencia, nivel_anterior, nivel)
     
     def obter_nivel_competencia(self, nome_competencia):
         """
@@ -112,15 +206,23 @@ class Perfil:
         Returns:
             tuple: (percentual, classificacao)
         """
-        competencias_futuro = [
-            'programacao', 'analise_dados', 'criatividade', 
-            'adaptabilidade', 'lideranca', 'comunicacao'
-        ]
-        
-        total_possivel = len(competencias_futuro) * 5
         total_atual = sum(self.obter_nivel_competencia(comp) 
-                         for comp in competencias_futuro)
+                         for comp in self.COMPETENCIAS_PREPARACAO)
+        
+        return self.classificar_preparacao(total_atual)
+    
+    @classmethod
+    def classificar_preparacao(cls, total_atual):
+        """
+        Converte a soma dos níveis das competências de futuro em (percentual, classificacao).
         
+        Args:
+            total_atual (int): Soma dos níveis de COMPETENCIAS_PREPARACAO
+            
+        Returns:
+            tuple: (percentual, classificacao)
+        """
+        total_possivel = len(cls.COMPETENCIAS_PREPARACAO) * 5
         percentual = (total_atual / total_possivel) * 100
         
         if percentual >= 80:
@@ -141,21 +243,94 @@ class Perfil:
         return f"Perfil(nome='{self.nome}', competencias={len(self.competencias)})"
     
     def to_dict(self):
-        """Converte o perfil para dicionário."""
-        percentual, classificacao = self.nivel_preparacao_futuro()
+        """
+        Converte o perfil para dicionário.
+        
+        Competências e objetivos são cópias; score, média e preparação saem
+        de uma única leitura das competências.
+        """
+        competencias = dict(self.competencias)
+        score = sum(competencias.values())
+        percentual, classificacao = self.classificar_preparacao(
+            sum(competencias.get(comp, 0) for comp in self.COMPETENCIAS_PREPARACAO))
         
         return {
             'nome': self.nome,
             'idade': self.idade,
             'area_atuacao': self.area_atuacao,
-            'competencias': self.competencias,
-            'objetivos': self.objetivos,
-            'data_criacao': self.data_criacao.strftime('%Y-%m-%d %H:%M:%S'),
-            'total_competencias': len(self.competencias),
-            'score_total': self.calcular_score_total(),
-            'media_competencias': round(self.calcular_media_competencias(), 2),
+            'competencias': competencias,
+            'objetivos': list(self._objetivos) if self._objetivos is not None else [],
+            'data_criacao': _formatar_data(self._data_criacao),
+            'total_competencias': len(competencias),
+            'score_total': score,
+            'media_competencias': round(score / len(competencias), 2) if competencias else 0,
             'preparacao_futuro': {
                 'percentual': round(percentual, 1),
                 'classificacao': classificacao
             }
-        }
\ No newline at end of file
+        }
+    
+    @classmethod
+    def from_dict(cls, dados):
+        """
+        Cria um perfil a partir de um dicionário de to_dict.
+        
+        Os campos calculados (score, média, preparação) são ignorados;
+        data_criacao é opcional (texto no FORMATO_DATA ou timestamp).
+        
+        Args:
+            dados (dict): Dicionário com nome, idade, area_atuacao, competencias e objetivos
+            
+        Returns:
+            Perfil: Perfil reconstruído
+        """
+        perfil = cls(dados['nome'], dados.get('idade', 0), dados.get('area_atuacao', ''))
+        for competencia, nivel in dados.get('competencias', {}).items():
+            perfil.adicionar_competencia(competencia, nivel)
+        if dados.get('objetivos'):
+            perfil.objetivos = dados['objetivos']
+        
+        data = dados.get('data_criacao')
+        if isinstance(data, str):
+            perfil.data_criacao = time.mktime(time.strptime(data, FORMATO_DATA))
+        elif data is not None:
+            perfil.data_criacao = data
+        return perfil
+    
+    def to_bytes(self):
+        """Codifica o perfil no formato binário de serializacao."""
+        from .serializacao import codificar
+        
+        return codificar(self)
+    
+    @classmethod
+    def from_bytes(cls, dados):
+        """Cria um perfil a partir do resultado de to_bytes."""
+        from .serializacao import decodificar_perfil
+        
+        return decodificar_perfil(dados, cls)
+
+
+class PerfilCompacto(Perfil):
+    """
+    Perfil que guarda as competências em CompetenciasCompactas.
+    
+    Em vez de um dicionário por usuário, os níveis ficam em um vetor de bytes
+    indexado pelo id da competência no vocabulário. Os métodos de Perfil
+    funcionam da mesma forma.
+    """
+    
+    __slots__ = ()
+    
+    def __init__(self, nome, idade=0, area_atuacao="", vocabulario=None):
+        """
+        Inicializa um perfil compacto.
+        
+        Args:
+            nome (str): Nome do usuário
+            idade (int): Idade do usuário
+            area_atuacao (str): Área atual de atuação
+            vocabulario (VocabularioCompetencias): Vocabulário dos ids (padrão: global)
+        """
+        super().__init__(nome, idade, area_atuacao)
+        self.competencias = CompetenciasCompactas(vocabulario)
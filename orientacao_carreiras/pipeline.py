@@ -0,0 +1,275 @@
+# Pipeline de recomendação em lote (não interativo) para arquivos JSONL/CSV.
+#
+# Os perfis passam por geradores encadeados: leitura -> validação -> lotes
+# -> pontuação -> gaps -> serialização. Só um lote fica em memória por vez,
+# então o tamanho do arquivo não é limitado pela RAM.
+#
+# Formato de entrada (uma linha por perfil):
+#   JSONL: {"nome": "Ana", "idade": 30, "area_atuacao": "TI",
+#           "competencias": {"programacao": 4}, "objetivos": ["Empreender"]}
+#   CSV:   colunas nome, idade, area_atuacao, competencias, objetivos, com
+#          competencias no formato "programacao:4;design:3" e objetivos
+#          separados por "|"
+
+import csv
+import json
+
+from .instrumentacao import relogio
+from .perfil import Perfil
+from .validadores import validar_nome, validar_idade, validar_nivel, validar_area_atuacao
+
+# Tamanho padrão do lote de perfis pontuados de uma vez
+TAMANHO_LOTE_PADRAO = 1000
+
+
+def _ler_jsonl(arquivo):
+    # Gera os registros de um arquivo JSONL, ignorando linhas vazias.
+    for numero, linha in enumerate(arquivo, 1):
+        linha = linha.strip()
+        if not linha:
+            continue
+        try:
+            registro = json.loads(linha)
+        except json.JSONDecodeError as erro:
+            registro = {'_erro': f"JSON inválido: {erro.msg}"}
+        if not isinstance(registro, dict):
+            registro = {'_erro': "Cada linha deve ser um objeto JSON"}
+        yield numero, registro
+
+
+def _ler_csv(arquivo):
+    # Gera os registros de um arquivo CSV, convertendo as colunas compostas.
+    for numero, linha in enumerate(csv.DictReader(arquivo), 2):
+        registro = dict(linha)
+        try:
+            if registro.get('idade'):
+                registro['idade'] = int(registro['idade'])
+            competencias = {}
+            for item in (registro.get('competencias') or '').split(';'):
+                if item.strip():
+                    nome, nivel = item.split(':')
+                    competencias[nome.strip()] = int(nivel)
+            registro['competencias'] = competencias
+        except ValueError:
+            registro = {'_erro': "Valores numéricos inválidos"}
+        objetivos = registro.get('objetivos') or ''
+        registro['objetivos'] = [o.strip() for o in objetivos.split('|') if o.strip()]
+        yield numero, registro
+
+
+def ler_registros(arquivo, formato='jsonl'):
+    """
+    Lê registros de perfis de um arquivo aberto.
+
+    Args:
+        arquivo (file): Arquivo de texto aberto para leitura
+        formato (str): 'jsonl' ou 'csv'
+
+    Yields:
+        tuple: (numero_linha, registro)
+    """
+    if formato == 'csv':
+        return _ler_csv(arquivo)
+    if formato == 'jsonl':
+        return _ler_jsonl(arquivo)
+    raise ValueError(f"Formato não suportado: {formato}")
+
+
+def validar_registro(registro):
+    """
+    Valida um registro e cria o Perfil correspondente.
+
+    Args:
+        registro (dict): Registro lido da entrada
+
+    Returns:
+        tuple: (perfil ou None, lista de mensagens de erro)
+    """
+    if '_erro' in registro:
+        return None, [registro['_erro']]
+
+    erros = []
+    nome = registro.get('nome')
+    idade = registro.get('idade')
+    area = registro.get('area_atuacao') or ''
+
+    valido, mensagem = validar_nome(nome)
+    if not valido:
+        erros.append(mensagem)
+
+    valido, mensagem = validar_idade(idade)
+    if not valido:
+        erros.append(mensagem)
+
+    if area:
+        valido, mensagem = validar_area_atuacao(area)
+        if not valido:
+            erros.append(mensagem)
+
+    competencias = registro.get('competencias') or {}
+    if not isinstance(competencias, dict):
+        erros.append("Competências devem ser um objeto {nome: nivel}")
+        competencias = {}
+
+    for competencia, nivel in competencias.items():
+        if not isinstance(competencia, str) or not competencia.strip():
+            erros.append(f"Nome de competência inválido: {competencia!r}")
+            continue
+        valido, mensagem = validar_nivel(nivel)
+        if not valido:
+            erros.append(f"{competencia}: {mensagem}")
+
+    objetivos = registro.get('objetivos') or []
+    if not isinstance(objetivos, list) or not all(
+            isinstance(objetivo, str) and objetivo.strip() for objetivo in objetivos):
+        erros.append("Objetivos devem ser uma lista de textos não vazios")
+
+    if erros:
+        return None, erros
+
+    perfil = Perfil(nome.strip(), idade, area.strip())
+    for competencia, nivel in competencias.items():
+        perfil.adicionar_competencia(competencia, nivel)
+    for objetivo in objetivos:
+        perfil.adicionar_objetivo(objetivo)
+
+    return perfil, []
+
+
+def validar_registros(registros, metricas=None):
+    """
+    Valida os registros lidos.
+
+    Args:
+        registros (iterable): Tuplas (numero_linha, registro)
+        metricas (Metricas): Registra o tempo da etapa 'validacao' (opcional)
+
+    Yields:
+        tuple: (numero_linha, perfil ou None, erros)
+    """
+    if metricas is None:
+        for numero, registro in registros:
+            perfil, erros = validar_registro(registro)
+            yield numero, perfil, erros
+        return
+
+    for numero, registro in registros:
+        inicio = relogio()
+        perfil, erros = validar_registro(registro)
+        metricas.registrar('validacao', relogio() - inicio)
+        metricas.contar('registros_invalidos' if erros else 'registros_validos')
+        yield numero, perfil, erros
+
+
+def em_lotes(itens, tamanho):
+    """
+    Agrupa um iterável em listas de até `tamanho` itens.
+
+    Args:
+        itens (iterable): Itens de entrada
+        tamanho (int): Tamanho máximo de cada lote
+
+    Yields:
+        list: Lote de itens
+    """
+    if tamanho < 1:
+        raise ValueError("Tamanho do lote deve ser pelo menos 1")
+
+    lote = []
+    for item in itens:
+        lote.append(item)
+        if len(lote) == tamanho:
+            yield lote
+            lote = []
+    if lote:
+        yield lote
+
+
+def recomendar_lotes(lotes, sistema, limite=3):
+    """
+    Pontua os perfis válidos de cada lote e calcula os gaps da melhor carreira.
+
+    Args:
+        lotes (iterable): Listas de (numero_linha, perfil ou None, erros)
+        sistema (SistemaRecomendacao): Sistema de recomendação
+        limite (int): Número de recomendações por perfil
+
+    Yields:
+        dict: Resultado de cada registro, na ordem da entrada
+    """
+    for lote in lotes:
+        perfis = [perfil for _, perfil, _ in lote if perfil is not None]
+        recomendacoes = iter(sistema.recomendar_carreiras_lote(perfis, limite))
+
+        for numero, perfil, erros in lote:
+            if perfil is None:
+                yield {'linha': numero, 'erros': erros}
+                continue
+
+            melhores = next(recomendacoes)
+            gaps = sistema.identificar_gaps(perfil, melhores[0][0]) if melhores else []
+            yield {
+                'linha': numero,
+                'nome': perfil.nome,
+                'recomendacoes': [{'carreira': carreira.nome, 'compatibilidade': compatibilidade}
+                                  for carreira, compatibilidade in melhores],
+                'areas_desenvolver': gaps,
+            }
+
+
+def _contar(resultados, totais):
+    # Repassa os resultados atualizando os totais de válidos e inválidos.
+    for resultado in resultados:
+        totais['processados'] += 1
+        totais['invalidos' if 'erros' in resultado else 'validos'] += 1
+        yield resultado
+
+
+def serializar(resultados, metricas=None):
+    """Gera uma linha JSON (com quebra de linha) por resultado."""
+    if metricas is None:
+        for resultado in resultados:
+            yield json.dumps(resultado, ensure_ascii=False) + '\n'
+        return
+    
+    for resultado in resultados:
+        inicio = relogio()
+        linha = json.dumps(resultado, ensure_ascii=False) + '\n'
+        metricas.registrar('serializacao', relogio() - inicio)
+        yield linha
+
+
+def executar_recomendacao(caminho_entrada, caminho_saida, sistema,
+                          limite=3, tamanho_lote=TAMANHO_LOTE_PADRAO, formato=None):
+    """
+    Processa um arquivo de perfis e grava as recomendações em JSONL.
+
+    Args:
+        caminho_entrada (str): Arquivo .jsonl ou .csv de perfis
+        caminho_saida (str): Arquivo .jsonl de saída
+        sistema (SistemaRecomendacao): Sistema de recomendação
+        limite (int): Número de recomendações por perfil
+        tamanho_lote (int): Perfis pontuados por vez
+        formato (str): 'jsonl' ou 'csv' (padrão: pela extensão da entrada)
+
+    Com as métricas do sistema ativadas (SistemaRecomendacao.ativar_metricas),
+    também registra os tempos de validação e serialização.
+    
+    Returns:
+        dict: Totais {'processados', 'validos', 'invalidos'}
+    """
+    if formato is None:
+        formato = 'csv' if caminho_entrada.lower().endswith('.csv') else 'jsonl'
+
+    totais = {'processados': 0, 'validos': 0, 'invalidos': 0}
+
+    with open(caminho_entrada, encoding='utf-8', newline='') as entrada, \
+            open(caminho_saida, 'w', encoding='utf-8') as saida:
+        registros = ler_registros(entrada, formato)
+        lotes = em_lotes(validar_registros(registros, sistema.metricas), tamanho_lote)
+        resultados = recomendar_lotes(lotes, sistema, limite)
+
+        for linha in serializar(_contar(resultados, totais), sistema.metricas):
+            saida.write(linha)
+
+    return totais
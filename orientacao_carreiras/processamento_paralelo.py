@@ -0,0 +1,191 @@
+# Recomendação em lote com vários processos e catálogo em memória compartilhada.
+#
+# O catálogo compilado (MatrizPesos) é copiado uma única vez para um bloco de
+# multiprocessing.shared_memory em formato CSR (linha = competência):
+#   inicios -> posição inicial de cada competência em indices/pesos (V + 1)
+#   indices -> índice da carreira de cada célula não nula
+#   pesos   -> peso de cada célula não nula
+#   maximos -> pontuação máxima de cada carreira
+# (os vetores de MatrizPesos.para_csr)
+# Cada processo trabalhador se conecta ao bloco ao iniciar; as tarefas levam
+# apenas os vetores de níveis dos perfis e devolvem índices de carreiras.
+
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+
+from .matriz_pesos import selecionar_esparso
+
+# Tamanho padrão dos lotes enviados a cada processo
+TAMANHO_LOTE_PADRAO = 500
+
+# Ordem dos vetores dentro do bloco compartilhado
+_VETORES = ('inicios', 'indices', 'pesos', 'maximos')
+
+# Catálogo do processo trabalhador (preenchido por _iniciar_trabalhador)
+_catalogo = None
+
+
+class _CatalogoCompartilhado:
+    # Visão somente leitura dos vetores CSR dentro do bloco compartilhado.
+
+    def __init__(self, nome, tamanhos):
+        self.memoria = shared_memory.SharedMemory(name=nome)
+        visao = self.memoria.buf.cast('I')
+
+        posicao = 0
+        for chave in _VETORES:
+            setattr(self, chave, visao[posicao:posicao + tamanhos[chave]])
+            posicao += tamanhos[chave]
+
+    def recomendar(self, niveis, limite):
+        # Pontua um vetor de níveis e devolve [(indice_carreira, compatibilidade)].
+        inicios, indices, pesos = self.inicios, self.indices, self.pesos
+        pontos = {}
+
+        for id_competencia, nivel in enumerate(niveis[:len(inicios) - 1]):
+            if nivel:
+                for j in range(inicios[id_competencia], inicios[id_competencia + 1]):
+                    indice = indices[j]
+                    pontos[indice] = pontos.get(indice, 0) + nivel * pesos[j]
+
+        return selecionar_esparso(pontos, self.maximos, limite)
+
+
+def _iniciar_trabalhador(nome, tamanhos):
+    # Conecta o processo trabalhador ao catálogo compartilhado.
+    global _catalogo
+    _catalogo = _CatalogoCompartilhado(nome, tamanhos)
+
+
+def _recomendar_lote(vetores, limite):
+    # Tarefa executada no trabalhador para um lote de vetores de níveis.
+    return [_catalogo.recomendar(niveis, limite) for niveis in vetores]
+
+
+class RecomendadorParalelo:
+    """
+    Distribui a recomendação de muitos perfis entre vários processos.
+
+    O catálogo compilado do sistema é colocado em memória compartilhada
+    uma vez (não é reenviado a cada tarefa). Os perfis são divididos em
+    lotes e os resultados voltam na mesma ordem da entrada, idênticos aos
+    de recomendar_carreiras. Use como gerenciador de contexto ou chame
+    fechar() ao final.
+
+    Atributos:
+        sistema (SistemaRecomendacao): Sistema cujo catálogo é usado
+        trabalhadores (int): Número de processos
+        tamanho_lote (int): Perfis por tarefa
+    """
+
+    def __init__(self, sistema, trabalhadores=None, tamanho_lote=TAMANHO_LOTE_PADRAO):
+        """
+        Compartilha o catálogo e inicia os processos.
+
+        Args:
+            sistema (SistemaRecomendacao): Sistema de recomendação
+            trabalhadores (int): Número de processos (padrão: número de CPUs)
+            tamanho_lote (int): Perfis enviados por tarefa
+        """
+        if tamanho_lote < 1:
+            raise ValueError("Tamanho do lote deve ser pelo menos 1")
+
+        self.sistema = sistema
+        self.trabalhadores = trabalhadores or os.cpu_count() or 1
+        self.tamanho_lote = tamanho_lote
+
+        # Fotografia do catálogo: alterações posteriores exigem novo recomendador
+        self._matriz = sistema.obter_matriz()
+        self._carreiras = list(self._matriz.carreiras)
+
+        vetores = self._matriz.para_csr()
+        tamanhos = {chave: len(vetores[chave]) for chave in _VETORES}
+        total_bytes = max(1, sum(tamanhos.values()) * 4)
+
+        self._memoria = shared_memory.SharedMemory(create=True, size=total_bytes)
+        posicao = 0
+        for chave in _VETORES:
+            dados = vetores[chave].tobytes()
+            self._memoria.buf[posicao:posicao + len(dados)] = dados
+            posicao += len(dados)
+
+        try:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.trabalhadores,
+                initializer=_iniciar_trabalhador,
+                initargs=(self._memoria.name, tamanhos),
+            )
+        except Exception:
+            # Sem executor não há fechar(): libera o bloco aqui
+            self._memoria.close()
+            self._memoria.unlink()
+            raise
+
+    def _vetor_niveis(self, perfil):
+        # Converte o perfil em bytes de níveis indexados pelo id da competência.
+        vocabulario = self._matriz.vocabulario
+        niveis = bytearray(len(self._matriz.linhas_id))
+
+        for competencia, nivel in perfil.competencias.items():
+            id_competencia = vocabulario.buscar_id(competencia)
+            # Competências fora da matriz não pontuam em nenhuma carreira
+            if id_competencia is not None and id_competencia < len(niveis):
+                niveis[id_competencia] = nivel
+
+        return bytes(niveis)
+
+    def _lotes_vetores(self, perfis):
+        # Agrupa os vetores de níveis dos perfis em lotes.
+        lote = []
+        for perfil in perfis:
+            lote.append(self._vetor_niveis(perfil))
+            if len(lote) == self.tamanho_lote:
+                yield lote
+                lote = []
+        if lote:
+            yield lote
+
+    def recomendar(self, perfis, limite=3):
+        """
+        Gera recomendações para um fluxo de perfis, preservando a ordem.
+
+        No máximo 2 lotes por processo ficam pendentes ao mesmo tempo, então
+        a entrada pode ser um gerador maior que a memória.
+
+        Args:
+            perfis (iterable): Perfis dos usuários
+            limite (int): Número de recomendações por perfil
+
+        Yields:
+            list: Tuplas (carreira, compatibilidade) de cada perfil
+        """
+        pendentes = deque()
+        maximo_pendentes = 2 * self.trabalhadores
+
+        for lote in self._lotes_vetores(perfis):
+            pendentes.append(self._executor.submit(_recomendar_lote, lote, limite))
+            if len(pendentes) >= maximo_pendentes:
+                yield from self._converter(pendentes.popleft().result())
+
+        while pendentes:
+            yield from self._converter(pendentes.popleft().result())
+
+    def _converter(self, resultados):
+        # Troca os índices devolvidos pelos trabalhadores pelos objetos Carreira.
+        carreiras = self._carreiras
+        for recomendacoes in resultados:
+            yield [(carreiras[i], compatibilidade) for i, compatibilidade in recomendacoes]
+
+    def fechar(self):
+        """Encerra os processos e libera a memória compartilhada."""
+        self._executor.shutdown()
+        self._memoria.close()
+        self._memoria.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
@@ -0,0 +1,387 @@
+# Ranqueamento multiobjetivo: compatibilidade, crescimento, salário e objetivos.
+#
+# Cada pontuador produz, para cada carreira, um valor entre 0 e 1. A pontuação
+# final é a média ponderada desses valores (pesos configuráveis), em 0-100.
+#
+# Pontuadores estáticos (crescimento, salário, atratividade) não dependem do
+# perfil: as suas colunas são calculadas uma vez por versão do catálogo e
+# somadas, já com os pesos, em uma única coluna base, cuja ordem decrescente
+# também fica guardada. Pontuadores dinâmicos (compatibilidade, objetivos)
+# devolvem valores só para as carreiras que o perfil alcança, no formato
+# esparso de MatrizPesos.pontuar_esparso.
+#
+# Como valores e pesos não são negativos, uma carreira sem valor dinâmico tem
+# exatamente a pontuação base; as melhores carreiras estão entre as candidatas
+# dinâmicas e as primeiras da ordem base. Uma consulta custa
+# O(carreiras alcançadas + limite), qualquer que seja o número de sinais estáticos.
+
+import heapq
+import re
+import unicodedata
+from abc import ABC, abstractmethod
+from collections import namedtuple
+
+from .matriz_pesos import selecionar_melhores
+
+# Pesos usados quando nenhum é informado
+PESOS_PADRAO = {'compatibilidade': 0.6, 'crescimento': 0.15, 'salario': 0.15, 'objetivos': 0.1}
+
+# Valor de cada nível de Carreira.nivel_atratividade()
+VALORES_ATRATIVIDADE = {'Alta': 1.0, 'Média': 0.5, 'Baixa': 0.0}
+
+# Palavras dos objetivos e das carreiras comparadas pelo radical (prefixo)
+TAMANHO_RADICAL = 6
+TAMANHO_MINIMO_PALAVRA = 4
+PALAVRAS_IGNORADAS = frozenset({'para', 'como', 'mais', 'sobre', 'entre', 'atual'})
+
+_PALAVRA = re.compile(r'[a-z0-9]+')
+
+# Uma carreira do ranqueamento
+CarreiraRanqueada = namedtuple('CarreiraRanqueada', [
+    'carreira',         # Objeto Carreira
+    'pontuacao',        # Média ponderada dos pontuadores (0-100, uma casa decimal)
+    'compatibilidade',  # Compatibilidade do perfil, como em recomendar_carreiras
+    'componentes',      # {nome_pontuador: valor entre 0 e 1}
+])
+
+# Estado de um Ranqueador para uma versão da matriz
+_Preparacao = namedtuple('_Preparacao', ['matriz', 'versao', 'base', 'ordem', 'colunas', 'dados'])
+
+
+def radicais(texto):
+    """
+    Extrai os radicais das palavras de um texto (sem acentos, em minúsculas).
+
+    Args:
+        texto (str): Texto livre ou nome de competência (ex.: 'analise_dados')
+
+    Returns:
+        set: Prefixos de TAMANHO_RADICAL letras das palavras relevantes
+    """
+    texto = unicodedata.normalize('NFKD', texto.lower()).encode('ascii', 'ignore').decode('ascii')
+    return {palavra[:TAMANHO_RADICAL] for palavra in _PALAVRA.findall(texto)
+            if len(palavra) >= TAMANHO_MINIMO_PALAVRA and palavra not in PALAVRAS_IGNORADAS}
+
+
+def _normalizar_coluna(valores):
+    # Escala min-max para [0, 1]; coluna constante vira zeros (não altera a ordem).
+    minimo = min(valores, default=0)
+    amplitude = max(valores, default=0) - minimo
+    if not amplitude:
+        return [0.0] * len(valores)
+    return [(valor - minimo) / amplitude for valor in valores]
+
+
+class Pontuador(ABC):
+    """
+    Sinal de ranqueamento com um valor entre 0 e 1 por carreira.
+
+    Não é usado diretamente: pontuadores novos herdam de PontuadorEstatico
+    (valor fixo por carreira) ou de PontuadorDinamico (valor que depende do perfil).
+
+    Atributos:
+        nome (str): Nome usado nos pesos e nos componentes do resultado
+        estatico (bool): True se o valor não depende do perfil
+    """
+
+    nome = None
+    estatico = True
+
+    def __repr__(self):
+        return f"{type(self).__name__}(nome='{self.nome}')"
+
+
+class PontuadorEstatico(Pontuador):
+    """Pontuador cujo valor não depende do perfil (calculado uma vez por catálogo)."""
+
+    estatico = True
+
+    @abstractmethod
+    def coluna(self, matriz):
+        """
+        Calcula o valor de todas as carreiras.
+
+        Args:
+            matriz (MatrizPesos): Catálogo compilado
+
+        Returns:
+            list: Valores entre 0 e 1, na ordem de matriz.carreiras
+        """
+
+
+class PontuadorDinamico(Pontuador):
+    """Pontuador cujo valor depende do perfil (calculado a cada consulta)."""
+
+    estatico = False
+
+    def preparar(self, matriz):
+        """
+        Pré-processa o catálogo para pontuar().
+
+        Args:
+            matriz (MatrizPesos): Catálogo compilado
+
+        Returns:
+            object: Dados repassados a pontuar() enquanto a matriz não mudar
+        """
+        return None
+
+    @abstractmethod
+    def pontuar(self, perfil, matriz, pontos, dados):
+        """
+        Calcula o valor das carreiras alcançadas pelo perfil.
+
+        Args:
+            perfil (Perfil): Perfil do usuário
+            matriz (MatrizPesos): Catálogo compilado
+            pontos (dict): Resultado de matriz.pontuar_esparso(perfil)
+            dados (object): Resultado de preparar(matriz)
+
+        Returns:
+            dict: {indice_carreira: valor entre 0 e 1}; ausentes valem 0
+        """
+
+
+class PontuadorCompatibilidade(PontuadorDinamico):
+    """Compatibilidade do perfil com a carreira (0-100 vira 0-1)."""
+
+    nome = 'compatibilidade'
+
+    def pontuar(self, perfil, matriz, pontos, dados):
+        maximos = matriz.pontos_maximos
+        return {indice: round((valor / maximos[indice]) * 100, 1) / 100
+                for indice, valor in pontos.items()}
+
+
+class PontuadorCrescimento(PontuadorEstatico):
+    """Crescimento projetado, normalizado entre o menor e o maior do catálogo."""
+
+    nome = 'crescimento'
+
+    def coluna(self, matriz):
+        return _normalizar_coluna([carreira.crescimento_projetado for carreira in matriz.carreiras])
+
+
+class PontuadorSalario(PontuadorEstatico):
+    """Salário médio, normalizado entre o menor e o maior do catálogo."""
+
+    nome = 'salario'
+
+    def coluna(self, matriz):
+        return _normalizar_coluna([carreira.salario_medio for carreira in matriz.carreiras])
+
+
+class PontuadorAtratividade(PontuadorEstatico):
+    """Nível de atratividade da carreira (Alta 1, Média 0,5, Baixa 0)."""
+
+    nome = 'atratividade'
+
+    def coluna(self, matriz):
+        return [VALORES_ATRATIVIDADE[carreira.nivel_atratividade()] for carreira in matriz.carreiras]
+
+
+class PontuadorObjetivos(PontuadorDinamico):
+    """
+    Aderência da carreira aos objetivos do perfil.
+
+    O valor é a fração dos radicais dos objetivos (Perfil.objetivos) que
+    aparecem no nome, na descrição ou nas competências exigidas da carreira.
+    """
+
+    nome = 'objetivos'
+
+    def preparar(self, matriz):
+        # Índice invertido radical -> carreiras.
+        indice_radicais = {}
+        for indice, carreira in enumerate(matriz.carreiras):
+            texto = ' '.join((carreira.nome, carreira.descricao or '',
+                              *carreira.compilar().competencias))
+            for radical in radicais(texto):
+                indice_radicais.setdefault(radical, []).append(indice)
+        return indice_radicais
+
+    def pontuar(self, perfil, matriz, pontos, dados):
+        termos = set()
+        for objetivo in perfil.obter_objetivos():
+            termos |= radicais(objetivo)
+        if not termos:
+            return {}
+
+        contagem = {}
+        for radical in termos:
+            for indice in dados.get(radical, ()):
+                contagem[indice] = contagem.get(indice, 0) + 1
+        return {indice: quantidade / len(termos) for indice, quantidade in contagem.items()}
+
+
+# Pontuadores disponíveis por nome
+PONTUADORES = {classe.nome: classe for classe in (PontuadorCompatibilidade, PontuadorCrescimento,
+                                                  PontuadorSalario, PontuadorAtratividade,
+                                                  PontuadorObjetivos)}
+
+
+class Ranqueador:
+    """
+    Combina pontuadores com pesos para ranquear o catálogo para um perfil.
+
+    As colunas estáticas são recalculadas quando a versão da matriz muda; se
+    crescimento ou salário forem alterados diretamente nas carreiras, chame
+    descartar_preparacao().
+
+    Atributos:
+        pesos (dict): {nome: peso} dos pontuadores ativos (peso > 0)
+        pontuadores (dict): {nome: Pontuador} ativos
+    """
+
+    def __init__(self, pesos=None, pontuadores=()):
+        """
+        Configura os pontuadores.
+
+        Args:
+            pesos (dict): {nome: peso} (padrão: PESOS_PADRAO); peso 0 desliga o sinal
+            pontuadores (iterable): Pontuadores extras ou substitutos, pelo atributo nome
+        """
+        disponiveis = {nome: classe() for nome, classe in PONTUADORES.items()}
+        for pontuador in pontuadores:
+            if not isinstance(pontuador, (PontuadorEstatico, PontuadorDinamico)):
+                raise TypeError(f"Pontuador deve herdar de PontuadorEstatico ou "
+                                f"PontuadorDinamico: {pontuador!r}")
+            disponiveis[pontuador.nome] = pontuador
+
+        pesos = PESOS_PADRAO if pesos is None else pesos
+        for nome, peso in pesos.items():
+            if nome not in disponiveis:
+                raise ValueError(f"Pontuador desconhecido: {nome}")
+            if isinstance(peso, bool) or not isinstance(peso, (int, float)) or peso < 0:
+                raise ValueError(f"Peso de '{nome}' deve ser um número não negativo")
+
+        self.pesos = {nome: peso for nome, peso in pesos.items() if peso}
+        if not self.pesos:
+            raise ValueError("Pelo menos um pontuador deve ter peso positivo")
+
+        self.pontuadores = {nome: disponiveis[nome] for nome in self.pesos}
+        total = sum(self.pesos.values())
+        self._fracoes = {nome: peso / total for nome, peso in self.pesos.items()}
+        self._preparacao = None
+
+    def descartar_preparacao(self):
+        """Descarta as colunas guardadas (recalculadas na próxima consulta)."""
+        self._preparacao = None
+
+    def _preparar(self, matriz):
+        # Colunas estáticas, coluna base e dados dos dinâmicos para a versão atual.
+        preparacao = self._preparacao
+        if (preparacao is not None and preparacao.matriz is matriz
+                and preparacao.versao == matriz.versao):
+            return preparacao
+
+        base = [0.0] * len(matriz)
+        colunas = {}
+        dados = {}
+        for nome, pontuador in self.pontuadores.items():
+            if pontuador.estatico:
+                fracao = self._fracoes[nome]
+                coluna = colunas[nome] = pontuador.coluna(matriz)
+                base = [acumulado + fracao * valor for acumulado, valor in zip(base, coluna)]
+            else:
+                dados[nome] = pontuador.preparar(matriz)
+
+        # Ordenação estável: em empates, a carreira que vem antes no catálogo
+        ordem = sorted(range(len(base)), key=base.__getitem__, reverse=True)
+        self._preparacao = _Preparacao(matriz, matriz.versao, base, ordem, colunas, dados)
+        return self._preparacao
+
+    def colunas(self, matriz):
+        """
+        Retorna as colunas estáticas normalizadas do catálogo (sem os pesos).
+
+        Args:
+            matriz (MatrizPesos): Catálogo compilado
+
+        Returns:
+            dict: {nome_pontuador: valores entre 0 e 1 por carreira}
+        """
+        return self._preparar(matriz).colunas
+
+    def ranquear(self, perfil, matriz, limite=3, pontos=None):
+        """
+        Ranqueia as carreiras do catálogo para um perfil.
+
+        O resultado é o mesmo de calcular a média ponderada de todos os
+        pontuadores em todas as carreiras e ordenar (em empates, a carreira
+        que vem antes no catálogo).
+
+        Args:
+            perfil (Perfil): Perfil do usuário
+            matriz (MatrizPesos): Catálogo compilado
+            limite (int): Número de carreiras
+            pontos (dict): matriz.pontuar_esparso(perfil), se já calculado
+
+        Returns:
+            list: CarreiraRanqueada, da maior para a menor pontuação
+        """
+        preparacao = self._preparar(matriz)
+        if pontos is None:
+            pontos = matriz.pontuar_esparso(perfil)
+
+        base = preparacao.base
+        extras = {}       # {indice: soma ponderada dos pontuadores dinâmicos}
+        dinamicos = {}    # {nome: valores esparsos}
+        for nome, pontuador in self.pontuadores.items():
+            if not pontuador.estatico:
+                fracao = self._fracoes[nome]
+                valores = dinamicos[nome] = pontuador.pontuar(perfil, matriz, pontos,
+                                                              preparacao.dados[nome])
+                for indice, valor in valores.items():
+                    extras[indice] = extras.get(indice, 0.0) + fracao * valor
+
+        if limite <= 0:
+            totais = list(base)
+            for indice, extra in extras.items():
+                totais[indice] += extra
+            selecionadas = [(totais[i], i) for i in selecionar_melhores(totais, limite)]
+        else:
+            candidatas = [(base[indice] + extra, -indice) for indice, extra in extras.items()]
+            # Sem valor dinâmico, a pontuação é a base: bastam as primeiras da ordem base
+            restantes = limite
+            for indice in preparacao.ordem:
+                if not restantes:
+                    break
+                if indice not in extras:
+                    candidatas.append((base[indice], -indice))
+                    restantes -= 1
+            selecionadas = [(total, -indice) for total, indice in heapq.nlargest(limite, candidatas)]
+
+        carreiras = matriz.carreiras
+        maximos = matriz.pontos_maximos
+        resultado = []
+        for total, indice in selecionadas:
+            componentes = {}
+            for nome, pontuador in self.pontuadores.items():
+                if pontuador.estatico:
+                    componentes[nome] = preparacao.colunas[nome][indice]
+                else:
+                    componentes[nome] = dinamicos[nome].get(indice, 0.0)
+            maximo = maximos[indice]
+            compatibilidade = round((pontos.get(indice, 0) / maximo) * 100, 1) if maximo else 0
+            resultado.append(CarreiraRanqueada(carreiras[indice], round(total * 100, 1),
+                                               compatibilidade, componentes))
+        return resultado
+
+    def ranquear_lote(self, perfis, matriz, limite=3):
+        """
+        Ranqueia as carreiras para vários perfis, com a preparação feita uma vez.
+
+        Args:
+            perfis (iterable): Perfis dos usuários
+            matriz (MatrizPesos): Catálogo compilado
+            limite (int): Carreiras por perfil
+
+        Yields:
+            list: Resultado de ranquear() de cada perfil, na ordem da entrada
+        """
+        for perfil in perfis:
+            yield self.ranquear(perfil, matriz, limite)
+
+    def __repr__(self):
+        return f"Ranqueador(pesos={self.pesos})"
@@ -0,0 +1,286 @@
+# Repositório de perfis em disco, em formato colunar lido via mmap.
+#
+# Estrutura do diretório:
+#   meta.json    -> versão, largura (nº de competências), total e vocabulário
+#   niveis.bin   -> matriz total x largura de níveis (1 byte por competência)
+#   idades.bin   -> idade de cada perfil (int16)
+#   datas.bin    -> data de criação de cada perfil (int64, epoch)
+#   offsets.bin  -> 4 offsets por perfil em textos.bin: nome, área, objetivos, fim
+#   textos.bin   -> textos em UTF-8 (objetivos separados por SEPARADOR_OBJETIVOS)
+
+import json
+import mmap
+import os
+from array import array
+
+from .perfil import Perfil, PerfilCompacto
+from .vocabulario import VOCABULARIO, VocabularioCompetencias
+
+VERSAO_FORMATO = 1
+
+# Separa os objetivos de um perfil em textos.bin
+SEPARADOR_OBJETIVOS = '\x1f'
+
+# Nomes dos arquivos do repositório
+ARQUIVOS = {
+    'niveis': 'niveis.bin',
+    'idades': 'idades.bin',
+    'datas': 'datas.bin',
+    'offsets': 'offsets.bin',
+    'textos': 'textos.bin',
+}
+
+
+class EscritorPerfis:
+    """
+    Grava perfis em um repositório colunar, um de cada vez.
+
+    A largura das linhas de níveis é fixada pelo tamanho do vocabulário na
+    criação do escritor; perfis com competências fora dele são rejeitados.
+    Use como gerenciador de contexto ou chame fechar() ao final.
+
+    Atributos:
+        diretorio (str): Diretório do repositório
+        vocabulario (VocabularioCompetencias): Vocabulário das colunas
+        largura (int): Número de competências por linha
+        total (int): Perfis gravados
+    """
+
+    def __init__(self, diretorio, vocabulario=None):
+        """
+        Cria o repositório (sobrescreve um existente no mesmo diretório).
+
+        Args:
+            diretorio (str): Diretório do repositório
+            vocabulario (VocabularioCompetencias): Vocabulário (padrão: VOCABULARIO)
+        """
+        self.diretorio = diretorio
+        self.vocabulario = vocabulario if vocabulario is not None else VOCABULARIO
+        self.largura = len(self.vocabulario)
+        self.total = 0
+        self._nomes = list(self.vocabulario.nomes)
+        self._posicao_texto = 0
+
+        os.makedirs(diretorio, exist_ok=True)
+        # Sem meta.json, um repositório gravado pela metade nunca é aberto
+        caminho_meta = os.path.join(diretorio, 'meta.json')
+        if os.path.exists(caminho_meta):
+            os.remove(caminho_meta)
+        self._arquivos = {chave: open(os.path.join(diretorio, nome), 'wb')
+                          for chave, nome in ARQUIVOS.items()}
+
+    def adicionar(self, perfil):
+        """
+        Grava um perfil no final do repositório.
+
+        Args:
+            perfil (Perfil): Perfil a gravar
+
+        Returns:
+            int: Posição do perfil no repositório
+        """
+        linha = bytearray(self.largura)
+        for competencia, nivel in perfil.competencias.items():
+            id_competencia = self.vocabulario.buscar_id(competencia)
+            if id_competencia is None or id_competencia >= self.largura:
+                raise ValueError(f"Competência fora do vocabulário do repositório: {competencia}")
+            linha[id_competencia] = nivel
+
+        partes = [perfil.nome.encode('utf-8'),
+                  (perfil.area_atuacao or '').encode('utf-8'),
+                  SEPARADOR_OBJETIVOS.join(perfil.obter_objetivos()).encode('utf-8')]
+
+        offsets = array('Q', [self._posicao_texto])
+        for parte in partes:
+            offsets.append(offsets[-1] + len(parte))
+        self._posicao_texto = offsets[-1]
+
+        self._arquivos['niveis'].write(linha)
+        self._arquivos['idades'].write(array('h', [perfil.idade]).tobytes())
+        self._arquivos['datas'].write(array('q', [perfil.timestamp_criacao]).tobytes())
+        self._arquivos['offsets'].write(offsets.tobytes())
+        self._arquivos['textos'].write(b''.join(partes))
+
+        self.total += 1
+        return self.total - 1
+
+    def _fechar_arquivos(self):
+        # Fecha os arquivos de dados, sem gravar meta.json.
+        for arquivo in self._arquivos.values():
+            arquivo.close()
+
+    def fechar(self):
+        """Fecha os arquivos e grava meta.json."""
+        self._fechar_arquivos()
+
+        meta = {
+            'versao': VERSAO_FORMATO,
+            'largura': self.largura,
+            'total': self.total,
+            'vocabulario': self._nomes,
+        }
+        with open(os.path.join(self.diretorio, 'meta.json'), 'w', encoding='utf-8') as arquivo:
+            json.dump(meta, arquivo, ensure_ascii=False)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        # Com uma exceção em curso o repositório fica incompleto: não grava meta.json
+        if excecao[0] is not None:
+            self._fechar_arquivos()
+        else:
+            self.fechar()
+
+
+class RepositorioPerfis:
+    """
+    Leitura de um repositório colunar de perfis via mmap.
+
+    Os níveis podem ser percorridos como memoryviews sobre o arquivo, sem
+    criar objetos Perfil; perfis individuais são materializados sob demanda.
+
+    Atributos:
+        diretorio (str): Diretório do repositório
+        vocabulario (VocabularioCompetencias): Vocabulário das colunas de níveis
+        largura (int): Número de competências por linha
+    """
+
+    def __init__(self, diretorio):
+        """
+        Abre um repositório gravado por EscritorPerfis.
+
+        Args:
+            diretorio (str): Diretório do repositório
+        """
+        self.diretorio = diretorio
+
+        with open(os.path.join(diretorio, 'meta.json'), encoding='utf-8') as arquivo:
+            meta = json.load(arquivo)
+        if meta['versao'] != VERSAO_FORMATO:
+            raise ValueError(f"Versão de repositório não suportada: {meta['versao']}")
+
+        self.vocabulario = VocabularioCompetencias(meta['vocabulario'])
+        self.largura = meta['largura']
+        self._total = meta['total']
+
+        self._mapas = {}
+        for chave, nome in ARQUIVOS.items():
+            with open(os.path.join(diretorio, nome), 'rb') as arquivo:
+                if os.fstat(arquivo.fileno()).st_size:
+                    self._mapas[chave] = mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ)
+                else:
+                    self._mapas[chave] = b''
+
+        self._niveis = memoryview(self._mapas['niveis']).cast('b')
+        self._idades = memoryview(self._mapas['idades']).cast('h')
+        self._datas = memoryview(self._mapas['datas']).cast('q')
+        self._offsets = memoryview(self._mapas['offsets']).cast('Q')
+
+    @classmethod
+    def gravar(cls, diretorio, perfis, vocabulario=None):
+        """
+        Grava uma sequência (ou gerador) de perfis e abre o repositório resultante.
+
+        Args:
+            diretorio (str): Diretório do repositório
+            perfis (iterable): Perfis a gravar
+            vocabulario (VocabularioCompetencias): Vocabulário (padrão: VOCABULARIO)
+
+        Returns:
+            RepositorioPerfis: Repositório aberto para leitura
+        """
+        with EscritorPerfis(diretorio, vocabulario) as escritor:
+            for perfil in perfis:
+                escritor.adicionar(perfil)
+        return cls(diretorio)
+
+    def obter_niveis(self, posicao):
+        """
+        Retorna a linha de níveis de um perfil, sem cópia.
+
+        Args:
+            posicao (int): Posição do perfil
+
+        Returns:
+            memoryview: Níveis indexados pelo id da competência no vocabulário
+        """
+        inicio = posicao * self.largura
+        return self._niveis[inicio:inicio + self.largura]
+
+    def iterar_niveis(self, inicio=0, fim=None):
+        """Gera as linhas de níveis dos perfis, na ordem do repositório."""
+        fim = self._total if fim is None else min(fim, self._total)
+        for posicao in range(inicio, fim):
+            yield self.obter_niveis(posicao)
+
+    def _obter_texto(self, posicao, campo):
+        # Decodifica o campo (0 nome, 1 área, 2 objetivos) de um perfil.
+        base = posicao * 4 + campo
+        inicio, fim = self._offsets[base], self._offsets[base + 1]
+        return self._mapas['textos'][inicio:fim].decode('utf-8')
+
+    def obter_nome(self, posicao):
+        """Retorna o nome do perfil na posição informada."""
+        return self._obter_texto(posicao, 0)
+
+    def obter_area(self, posicao):
+        """Retorna a área de atuação do perfil na posição informada."""
+        return self._obter_texto(posicao, 1)
+
+    def materializar(self, posicao, compacto=False):
+        """
+        Cria o objeto Perfil de uma posição do repositório.
+
+        Args:
+            posicao (int): Posição do perfil
+            compacto (bool): Se True, cria um PerfilCompacto no vocabulário do repositório
+
+        Returns:
+            Perfil: Perfil reconstruído
+        """
+        if not 0 <= posicao < self._total:
+            raise IndexError(f"Perfil fora do repositório: {posicao}")
+
+        nome = self._obter_texto(posicao, 0)
+        area = self._obter_texto(posicao, 1)
+        if compacto:
+            perfil = PerfilCompacto(nome, self._idades[posicao], area, self.vocabulario)
+        else:
+            perfil = Perfil(nome, self._idades[posicao], area)
+
+        nomes = self.vocabulario.nomes
+        for id_competencia, nivel in enumerate(self.obter_niveis(posicao)):
+            if nivel:
+                perfil.competencias[nomes[id_competencia]] = nivel
+
+        objetivos = self._obter_texto(posicao, 2)
+        if objetivos:
+            perfil.objetivos = objetivos.split(SEPARADOR_OBJETIVOS)
+
+        perfil.data_criacao = self._datas[posicao]
+        return perfil
+
+    def __iter__(self):
+        for posicao in range(self._total):
+            yield self.materializar(posicao)
+
+    def __len__(self):
+        return self._total
+
+    def fechar(self):
+        """Libera as views e fecha os mapeamentos."""
+        for view in (self._niveis, self._idades, self._datas, self._offsets):
+            view.release()
+        for mapa in self._mapas.values():
+            if isinstance(mapa, mmap.mmap):
+                mapa.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def __repr__(self):
+        return f"RepositorioPerfis(diretorio='{self.diretorio}', perfis={self._total})"
@@ -0,0 +1,516 @@
+# Serialização binária compacta de perfis, carreiras e relatórios.
+#
+# Formato (little-endian, só struct da biblioteca padrão):
+#   MAGICA (4 bytes) seguida de blocos: 1 byte de tipo, tamanho do corpo (I)
+#   e o corpo, que pode ser:
+#     S -> novos textos da tabela: quantidade (H) e, para cada um, tamanho (H) + UTF-8
+#     P -> perfil:    idade (h), data (q), área (I), nome (H), objetivos (B),
+#                     competências (H); nome; ids dos objetivos e das
+#                     competências (I cada); níveis (1 byte cada)
+#     C -> carreira:  crescimento (i), salário (d), nome (H), descrição (I),
+#                     essenciais/importantes/desejáveis (H cada); textos; ids (I)
+#     R -> relatório: nome do perfil (H), total de competências (I),
+#                     percentual (d), classificação (I), recomendações (H);
+#                     nome; para cada recomendação: carreira (I),
+#                     compatibilidade (d), gaps (H) e ids dos gaps (I)
+#
+# Textos que se repetem entre registros (competências, áreas, objetivos,
+# nomes de carreiras, classificações) entram uma única vez na tabela de
+# textos do fluxo e os registros guardam só o id. Um bloco S é emitido
+# antes do primeiro registro que usa textos novos, então o fluxo é gravado
+# e lido em uma passagem, sem conhecer todos os textos antecipadamente, e
+# um arquivo é lido bloco a bloco, sem carregá-lo inteiro na memória.
+#
+# Valores fora da faixa do formato do seu campo (ex.: textos com mais de
+# 65535 bytes, idade acima de 32767) geram ValueError com o nome do campo.
+
+import json
+import struct
+from functools import lru_cache
+
+from .carreira import Carreira
+from .perfil import Perfil
+from .sistema_recomendacao import RelatorioCarreiras
+
+MAGICA = b'OCB\x01'
+
+_TEXTOS = b'S'
+_PERFIL = b'P'
+_CARREIRA = b'C'
+_RELATORIO = b'R'
+
+_CABECALHO_PERFIL = struct.Struct('<hqIHBH')
+_CABECALHO_CARREIRA = struct.Struct('<idHIHHH')
+_CABECALHO_RELATORIO = struct.Struct('<HIdIH')
+_RECOMENDACAO = struct.Struct('<IdH')
+_QUANTIDADE = struct.Struct('<H')
+_BLOCO = struct.Struct('<cI')
+
+# Faixa de cada formato inteiro das structs (campos fora dela não são codificáveis)
+_FAIXAS = {
+    'B': (0, 0xFF),
+    'H': (0, 0xFFFF),
+    'h': (-0x8000, 0x7FFF),
+    'i': (-0x80000000, 0x7FFFFFFF),
+    'I': (0, 0xFFFFFFFF),
+    'q': (-0x8000000000000000, 0x7FFFFFFFFFFFFFFF),
+}
+
+# Tamanho máximo, em bytes UTF-8, de um texto da tabela de textos
+TAMANHO_MAXIMO_TEXTO = _FAIXAS['H'][1]
+
+
+@lru_cache(maxsize=256)
+def _ids(quantidade):
+    # Struct de `quantidade` ids (I) consecutivos.
+    return struct.Struct(f'<{quantidade}I')
+
+
+def _erro_campo(erro, tipo, campos):
+    # Converte um struct.error (ou ValueError de bytes()) no ValueError do primeiro
+    # campo fora da faixa do seu formato; só é chamado depois de a codificação falhar.
+    for campo, formato, valor in campos:
+        if formato == 'd':
+            valido = isinstance(valor, (int, float))
+        else:
+            minimo, maximo = _FAIXAS[formato]
+            valido = isinstance(valor, int) and minimo <= valor <= maximo
+        if not valido:
+            return ValueError(f"{tipo}: campo '{campo}' fora do limite do formato binário "
+                              f"({valor!r})")
+    return ValueError(f"{tipo}: valor não codificável ({erro})")
+
+
+class CodificadorBinario:
+    """
+    Codifica perfis, carreiras e relatórios em um fluxo binário.
+
+    Os registros podem ser gravados um a um em um arquivo aberto em modo
+    binário ou acumulados em memória (arquivo=None, ver obter_bytes).
+
+    Atributos:
+        registros (int): Registros codificados
+    """
+
+    def __init__(self, arquivo=None):
+        """
+        Inicia o fluxo escrevendo a MAGICA.
+
+        Args:
+            arquivo (file): Arquivo binário de saída (None = memória)
+        """
+        self._partes = [] if arquivo is None else None
+        self._escrever = self._partes.append if arquivo is None else arquivo.write
+        self._ids = {}      # {texto: id} da tabela de textos do fluxo
+        self._novos = []    # Textos ainda não emitidos em um bloco S
+        self.registros = 0
+        self._escrever(MAGICA)
+
+    def _id(self, texto, campo):
+        # Id do texto na tabela, registrando-o como novo se ainda não existir.
+        id_texto = self._ids.get(texto)
+        if id_texto is None:
+            if not isinstance(texto, str):
+                raise ValueError(f"Campo '{campo}' deve ser texto: {texto!r}")
+            dados = texto.encode('utf-8')
+            if len(dados) > TAMANHO_MAXIMO_TEXTO:
+                raise ValueError(f"Campo '{campo}' com {len(dados)} bytes excede o limite "
+                                 f"de {TAMANHO_MAXIMO_TEXTO} do formato binário")
+            id_texto = self._ids[texto] = len(self._ids)
+            self._novos.append(dados)
+        return id_texto
+
+    def _emitir(self, tipo, corpo):
+        # Escreve os textos novos (blocos S de até 65535 textos) e depois o registro.
+        novos = self._novos
+        for inicio in range(0, len(novos), TAMANHO_MAXIMO_TEXTO):
+            bloco = novos[inicio:inicio + TAMANHO_MAXIMO_TEXTO]
+            partes = [_QUANTIDADE.pack(len(bloco))]
+            for dados in bloco:
+                partes.append(_QUANTIDADE.pack(len(dados)))
+                partes.append(dados)
+            textos = b''.join(partes)
+            self._escrever(_BLOCO.pack(_TEXTOS, len(textos)) + textos)
+        self._novos = []
+
+        self._escrever(_BLOCO.pack(tipo, len(corpo)) + corpo)
+        self.registros += 1
+
+    def escrever(self, item):
+        """
+        Codifica um item.
+
+        Args:
+            item (Perfil, Carreira ou RelatorioCarreiras): Item a codificar
+        """
+        if isinstance(item, Perfil):
+            self.escrever_perfil(item)
+        elif isinstance(item, Carreira):
+            self.escrever_carreira(item)
+        elif isinstance(item, RelatorioCarreiras):
+            self.escrever_relatorio(item)
+        else:
+            raise TypeError(f"Tipo não serializável: {type(item).__name__}")
+
+    def escrever_varios(self, itens):
+        """
+        Codifica uma sequência (ou gerador) de itens, um de cada vez.
+
+        Returns:
+            int: Número de itens codificados
+        """
+        total = 0
+        for item in itens:
+            self.escrever(item)
+            total += 1
+        return total
+
+    def escrever_perfil(self, perfil):
+        """Codifica um Perfil (ou PerfilCompacto)."""
+        obter_id = self._id
+        objetivos = perfil.obter_objetivos()
+        competencias = list(perfil.competencias.items())
+        nome = perfil.nome.encode('utf-8')
+
+        ids = [obter_id(objetivo, 'objetivos') for objetivo in objetivos]
+        ids.extend(obter_id(competencia, 'competencias') for competencia, _ in competencias)
+        area = obter_id(perfil.area_atuacao or '', 'area_atuacao')
+
+        try:
+            cabecalho = _CABECALHO_PERFIL.pack(perfil.idade, perfil.timestamp_criacao, area,
+                                               len(nome), len(objetivos), len(competencias))
+            niveis = bytes(nivel for _, nivel in competencias)
+        except (struct.error, ValueError, TypeError) as erro:
+            raise _erro_campo(erro, 'Perfil', [
+                ('idade', 'h', perfil.idade),
+                ('data_criacao', 'q', perfil.timestamp_criacao),
+                ('nome (bytes)', 'H', len(nome)),
+                ('objetivos (quantidade)', 'B', len(objetivos)),
+                ('competencias (quantidade)', 'H', len(competencias)),
+                *((f'competencias[{competencia}]', 'B', nivel)
+                  for competencia, nivel in competencias),
+            ]) from erro
+
+        self._emitir(_PERFIL, b''.join((cabecalho, nome, _ids(len(ids)).pack(*ids), niveis)))
+
+    def escrever_carreira(self, carreira):
+        """Codifica uma Carreira (nome, descrição, crescimento, salário e requisitos)."""
+        obter_id = self._id
+        requisitos = [carreira.requisitos[categoria] for categoria, _ in Carreira.PESOS_REQUISITOS]
+        nome = carreira.nome.encode('utf-8')
+        descricao = carreira.descricao.encode('utf-8')
+        ids = [obter_id(competencia, 'requisitos')
+               for competencias in requisitos for competencia in competencias]
+
+        try:
+            cabecalho = _CABECALHO_CARREIRA.pack(carreira.crescimento_projetado,
+                                                 carreira.salario_medio, len(nome),
+                                                 len(descricao), *map(len, requisitos))
+        except struct.error as erro:
+            raise _erro_campo(erro, 'Carreira', [
+                ('crescimento_projetado', 'i', carreira.crescimento_projetado),
+                ('salario_medio', 'd', carreira.salario_medio),
+                ('nome (bytes)', 'H', len(nome)),
+                ('descricao (bytes)', 'I', len(descricao)),
+                *((f'{categoria} (quantidade)', 'H', len(competencias))
+                  for (categoria, _), competencias in zip(Carreira.PESOS_REQUISITOS, requisitos)),
+            ]) from erro
+
+        self._emitir(_CARREIRA, b''.join((cabecalho, nome, descricao, _ids(len(ids)).pack(*ids))))
+
+    def escrever_relatorio(self, relatorio):
+        """Codifica um RelatorioCarreiras (as carreiras são gravadas pelo nome)."""
+        obter_id = self._id
+        percentual, classificacao = relatorio.preparacao_futuro
+        nome = relatorio.perfil.encode('utf-8')
+
+        try:
+            partes = [_CABECALHO_RELATORIO.pack(len(nome), relatorio.total_competencias,
+                                                percentual,
+                                                obter_id(classificacao, 'classificacao'),
+                                                len(relatorio.recomendacoes)),
+                      nome]
+            for recomendacao in relatorio.recomendacoes:
+                gaps = [obter_id(gap, 'gaps') for gap in recomendacao.gaps]
+                partes.append(_RECOMENDACAO.pack(
+                    obter_id(recomendacao.carreira.nome, 'carreira'),
+                    recomendacao.compatibilidade, len(gaps)))
+                partes.append(_ids(len(gaps)).pack(*gaps))
+        except struct.error as erro:
+            raise _erro_campo(erro, 'Relatório', [
+                ('perfil (bytes)', 'H', len(nome)),
+                ('total_competencias', 'I', relatorio.total_competencias),
+                ('percentual', 'd', percentual),
+                ('recomendacoes (quantidade)', 'H', len(relatorio.recomendacoes)),
+                *(('compatibilidade', 'd', recomendacao.compatibilidade)
+                  for recomendacao in relatorio.recomendacoes),
+                *(('gaps (quantidade)', 'H', len(recomendacao.gaps))
+                  for recomendacao in relatorio.recomendacoes),
+            ]) from erro
+
+        self._emitir(_RELATORIO, b''.join(partes))
+
+    def obter_bytes(self):
+        """Retorna o fluxo acumulado em memória (só com arquivo=None)."""
+        if self._partes is None:
+            raise ValueError("O codificador grava direto no arquivo")
+        return b''.join(self._partes)
+
+
+class DecodificadorBinario:
+    """
+    Lê um fluxo gravado por CodificadorBinario.
+
+    Perfis e carreiras voltam como objetos; relatórios voltam como o
+    dicionário de relatorio_para_dict (as carreiras aparecem pelo nome).
+    """
+
+    def __init__(self, dados, classe_perfil=Perfil, classe_carreira=Carreira):
+        """
+        Prepara a leitura.
+
+        Args:
+            dados (bytes ou file): Conteúdo do fluxo ou arquivo binário aberto
+            classe_perfil (type): Classe dos perfis criados
+            classe_carreira (type): Classe das carreiras criadas
+        """
+        if isinstance(dados, (bytes, bytearray, memoryview)):
+            dados = memoryview(dados)
+            self._ler_fonte = self._fatiador(dados)
+        else:
+            self._ler_fonte = dados.read
+
+        if bytes(self._ler_fonte(len(MAGICA))) != MAGICA:
+            raise ValueError("Dados não estão no formato binário de serializacao")
+
+        self._dados = b''     # Corpo do bloco atual
+        self._posicao = 0
+        self._textos = []
+        self.classe_perfil = classe_perfil
+        self.classe_carreira = classe_carreira
+
+    @staticmethod
+    def _fatiador(dados):
+        # Função read(n) sobre uma memoryview, sem copiar os dados.
+        posicao = 0
+
+        def ler(tamanho):
+            nonlocal posicao
+            inicio = posicao
+            posicao = min(posicao + tamanho, len(dados))
+            return dados[inicio:posicao]
+
+        return ler
+
+    def _ler(self, estrutura):
+        # Desempacota uma struct na posição atual.
+        valores = estrutura.unpack_from(self._dados, self._posicao)
+        self._posicao += estrutura.size
+        return valores
+
+    def _ler_bytes(self, tamanho):
+        inicio = self._posicao
+        self._posicao += tamanho
+        return bytes(self._dados[inicio:self._posicao])
+
+    def _ler_texto(self, tamanho):
+        inicio = self._posicao
+        self._posicao += tamanho
+        return str(self._dados[inicio:self._posicao], 'utf-8')
+
+    def _ler_ids(self, quantidade):
+        textos = self._textos
+        return [textos[i] for i in self._ler(_ids(quantidade))]
+
+    def _ler_textos(self):
+        (quantidade,) = self._ler(_QUANTIDADE)
+        for _ in range(quantidade):
+            (tamanho,) = self._ler(_QUANTIDADE)
+            self._textos.append(self._ler_texto(tamanho))
+
+    def _ler_perfil(self):
+        idade, data, area, tamanho_nome, total_objetivos, total = self._ler(_CABECALHO_PERFIL)
+        perfil = self.classe_perfil(self._ler_texto(tamanho_nome), idade,
+                                    self._textos[area])
+        nomes = self._ler_ids(total_objetivos + total)
+        niveis = self._ler_bytes(total)
+
+        if total_objetivos:
+            perfil.objetivos = nomes[:total_objetivos]
+        competencias = perfil.competencias
+        for competencia, nivel in zip(nomes[total_objetivos:], niveis):
+            competencias[competencia] = nivel
+        perfil.data_criacao = data
+        return perfil
+
+    def _ler_carreira(self):
+        crescimento, salario, tamanho_nome, tamanho_descricao, *quantidades = \
+            self._ler(_CABECALHO_CARREIRA)
+        carreira = self.classe_carreira(self._ler_texto(tamanho_nome),
+                                        self._ler_texto(tamanho_descricao),
+                                        crescimento, salario)
+        nomes = self._ler_ids(sum(quantidades))
+        inicio = 0
+        for (categoria, _), quantidade in zip(Carreira.PESOS_REQUISITOS, quantidades):
+            carreira.requisitos[categoria].extend(nomes[inicio:inicio + quantidade])
+            inicio += quantidade
+        return carreira
+
+    def _ler_relatorio(self):
+        tamanho_nome, total, percentual, classificacao, quantidade = \
+            self._ler(_CABECALHO_RELATORIO)
+        nome = self._ler_texto(tamanho_nome)
+
+        recomendacoes = []
+        for _ in range(quantidade):
+            carreira, compatibilidade, total_gaps = self._ler(_RECOMENDACAO)
+            recomendacoes.append({'carreira': self._textos[carreira],
+                                  'compatibilidade': compatibilidade,
+                                  'gaps': self._ler_ids(total_gaps)})
+
+        return {
+            'perfil': nome,
+            'total_competencias': total,
+            'recomendacoes': recomendacoes,
+            'areas_desenvolver': recomendacoes[0]['gaps'] if recomendacoes else [],
+            'preparacao_futuro': {'percentual': round(percentual, 1),
+                                  'classificacao': self._textos[classificacao]},
+        }
+
+    def __iter__(self):
+        leitores = {
+            _TEXTOS: self._ler_textos,
+            _PERFIL: self._ler_perfil,
+            _CARREIRA: self._ler_carreira,
+            _RELATORIO: self._ler_relatorio,
+        }
+        ler_fonte = self._ler_fonte
+
+        while True:
+            cabecalho = ler_fonte(_BLOCO.size)
+            if not cabecalho:
+                return
+            if len(cabecalho) < _BLOCO.size:
+                raise ValueError("Fluxo binário truncado")
+
+            tipo, tamanho = _BLOCO.unpack(cabecalho)
+            leitor = leitores.get(tipo)
+            if leitor is None:
+                raise ValueError(f"Bloco desconhecido: {tipo!r}")
+
+            self._dados = ler_fonte(tamanho)
+            self._posicao = 0
+            if len(self._dados) < tamanho:
+                raise ValueError("Fluxo binário truncado")
+
+            item = leitor()
+            if tipo != _TEXTOS:
+                yield item
+
+
+def codificar(item):
+    """
+    Codifica um único item (Perfil, Carreira ou RelatorioCarreiras) em bytes.
+
+    Returns:
+        bytes: Fluxo com a tabela de textos e o registro
+    """
+    codificador = CodificadorBinario()
+    codificador.escrever(item)
+    return codificador.obter_bytes()
+
+
+def _decodificar_unico(dados, tipos, **classes):
+    # Decodifica um fluxo com exatamente um registro do tipo esperado.
+    itens = list(DecodificadorBinario(dados, **classes))
+    if len(itens) != 1 or not isinstance(itens[0], tipos):
+        raise ValueError("Os dados não contêm exatamente um registro do tipo esperado")
+    return itens[0]
+
+
+def decodificar_perfil(dados, classe=Perfil):
+    """Decodifica o resultado de Perfil.to_bytes."""
+    return _decodificar_unico(dados, Perfil, classe_perfil=classe)
+
+
+def decodificar_carreira(dados, classe=Carreira):
+    """Decodifica o resultado de Carreira.to_bytes."""
+    return _decodificar_unico(dados, Carreira, classe_carreira=classe)
+
+
+def decodificar_relatorio(dados):
+    """Decodifica um relatório codificado, retornando o dicionário de relatorio_para_dict."""
+    return _decodificar_unico(dados, dict)
+
+
+def gravar_binario(caminho, itens):
+    """
+    Grava uma sequência (ou gerador) de itens em um arquivo binário.
+
+    Returns:
+        int: Número de itens gravados
+    """
+    with open(caminho, 'wb') as arquivo:
+        return CodificadorBinario(arquivo).escrever_varios(itens)
+
+
+def ler_binario(caminho, classe_perfil=Perfil, classe_carreira=Carreira):
+    """
+    Lê os itens de um arquivo gravado por gravar_binario.
+
+    Yields:
+        Perfil, Carreira ou dict: Itens na ordem em que foram gravados
+    """
+    with open(caminho, 'rb') as arquivo:
+        yield from DecodificadorBinario(arquivo, classe_perfil, classe_carreira)
+
+
+def relatorio_para_dict(relatorio):
+    """
+    Converte um RelatorioCarreiras em dicionário serializável em JSON.
+
+    As carreiras aparecem pelo nome; 'areas_desenvolver' são os gaps da
+    melhor recomendação, como em gerar_relatorio_simples.
+
+    Args:
+        relatorio (RelatorioCarreiras): Relatório de gerar_relatorio_completo
+
+    Returns:
+        dict: {perfil, total_competencias, recomendacoes, areas_desenvolver, preparacao_futuro}
+    """
+    percentual, classificacao = relatorio.preparacao_futuro
+    recomendacoes = [{'carreira': r.carreira.nome, 'compatibilidade': r.compatibilidade,
+                      'gaps': list(r.gaps)} for r in relatorio.recomendacoes]
+
+    return {
+        'perfil': relatorio.perfil,
+        'total_competencias': relatorio.total_competencias,
+        'recomendacoes': recomendacoes,
+        'areas_desenvolver': recomendacoes[0]['gaps'] if recomendacoes else [],
+        'preparacao_futuro': {'percentual': round(percentual, 1),
+                              'classificacao': classificacao},
+    }
+
+
+def _para_dict(item):
+    # Dicionário JSON de um item aceito por CodificadorBinario.escrever.
+    if isinstance(item, RelatorioCarreiras):
+        return relatorio_para_dict(item)
+    return item.to_dict()
+
+
+def codificar_json_lista(itens):
+    """
+    Gera o texto de uma lista JSON de itens aos pedaços, um item por vez.
+
+    Args:
+        itens (iterable): Perfis, carreiras ou relatórios (pode ser um gerador)
+
+    Yields:
+        str: Pedaços que, concatenados, formam a lista JSON
+    """
+    separador = '['
+    for item in itens:
+        yield separador + json.dumps(_para_dict(item), ensure_ascii=False)
+        separador = ','
+    yield '[]' if separador == '[' else ']'
@@ -0,0 +1,357 @@
+# Serviço HTTP (asyncio, só biblioteca padrão) para o Sistema de Recomendação.
+#
+# Rotas (POST, corpo e resposta em JSON):
+#   /recomendacoes -> {"perfil": {...}, "limite": 3}
+#   /gaps          -> {"perfil": {...}, "carreira": "Nome"} (sem carreira: a melhor)
+#   /relatorio     -> {"perfil": {...}, "limite": 3}
+# O perfil usa o mesmo formato da entrada JSONL do modo em lote (pipeline.py).
+#
+# Requisições que chegam dentro de uma janela curta são agrupadas em uma única
+# chamada a recomendar_carreiras_lote.
+#
+# Uso: python -m orientacao_carreiras.servidor --porta 8000 --janela-ms 2
+
+import argparse
+import asyncio
+import json
+
+from .dados_mock import obter_carreiras_futuro
+from .pipeline import validar_registro
+from .serializacao import relatorio_para_dict
+from .sistema_recomendacao import SistemaRecomendacao
+
+# Tamanho máximo do corpo de uma requisição
+TAMANHO_MAXIMO_CORPO = 1024 * 1024
+
+MENSAGENS_STATUS = {
+    200: 'OK',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    413: 'Payload Too Large',
+    500: 'Internal Server Error',
+}
+
+
+class ErroRequisicao(Exception):
+    # Erro que vira uma resposta HTTP com status e mensagens.
+
+    def __init__(self, status, erros):
+        super().__init__(status, erros)
+        self.status = status
+        self.erros = erros
+
+
+class AgrupadorLotes:
+    """
+    Agrupa pedidos de recomendação concorrentes em chamadas em lote.
+
+    O primeiro pedido abre uma janela de `janela` segundos; os que chegarem
+    nesse intervalo (até `lote_maximo`) são pontuados juntos. Como o top-k
+    de um limite maior contém o de qualquer limite menor, o lote usa o maior
+    limite pedido e cada pedido recebe o seu prefixo.
+
+    Atributos:
+        sistema (SistemaRecomendacao): Sistema de recomendação
+        janela (float): Espera máxima, em segundos, para completar um lote
+        lote_maximo (int): Pedidos por lote
+        lotes (int): Lotes executados
+        pedidos (int): Pedidos atendidos
+    """
+
+    def __init__(self, sistema, janela=0.002, lote_maximo=256):
+        self.sistema = sistema
+        self.janela = janela
+        self.lote_maximo = lote_maximo
+        self.lotes = 0
+        self.pedidos = 0
+        self._fila = None
+        self._tarefa = None
+
+    def iniciar(self):
+        """Inicia a tarefa que consome a fila (dentro do loop de eventos)."""
+        self._fila = asyncio.Queue()
+        self._tarefa = asyncio.create_task(self._consumir())
+
+    async def parar(self):
+        """Cancela a tarefa de consumo."""
+        self._tarefa.cancel()
+        try:
+            await self._tarefa
+        except asyncio.CancelledError:
+            pass
+
+    async def recomendar(self, perfil, limite):
+        """
+        Agenda um perfil no próximo lote e aguarda as recomendações.
+
+        Args:
+            perfil (Perfil): Perfil do usuário
+            limite (int): Número de recomendações
+
+        Returns:
+            list: Tuplas (carreira, compatibilidade)
+        """
+        futuro = asyncio.get_running_loop().create_future()
+        await self._fila.put((perfil, limite, futuro))
+        return await futuro
+
+    async def _consumir(self):
+        # Monta lotes a partir da fila e resolve os futuros de cada pedido.
+        loop = asyncio.get_running_loop()
+
+        while True:
+            pedidos = [await self._fila.get()]
+            prazo = loop.time() + self.janela
+
+            while len(pedidos) < self.lote_maximo:
+                restante = prazo - loop.time()
+                if restante <= 0:
+                    break
+                try:
+                    pedidos.append(await asyncio.wait_for(self._fila.get(), restante))
+                except asyncio.TimeoutError:
+                    break
+
+            limite = max(limite for _, limite, _ in pedidos)
+            try:
+                resultados = self.sistema.recomendar_carreiras_lote(
+                    [perfil for perfil, _, _ in pedidos], limite)
+            except Exception as erro:
+                for _, _, futuro in pedidos:
+                    if not futuro.done():
+                        futuro.set_exception(erro)
+                continue
+
+            self.lotes += 1
+            self.pedidos += len(pedidos)
+            for (_, limite_pedido, futuro), recomendacoes in zip(pedidos, resultados):
+                if not futuro.done():
+                    futuro.set_result(recomendacoes[:limite_pedido])
+
+
+def _recomendacoes_json(recomendacoes):
+    # Converte tuplas (carreira, compatibilidade) em dicionários serializáveis.
+    return [{'carreira': carreira.nome, 'compatibilidade': compatibilidade}
+            for carreira, compatibilidade in recomendacoes]
+
+
+class ServicoRecomendacao:
+    """
+    Servidor HTTP/1.1 mínimo com as rotas /recomendacoes, /gaps e /relatorio.
+
+    Atributos:
+        sistema (SistemaRecomendacao): Sistema de recomendação
+        agrupador (AgrupadorLotes): Agrupador dos pedidos de recomendação
+    """
+
+    def __init__(self, sistema, janela=0.002, lote_maximo=256):
+        """
+        Inicializa o serviço.
+
+        Args:
+            sistema (SistemaRecomendacao): Sistema de recomendação
+            janela (float): Janela de agrupamento em segundos
+            lote_maximo (int): Pedidos por lote
+        """
+        self.sistema = sistema
+        self.agrupador = AgrupadorLotes(sistema, janela, lote_maximo)
+        self._carreiras = {}          # Índice nome -> carreira para /gaps
+        self._versao_indexada = None  # (matriz, versão) em que o índice foi montado
+        self._rotas = {
+            '/recomendacoes': self._rota_recomendacoes,
+            '/gaps': self._rota_gaps,
+            '/relatorio': self._rota_relatorio,
+        }
+
+    def _obter_perfil(self, corpo):
+        # Valida o perfil do corpo da requisição.
+        dados = corpo.get('perfil')
+        if not isinstance(dados, dict):
+            raise ErroRequisicao(400, ["Informe o perfil como objeto JSON"])
+        perfil, erros = validar_registro(dados)
+        if perfil is None:
+            raise ErroRequisicao(400, erros)
+        return perfil
+
+    def _obter_limite(self, corpo):
+        limite = corpo.get('limite', 3)
+        if not isinstance(limite, int) or isinstance(limite, bool) or limite < 1:
+            raise ErroRequisicao(400, ["Limite deve ser um inteiro positivo"])
+        return limite
+
+    async def _rota_recomendacoes(self, corpo):
+        perfil = self._obter_perfil(corpo)
+        recomendacoes = await self.agrupador.recomendar(perfil, self._obter_limite(corpo))
+        return {'perfil': perfil.nome, 'recomendacoes': _recomendacoes_json(recomendacoes)}
+
+    async def _rota_gaps(self, corpo):
+        perfil = self._obter_perfil(corpo)
+        nome_carreira = corpo.get('carreira')
+        if nome_carreira is not None and not isinstance(nome_carreira, str):
+            raise ErroRequisicao(400, ["Carreira deve ser o nome da carreira (texto)"])
+
+        if nome_carreira:
+            # Índice por nome, refeito quando o catálogo muda
+            matriz = self.sistema.obter_matriz()
+            versao = (matriz, matriz.versao)
+            if self._versao_indexada != versao:
+                self._carreiras = {c.nome: c for c in matriz.carreiras}
+                self._versao_indexada = versao
+            carreira = self._carreiras.get(nome_carreira)
+            if carreira is None:
+                raise ErroRequisicao(404, [f"Carreira não encontrada: {nome_carreira}"])
+        else:
+            melhores = await self.agrupador.recomendar(perfil, 1)
+            if not melhores:
+                raise ErroRequisicao(404, ["Nenhuma carreira cadastrada"])
+            carreira = melhores[0][0]
+
+        return {'perfil': perfil.nome, 'carreira': carreira.nome,
+                'gaps': self.sistema.identificar_gaps(perfil, carreira)}
+
+    async def _rota_relatorio(self, corpo):
+        # Mesmo relatório de gerar_relatorio_completo (gaps de cada recomendação, em cache)
+        perfil = self._obter_perfil(corpo)
+        relatorio = self.sistema.gerar_relatorio_completo(perfil, self._obter_limite(corpo))
+        return relatorio_para_dict(relatorio)
+
+    async def _ler_requisicao(self, leitor):
+        # Lê uma requisição HTTP; retorna None quando o cliente fecha a conexão.
+        linha = await leitor.readline()
+        if not linha:
+            return None
+
+        partes = linha.decode('latin-1').split()
+        if len(partes) != 3:
+            raise ErroRequisicao(400, ["Linha de requisição inválida"])
+        metodo, caminho, _ = partes
+
+        cabecalhos = {}
+        while True:
+            linha = await leitor.readline()
+            if linha in (b'\r\n', b'\n', b''):
+                break
+            nome, _, valor = linha.decode('latin-1').partition(':')
+            cabecalhos[nome.strip().lower()] = valor.strip()
+
+        tamanho = int(cabecalhos.get('content-length') or 0)
+        if tamanho > TAMANHO_MAXIMO_CORPO:
+            raise ErroRequisicao(413, ["Corpo da requisição muito grande"])
+        corpo = await leitor.readexactly(tamanho) if tamanho else b''
+
+        return metodo, caminho, cabecalhos, corpo
+
+    async def _responder(self, metodo, caminho, corpo):
+        # Executa a rota e devolve (status, dados).
+        rota = self._rotas.get(caminho.split('?', 1)[0])
+        if rota is None:
+            raise ErroRequisicao(404, [f"Rota não encontrada: {caminho}"])
+        if metodo != 'POST':
+            raise ErroRequisicao(405, ["Use POST"])
+
+        try:
+            dados = json.loads(corpo or b'{}')
+        except json.JSONDecodeError:
+            raise ErroRequisicao(400, ["JSON inválido"])
+        if not isinstance(dados, dict):
+            raise ErroRequisicao(400, ["O corpo deve ser um objeto JSON"])
+
+        return 200, await rota(dados)
+
+    async def _atender(self, leitor, escritor):
+        # Atende uma conexão (com keep-alive) até o cliente fechar.
+        try:
+            while True:
+                # Só mantém a conexão depois de ler a requisição inteira: se a
+                # leitura falhar, o resto do corpo seria lido como a próxima
+                manter = False
+                try:
+                    requisicao = await self._ler_requisicao(leitor)
+                    if requisicao is None:
+                        break
+                    metodo, caminho, cabecalhos, corpo = requisicao
+                    manter = cabecalhos.get('connection', '').lower() != 'close'
+                    status, dados = await self._responder(metodo, caminho, corpo)
+                except ErroRequisicao as erro:
+                    status, dados = erro.status, {'erros': erro.erros}
+                except (ValueError, asyncio.IncompleteReadError):
+                    status, dados, manter = 400, {'erros': ["Requisição malformada"]}, False
+                except ConnectionError:
+                    raise
+                except Exception:
+                    status, dados, manter = 500, {'erros': ["Erro interno do servidor"]}, False
+
+                conteudo = json.dumps(dados, ensure_ascii=False).encode('utf-8')
+                escritor.write(
+                    f"HTTP/1.1 {status} {MENSAGENS_STATUS[status]}\r\n"
+                    f"Content-Type: application/json; charset=utf-8\r\n"
+                    f"Content-Length: {len(conteudo)}\r\n"
+                    f"Connection: {'keep-alive' if manter else 'close'}\r\n\r\n".encode('latin-1')
+                    + conteudo
+                )
+                await escritor.drain()
+                if not manter:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            escritor.close()
+
+    async def iniciar(self, host='127.0.0.1', porta=8000):
+        """
+        Começa a aceitar conexões.
+
+        Args:
+            host (str): Endereço de escuta
+            porta (int): Porta de escuta (0 escolhe uma livre)
+
+        Returns:
+            asyncio.Server: Servidor em execução
+        """
+        self.agrupador.iniciar()
+        return await asyncio.start_server(self._atender, host, porta)
+
+    async def parar(self, servidor):
+        """Para de aceitar conexões e encerra o agrupador."""
+        servidor.close()
+        await servidor.wait_closed()
+        await self.agrupador.parar()
+
+
+async def _servir(sistema, host, porta, janela, lote_maximo):
+    servico = ServicoRecomendacao(sistema, janela, lote_maximo)
+    servidor = await servico.iniciar(host, porta)
+    print(f"Servindo em http://{host}:{porta} (Ctrl+C para sair)")
+    async with servidor:
+        await servidor.serve_forever()
+
+
+def main(argumentos=None):
+    # Inicia o serviço com o catálogo padrão ou com o snapshot de um catálogo em arquivo.
+    parser = argparse.ArgumentParser(description="Serviço HTTP de recomendações")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--porta', type=int, default=8000)
+    parser.add_argument('--janela-ms', type=float, default=2.0,
+                        help="Janela de agrupamento das requisições (ms)")
+    parser.add_argument('--lote-maximo', type=int, default=256)
+    parser.add_argument('--catalogo', help="Arquivo de carreiras (.json, .jsonl ou .csv)")
+    parser.add_argument('--competencias', help="Arquivo de competências do catálogo")
+    args = parser.parse_args(argumentos)
+
+    if args.catalogo:
+        from .catalogo import abrir_catalogo
+
+        sistema = abrir_catalogo(args.catalogo, args.competencias).criar_sistema()
+    else:
+        sistema = SistemaRecomendacao(obter_carreiras_futuro())
+
+    try:
+        asyncio.run(_servir(sistema, args.host, args.porta, args.janela_ms / 1000,
+                            args.lote_maximo))
+    except KeyboardInterrupt:
+        print("\nServidor encerrado.")
+
+
+if __name__ == "__main__":
+    main()
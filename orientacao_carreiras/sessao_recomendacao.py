@@ -0,0 +1,143 @@
+# Sessão de recomendação com recálculo incremental.
+#
+# A sessão guarda os pontos do perfil em cada carreira e observa o perfil:
+# quando uma competência muda de nível, só as carreiras que exigem essa
+# competência (linha da MatrizPesos) são atualizadas, somando
+# (nivel_novo - nivel_anterior) * peso. Como os pontos são inteiros, o
+# resultado é exatamente o de um recálculo completo.
+
+from .sistema_recomendacao import RelatorioCarreiras
+
+
+class SessaoRecomendacao:
+    """
+    Mantém as recomendações de um perfil atualizadas a cada competência alterada.
+
+    Alterações feitas com Perfil.adicionar_competencia e
+    Perfil.remover_competencia custam O(carreiras que exigem a competência).
+    Se o catálogo do sistema mudar, os pontos são recalculados por completo
+    na próxima consulta. Use como gerenciador de contexto ou chame fechar()
+    ao final.
+
+    Atributos:
+        sistema (SistemaRecomendacao): Sistema cujo catálogo é usado
+        perfil (Perfil): Perfil acompanhado
+        atualizacoes (int): Células (competência, carreira) atualizadas incrementalmente
+        recalculos (int): Recálculos completos dos pontos
+    """
+
+    def __init__(self, sistema, perfil):
+        """
+        Calcula os pontos iniciais e passa a observar o perfil.
+
+        Args:
+            sistema (SistemaRecomendacao): Sistema de recomendação
+            perfil (Perfil): Perfil do usuário
+        """
+        self.sistema = sistema
+        self.perfil = perfil
+        self.atualizacoes = 0
+        self.recalculos = 0
+
+        self._recalcular()
+        perfil.registrar_observador(self._ao_alterar_competencia)
+
+    def _recalcular(self):
+        # Recalcula todos os pontos com a matriz atual do sistema.
+        self._matriz = self.sistema.obter_matriz()
+        self._versao = self._matriz.versao
+        self._pontos = self._matriz.pontuar_esparso(self.perfil)
+        self.recalculos += 1
+
+    def _atualizada(self):
+        # Retorna a matriz, recalculando os pontos se o catálogo mudou.
+        matriz = self.sistema.obter_matriz()
+        if matriz is not self._matriz or matriz.versao != self._versao:
+            self._recalcular()
+        return self._matriz
+
+    def _ao_alterar_competencia(self, perfil, competencia, nivel_anterior, nivel_novo):
+        # Observador do perfil: aplica a diferença só nas carreiras afetadas.
+        matriz = self._matriz
+        if matriz is not self.sistema.obter_matriz() or matriz.versao != self._versao:
+            return  # Catálogo mudou: a próxima consulta recalcula tudo
+
+        linha = matriz.linhas.get(competencia)
+        if not linha:
+            return
+
+        diferenca = nivel_novo - nivel_anterior
+        pontos = self._pontos
+        for indice, peso in linha.items():
+            valor = pontos.get(indice, 0) + diferenca * peso
+            if valor:
+                pontos[indice] = valor
+            else:
+                del pontos[indice]
+
+        self.atualizacoes += len(linha)
+
+    def pontos(self):
+        """
+        Retorna os pontos atuais do perfil nas carreiras pontuadas.
+
+        Returns:
+            dict: {indice_carreira: pontos} (cópia)
+        """
+        self._atualizada()
+        return dict(self._pontos)
+
+    def compatibilidades(self):
+        """
+        Retorna a compatibilidade atual do perfil com todas as carreiras.
+
+        Returns:
+            list: Percentuais de compatibilidade (0-100), na ordem do catálogo
+        """
+        matriz = self._atualizada()
+        return matriz.compatibilidades_pontos(matriz.densificar(self._pontos))
+
+    def recomendar(self, limite=3):
+        """
+        Gera as recomendações atuais do perfil.
+
+        O resultado é idêntico ao de SistemaRecomendacao.recomendar_carreiras.
+
+        Args:
+            limite (int): Número de recomendações
+
+        Returns:
+            list: Lista de tuplas (carreira, compatibilidade)
+        """
+        return self._atualizada().melhores(self._pontos, limite)
+
+    def relatorio(self, limite=3):
+        """
+        Gera o relatório estruturado atual do perfil (recomendações, gaps e preparação).
+
+        O resultado é idêntico ao de SistemaRecomendacao.gerar_relatorio_completo.
+
+        Args:
+            limite (int): Número de recomendações
+
+        Returns:
+            RelatorioCarreiras: Relatório com RecomendacaoCarreira por carreira
+        """
+        self._atualizada()
+        perfil = self.perfil
+        recomendacoes = self.sistema.recomendacoes_com_gaps(perfil, self._pontos, limite)
+        return RelatorioCarreiras(perfil.nome, len(perfil.competencias), recomendacoes,
+                                  perfil.nivel_preparacao_futuro())
+
+    def fechar(self):
+        """Deixa de observar o perfil."""
+        self.perfil.remover_observador(self._ao_alterar_competencia)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excecao):
+        self.fechar()
+
+    def __repr__(self):
+        return f"SessaoRecomendacao(perfil='{self.perfil.nome}', carreiras_pontuadas={len(self._pontos)})"
@@ -1,16 +1,78 @@
 # Sistema de Recomendação de Carreiras
 
+import heapq
+from collections import namedtuple
+from .cache_recomendacoes import CacheLRU, assinatura_competencias, TAMANHO_CACHE_PADRAO
+from .instrumentacao import Metricas, relogio
+from .matriz_pesos import MatrizPesos, selecionar_melhores
+
+# Uma carreira recomendada, com as competências a desenvolver para ela
+RecomendacaoCarreira = namedtuple('RecomendacaoCarreira', ['carreira', 'compatibilidade', 'gaps'])
+
+# Resultado de SistemaRecomendacao.gerar_relatorio_completo
+RelatorioCarreiras = namedtuple('RelatorioCarreiras',
+                                ['perfil', 'total_competencias', 'recomendacoes',
+                                 'preparacao_futuro'])
+
 class SistemaRecomendacao:
     # Sistema simples para recomendar carreiras baseado no perfil do usuário.
     
-    def __init__(self, carreiras_disponiveis):
+    # Nível mínimo considerado adequado em uma competência exigida
+    NIVEL_ADEQUADO = 3
+    
+    def __init__(self, carreiras_disponiveis, tamanho_cache=TAMANHO_CACHE_PADRAO,
+                 validade_cache=None, matriz=None):
         """
         Inicia o sistema de recomendação.
         
+        As recomendações usam o catálogo compilado na matriz. Para mudar o
+        catálogo use adicionar_carreira; após alterar self.carreiras
+        diretamente, chame recompilar_catalogo para que a mudança valha.
+        
         Args:
             carreiras_disponiveis (list): Lista de objetos Carreira
+            tamanho_cache (int): Resultados guardados em cache (0 desativa o cache)
+            validade_cache (float): Segundos de validade de cada resultado (None = sem limite)
+            matriz (MatrizPesos): Matriz já compilada com as mesmas carreiras, na
+                mesma ordem (ex.: CatalogoCompilado.criar_matriz); padrão: compila
         """
         self.carreiras = carreiras_disponiveis
+        
+        # Matriz de pesos: também é o índice invertido competência -> carreiras
+        self._matriz = matriz if matriz is not None else MatrizPesos(self.carreiras)
+        
+        # Resultados por assinatura de competências, válidos para uma versão do catálogo
+        self._cache = CacheLRU(tamanho_cache, validade_cache) if tamanho_cache > 0 else None
+        self._versao_cache = None
+        
+        # Tempos por etapa e contadores (None = instrumentação desativada)
+        self.metricas = None
+        
+        # Índice IVF de recomendar_aproximado (construído sob demanda)
+        self._indice_aproximado = None
+        
+        # Ranqueador multiobjetivo de recomendar_ranqueado (padrão na primeira chamada)
+        self._ranqueador = None
+        
+        # Calculadora de recomendar_pareto (criada na primeira chamada)
+        self._fronteira = None
+    
+    def ativar_metricas(self, metricas=None):
+        """
+        Passa a registrar tempos por etapa e contadores.
+        
+        Args:
+            metricas (Metricas): Coletor a usar (padrão: um novo)
+            
+        Returns:
+            Metricas: Coletor ativo (exportável com para_prometheus ou para_dict)
+        """
+        self.metricas = metricas if metricas is not None else Metricas()
+        return self.metricas
+    
+    def desativar_metricas(self):
+        """Para de registrar métricas."""
+        self.metricas = None
     
     def calcular_compatibilidade(self, perfil_usuario, carreira):
         """
@@ -23,38 +85,33 @@ class SistemaRecomendacao:
         Returns:
             float: Percentual de compatibilidade (0-100)
         """
-        pontos_usuario = 0
-        pontos_maximos = 0
-        
-        # Verifica competências essenciais (peso 3)
-        for competencia in carreira.requisitos['essenciais']:
-            nivel_usuario = perfil_usuario.obter_nivel_competencia(competencia)
-            pontos_usuario += nivel_usuario * 3
-            pontos_maximos += 5 * 3  # Nível máximo * peso
-        
-        # Verifica competências importantes (peso 2)
-        for competencia in carreira.requisitos['importantes']:
-            nivel_usuario = perfil_usuario.obter_nivel_competencia(competencia)
-            pontos_usuario += nivel_usuario * 2
-            pontos_maximos += 5 * 2
-        
-        # Verifica competências desejáveis (peso 1)
-        for competencia in carreira.requisitos['desejaveis']:
-            nivel_usuario = perfil_usuario.obter_nivel_competencia(competencia)
-            pontos_usuario += nivel_usuario * 1
-            pontos_maximos += 5 * 1
+        # Competências, pesos (3/2/1) e pontuação máxima já compilados na carreira
+        requisitos = carreira.compilar()
         
-        # Calcula percentual
-        if pontos_maximos == 0:
+        if requisitos.pontos_maximos == 0:
             return 0
         
-        compatibilidade = (pontos_usuario / pontos_maximos) * 100
+        obter_nivel = perfil_usuario.obter_nivel_competencia
+        pontos_usuario = 0
+        for competencia, peso in zip(requisitos.competencias, requisitos.pesos):
+            pontos_usuario += obter_nivel(competencia) * peso
+        
+        # Calcula percentual
+        compatibilidade = (pontos_usuario / requisitos.pontos_maximos) * 100
         return round(compatibilidade, 1)
     
     def recomendar_carreiras(self, perfil_usuario, limite=3):
         """
         Gera lista simples de recomendações.
         
+        Perfis com as mesmas competências e níveis reaproveitam o resultado
+        guardado em cache enquanto o catálogo não mudar. Só avalia carreiras
+        que compartilham competências com o perfil (via índice invertido) e
+        para assim que nenhuma carreira restante pode superar as já
+        selecionadas. O resultado é o mesmo de calcular a compatibilidade de
+        todas as carreiras e ordenar: maior compatibilidade primeiro e, em
+        empates, a carreira que vem antes no catálogo.
+        
         Args:
             perfil_usuario (Perfil): Perfil do usuário
             limite (int): Número de recomendações
@@ -62,18 +119,444 @@ class SistemaRecomendacao:
         Returns:
             list: Lista de tuplas (carreira, compatibilidade)
         """
-        recomendacoes = []
+        chave = (limite, assinatura_competencias(perfil_usuario.competencias))
+        recomendacoes = self._consultar_cache(chave)
+        if recomendacoes is None:
+            recomendacoes = self._calcular_recomendacoes(perfil_usuario, limite)
+            self._guardar_cache(chave, tuple(recomendacoes))
+        
+        return list(recomendacoes)
+    
+    def _calcular_recomendacoes(self, perfil_usuario, limite):
+        # Recomendação sem cache (poda pelo índice invertido).
+        if limite <= 0:
+            return self._recomendar_todas(perfil_usuario, limite)
+        
+        matriz = self._matriz
+        carreiras = matriz.carreiras
+        metricas = self.metricas
+        if metricas is not None:
+            inicio = relogio()
+        
+        # Competências do perfil que alguma carreira exige, com a contribuição
+        # máxima de cada uma, da maior para a menor
+        termos = sorted(((nivel * matriz.limite_superior(competencia), competencia)
+                         for competencia, nivel in perfil_usuario.competencias.items()
+                         if competencia in matriz.linhas), reverse=True)
+        
+        # restantes[i] = maior compatibilidade de uma carreira ainda não vista
+        # antes de processar o termo i
+        restantes = [0] * (len(termos) + 1)
+        for i in range(len(termos) - 1, -1, -1):
+            restantes[i] = restantes[i + 1] + termos[i][0]
+        
+        if metricas is not None:
+            agora = relogio()
+            metricas.registrar('selecao_candidatos', agora - inicio)
+            inicio = agora
+        
+        melhores = []  # heap mínimo de (compatibilidade, -indice)
+        avaliadas = set()
+        
+        for i, (_, competencia) in enumerate(termos):
+            # Nenhuma carreira não avaliada consegue entrar no top-k
+            if len(melhores) == limite and melhores[0][0] > round(restantes[i] + 1e-9, 1):
+                break
+            
+            for indice in matriz.linhas[competencia]:
+                if indice in avaliadas:
+                    continue
+                avaliadas.add(indice)
+                
+                compatibilidade = self.calcular_compatibilidade(perfil_usuario,
+                                                                carreiras[indice])
+                item = (compatibilidade, -indice)
+                if len(melhores) < limite:
+                    heapq.heappush(melhores, item)
+                elif item > melhores[0]:
+                    heapq.heapreplace(melhores, item)
+        
+        if metricas is not None:
+            agora = relogio()
+            metricas.registrar('pontuacao', agora - inicio)
+            metricas.contar('carreiras_pontuadas', len(avaliadas))
+            metricas.contar('competencias_consultadas',
+                            sum(len(carreiras[i].compilar().competencias) for i in avaliadas))
+            inicio = agora
+        
+        recomendacoes = [(carreiras[-i], compatibilidade)
+                         for compatibilidade, i in sorted(melhores, reverse=True)
+                         if compatibilidade > 0]
+        
+        # Completa com carreiras sem pontos, na ordem do catálogo
+        if len(recomendacoes) < limite:
+            positivas = {-i for compatibilidade, i in melhores if compatibilidade > 0}
+            for indice, carreira in enumerate(carreiras):
+                if len(recomendacoes) == limite:
+                    break
+                if indice not in positivas:
+                    compatibilidade = self.calcular_compatibilidade(perfil_usuario, carreira)
+                    recomendacoes.append((carreira, compatibilidade))
+        
+        if metricas is not None:
+            metricas.registrar('ordenacao', relogio() - inicio)
+        
+        return recomendacoes
+    
+    def _recomendar_todas(self, perfil_usuario, limite):
+        # Caminho sem poda: calcula a compatibilidade de todas as carreiras.
+        carreiras = self._matriz.carreiras
+        metricas = self.metricas
+        if metricas is not None:
+            inicio = relogio()
+        
+        compatibilidades = [self.calcular_compatibilidade(perfil_usuario, carreira)
+                            for carreira in carreiras]
+        
+        if metricas is None:
+            return self._selecionar(compatibilidades, limite)
+        
+        agora = relogio()
+        metricas.registrar('pontuacao', agora - inicio)
+        metricas.contar('carreiras_pontuadas', len(compatibilidades))
+        metricas.contar('competencias_consultadas',
+                        sum(len(carreira.compilar().competencias) for carreira in carreiras))
+        recomendacoes = self._selecionar(compatibilidades, limite)
+        metricas.registrar('ordenacao', relogio() - agora)
+        return recomendacoes
+    
+    def _consultar_cache(self, chave):
+        # Retorna o resultado guardado ou None; descarta o cache se o catálogo mudou.
+        if self._cache is None:
+            return None
+        
+        versao = (self._matriz, self._matriz.versao)
+        if self._versao_cache != versao:
+            self._cache.limpar()
+            self._versao_cache = versao
+        
+        return self._cache.obter(chave)
+    
+    def _guardar_cache(self, chave, valor):
+        # Guarda um resultado calculado para a versão atual do catálogo.
+        if self._cache is not None:
+            self._cache.guardar(chave, valor)
+    
+    def estatisticas_cache(self):
+        """
+        Retorna os contadores do cache de recomendações.
         
-        # Calcula compatibilidade para cada carreira
+        Returns:
+            dict: {itens, tamanho_maximo, acertos, falhas, remocoes, expiracoes,
+                taxa_acertos} (vazio se o cache estiver desativado)
+        """
+        return self._cache.estatisticas() if self._cache is not None else {}
+    
+    def limpar_cache(self):
+        """Descarta os resultados guardados em cache."""
+        if self._cache is not None:
+            self._cache.limpar()
+    
+    def adicionar_carreira(self, carreira):
+        """
+        Adiciona uma carreira ao catálogo, atualizando o índice.
+        
+        Args:
+            carreira (Carreira): Carreira a adicionar
+        """
+        self.carreiras.append(carreira)
+        self._matriz.adicionar_carreira(carreira)
+    
+    def obter_matriz(self):
+        """
+        Retorna o catálogo compilado em MatrizPesos.
+        
+        Returns:
+            MatrizPesos: Matriz de pesos competência x carreira
+        """
+        return self._matriz
+    
+    def recompilar_catalogo(self):
+        """
+        Reconstrói o índice do catálogo.
+        
+        Requisitos adicionados com Carreira.adicionar_competencia_* e carreiras
+        adicionadas com adicionar_carreira já são indexados automaticamente; use
+        este método apenas após alterar self.carreiras ou carreira.requisitos
+        diretamente. Em todos os casos o cache de recomendações é descartado.
+        """
         for carreira in self.carreiras:
-            compatibilidade = self.calcular_compatibilidade(perfil_usuario, carreira)
-            recomendacoes.append((carreira, compatibilidade))
+            carreira.descartar_compilacao()
         
-        # Ordena por compatibilidade (maior para menor)
-        recomendacoes.sort(key=lambda x: x[1], reverse=True)
+        self._matriz.desconectar()
+        self._matriz = MatrizPesos(self.carreiras)
+    
+    def compatibilidades_lote(self, perfis):
+        """
+        Calcula a matriz perfil x carreira de compatibilidades.
         
-        # Retorna apenas o limite solicitado
-        return recomendacoes[:limite]
+        Args:
+            perfis (iterable): Perfis dos usuários
+            
+        Returns:
+            list: Uma lista de compatibilidades por perfil, na ordem do catálogo compilado
+        """
+        matriz = self.obter_matriz()
+        return [matriz.compatibilidades(perfil) for perfil in perfis]
+    
+    def recomendar_carreiras_lote(self, perfis, limite=3):
+        """
+        Gera recomendações para vários perfis usando a matriz de pesos.
+        
+        O resultado de cada perfil é idêntico ao de recomendar_carreiras.
+        
+        Args:
+            perfis (iterable): Perfis dos usuários
+            limite (int): Número de recomendações por perfil
+            
+        Returns:
+            list: Uma lista de tuplas (carreira, compatibilidade) por perfil
+        """
+        matriz = self._matriz
+        metricas = self.metricas
+        if metricas is None:
+            return [matriz.melhores(matriz.pontuar_esparso(perfil), limite)
+                    for perfil in perfis]
+        
+        resultados = []
+        for perfil in perfis:
+            inicio = relogio()
+            pontos = matriz.pontuar_esparso(perfil)
+            agora = relogio()
+            resultados.append(matriz.melhores(pontos, limite))
+            metricas.registrar('pontuacao', agora - inicio)
+            metricas.registrar('ordenacao', relogio() - agora)
+            metricas.contar('carreiras_pontuadas', len(pontos))
+            metricas.contar('competencias_consultadas', len(perfil.competencias))
+        return resultados
+    
+    def recomendar_repositorio(self, repositorio, limite=3, inicio=0, fim=None):
+        """
+        Gera recomendações para os perfis de um RepositorioPerfis.
+        
+        Lê os níveis direto dos arquivos mapeados em memória, sem criar
+        objetos Perfil. O resultado de cada perfil é idêntico ao de
+        recomendar_carreiras com o perfil materializado.
+        
+        Args:
+            repositorio (RepositorioPerfis): Repositório aberto
+            limite (int): Número de recomendações por perfil
+            inicio (int): Primeira posição a processar
+            fim (int): Posição final (exclusiva); padrão: até o fim
+            
+        Yields:
+            list: Tuplas (carreira, compatibilidade) de cada perfil, em ordem
+        """
+        matriz = self._matriz
+        linhas = matriz.linhas_alinhadas(repositorio.vocabulario)
+        
+        for niveis in repositorio.iterar_niveis(inicio, fim):
+            yield matriz.melhores(matriz.pontuar_niveis_esparso(niveis, linhas), limite)
+    
+    def recomendar_paralelo(self, perfis, limite=3, trabalhadores=None, tamanho_lote=500):
+        """
+        Gera recomendações para muitos perfis usando vários processos.
+        
+        O catálogo é compartilhado com os processos via memória compartilhada
+        e os resultados saem na ordem da entrada, idênticos aos de
+        recomendar_carreiras. Para várias chamadas seguidas, use
+        RecomendadorParalelo diretamente e reaproveite os processos.
+        
+        Args:
+            perfis (iterable): Perfis dos usuários
+            limite (int): Número de recomendações por perfil
+            trabalhadores (int): Número de processos (padrão: número de CPUs)
+            tamanho_lote (int): Perfis enviados por tarefa
+            
+        Yields:
+            list: Tuplas (carreira, compatibilidade) de cada perfil
+        """
+        from .processamento_paralelo import RecomendadorParalelo
+        
+        with RecomendadorParalelo(self, trabalhadores, tamanho_lote) as recomendador:
+            yield from recomendador.recomendar(perfis, limite)
+    
+    def iniciar_sessao(self, perfil_usuario):
+        """
+        Inicia uma sessão que recalcula as recomendações incrementalmente.
+        
+        A cada Perfil.adicionar_competencia ou remover_competencia, a sessão
+        atualiza só as carreiras que exigem a competência alterada.
+        
+        Args:
+            perfil_usuario (Perfil): Perfil do usuário
+            
+        Returns:
+            SessaoRecomendacao: Sessão ligada ao perfil (chamar fechar() ao final)
+        """
+        from .sessao_recomendacao import SessaoRecomendacao
+        
+        return SessaoRecomendacao(self, perfil_usuario)
+    
+    def construir_indice_aproximado(self, grupos=None, sondas=None, semente=42):
+        """
+        Constrói (ou reconstrói) o índice usado por recomendar_aproximado.
+        
+        Args:
+            grupos (int): Número de grupos (padrão: raiz quadrada do catálogo)
+            sondas (int): Grupos pontuados por consulta (padrão: SONDAS_PADRAO)
+            semente (int): Semente do agrupamento
+            
+        Returns:
+            IndiceAproximado: Índice sobre o catálogo atual
+        """
+        from .indice_aproximado import SONDAS_PADRAO, IndiceAproximado
+        
+        self._indice_aproximado = IndiceAproximado(
+            self._matriz, grupos, sondas or SONDAS_PADRAO, semente=semente)
+        return self._indice_aproximado
+    
+    def recomendar_aproximado(self, perfil_usuario, limite=3, sondas=None):
+        """
+        Recomenda carreiras pelo índice aproximado (IVF), para catálogos muito grandes.
+        
+        Só os grupos de carreiras mais promissores para o perfil são
+        pontuados; as compatibilidades retornadas são exatas, mas carreiras
+        de grupos não sondados podem ficar de fora. O índice é construído
+        na primeira chamada e reconstruído se o catálogo mudar.
+        
+        Args:
+            perfil_usuario (Perfil): Perfil do usuário
+            limite (int): Número de recomendações
+            sondas (int): Grupos pontuados (padrão: o do índice)
+            
+        Returns:
+            list: Lista de tuplas (carreira, compatibilidade)
+        """
+        indice = self._indice_aproximado
+        if indice is None or indice.matriz is not self._matriz or indice.desatualizado:
+            indice = self.construir_indice_aproximado(
+                sondas=indice.sondas if indice is not None else None)
+        
+        metricas = self.metricas
+        if metricas is None:
+            return indice.recomendar(perfil_usuario, limite, sondas)
+        
+        inicio = relogio()
+        recomendacoes = indice.recomendar(perfil_usuario, limite, sondas)
+        metricas.registrar('busca_aproximada', relogio() - inicio)
+        return recomendacoes
+    
+    def configurar_ranqueamento(self, pesos=None, pontuadores=()):
+        """
+        Define os pontuadores e pesos usados por recomendar_ranqueado.
+        
+        Args:
+            pesos (dict): {nome: peso}, com nomes 'compatibilidade', 'crescimento',
+                'salario', 'atratividade', 'objetivos' ou de pontuadores extras
+                (padrão: ranqueamento.PESOS_PADRAO)
+            pontuadores (iterable): Instâncias extras de ranqueamento.PontuadorEstatico
+                ou PontuadorDinamico
+            
+        Returns:
+            Ranqueador: Ranqueador configurado
+        """
+        from .ranqueamento import Ranqueador
+        
+        self._ranqueador = Ranqueador(pesos, pontuadores)
+        return self._ranqueador
+    
+    def recomendar_ranqueado(self, perfil_usuario, limite=3):
+        """
+        Recomenda carreiras pela média ponderada de vários critérios.
+        
+        Além da compatibilidade, considera crescimento projetado, salário
+        médio e aderência aos objetivos do perfil (ver configurar_ranqueamento).
+        
+        Args:
+            perfil_usuario (Perfil): Perfil do usuário
+            limite (int): Número de recomendações
+            
+        Returns:
+            list: CarreiraRanqueada (carreira, pontuacao, compatibilidade, componentes)
+        """
+        ranqueador = self._ranqueador or self.configurar_ranqueamento()
+        
+        metricas = self.metricas
+        if metricas is None:
+            return ranqueador.ranquear(perfil_usuario, self._matriz, limite)
+        
+        inicio = relogio()
+        recomendacoes = ranqueador.ranquear(perfil_usuario, self._matriz, limite)
+        metricas.registrar('ranqueamento', relogio() - inicio)
+        return recomendacoes
+    
+    def recomendar_ranqueado_lote(self, perfis, limite=3):
+        """
+        Aplica recomendar_ranqueado a vários perfis.
+        
+        Args:
+            perfis (iterable): Perfis dos usuários
+            limite (int): Recomendações por perfil
+            
+        Yields:
+            list: CarreiraRanqueada de cada perfil, na ordem da entrada
+        """
+        ranqueador = self._ranqueador or self.configurar_ranqueamento()
+        yield from ranqueador.ranquear_lote(perfis, self._matriz, limite)
+    
+    def _obter_fronteira(self):
+        # Calculadora da lista curta de Pareto, reaproveitada entre consultas.
+        if self._fronteira is None:
+            from .fronteira_pareto import FronteiraPareto
+            self._fronteira = FronteiraPareto()
+        return self._fronteira
+    
+    def recomendar_pareto(self, perfil_usuario, compatibilidade_minima=0):
+        """
+        Retorna as carreiras não dominadas (fronteira de Pareto) para o perfil.
+        
+        Uma carreira fica de fora se outra tem compatibilidade, crescimento
+        projetado e salário médio maiores ou iguais, sendo maior em ao menos um.
+        
+        Args:
+            perfil_usuario (Perfil): Perfil do usuário
+            compatibilidade_minima (float): Considera só carreiras com pelo menos
+                essa compatibilidade (0 = todo o catálogo)
+            
+        Returns:
+            list: Tuplas (carreira, compatibilidade), da maior para a menor compatibilidade
+        """
+        fronteira = self._obter_fronteira()
+        
+        metricas = self.metricas
+        if metricas is None:
+            return fronteira.calcular(perfil_usuario, self._matriz, compatibilidade_minima)
+        
+        inicio = relogio()
+        recomendacoes = fronteira.calcular(perfil_usuario, self._matriz, compatibilidade_minima)
+        metricas.registrar('fronteira_pareto', relogio() - inicio)
+        return recomendacoes
+    
+    def recomendar_pareto_lote(self, perfis, compatibilidade_minima=0):
+        """
+        Aplica recomendar_pareto a vários perfis.
+        
+        Args:
+            perfis (iterable): Perfis dos usuários
+            compatibilidade_minima (float): Ver recomendar_pareto
+            
+        Yields:
+            list: Fronteira de cada perfil, na ordem da entrada
+        """
+        fronteira = self._obter_fronteira()
+        yield from fronteira.calcular_lote(perfis, self._matriz, compatibilidade_minima)
+    
+    def _selecionar(self, compatibilidades, limite):
+        # Monta as tuplas (carreira, compatibilidade) das melhores carreiras.
+        carreiras = self._matriz.carreiras
+        return [(carreiras[i], compatibilidades[i])
+                for i in selecionar_melhores(compatibilidades, limite)]
     
     def identificar_gaps(self, perfil_usuario, carreira):
         """
@@ -86,20 +569,105 @@ class SistemaRecomendacao:
         Returns:
             list: Lista de competências a desenvolver
         """
-        gaps = []
+        metricas = self.metricas
+        if metricas is not None:
+            inicio = relogio()
         
-        # Verifica todas as competências da carreira
-        todas_competencias = carreira.obter_todas_competencias()
+        # Requisitos já compilados (essenciais, importantes, desejáveis), sem montar nova lista
+        todas_competencias = carreira.compilar().competencias
+        gaps = self._gaps(perfil_usuario.competencias, todas_competencias)
         
-        for competencia in todas_competencias:
-            nivel_atual = perfil_usuario.obter_nivel_competencia(competencia)
-            
-            # Se não tem a competência ou está abaixo do ideal
-            if nivel_atual < 3:  # Considera 3 como nível mínimo adequado
-                gaps.append(competencia)
+        if metricas is not None:
+            metricas.registrar('gaps', relogio() - inicio)
+            metricas.contar('competencias_consultadas', len(todas_competencias))
         
         return gaps
     
+    def _gaps(self, competencias_perfil, competencias_carreira):
+        # Competências da carreira (na ordem dos requisitos) abaixo do nível adequado.
+        obter_nivel = competencias_perfil.get
+        nivel_minimo = self.NIVEL_ADEQUADO
+        return [competencia for competencia in competencias_carreira
+                if obter_nivel(competencia, 0) < nivel_minimo]
+    
+    def gerar_relatorio_completo(self, perfil_usuario, limite=3):
+        """
+        Gera o relatório estruturado: recomendações, gaps de cada uma e preparação.
+        
+        Uma única passada pelas competências do perfil calcula os pontos em
+        todas as carreiras (pela matriz de pesos) e a preparação para o
+        futuro; os gaps são calculados para todas as carreiras recomendadas,
+        não só a primeira. As recomendações e os gaps são os mesmos de
+        recomendar_carreiras e identificar_gaps, e ficam em cache pela
+        assinatura das competências.
+        
+        Args:
+            perfil_usuario (Perfil): Perfil do usuário
+            limite (int): Número de recomendações
+            
+        Returns:
+            RelatorioCarreiras: Relatório com RecomendacaoCarreira por carreira
+        """
+        metricas = self.metricas
+        if metricas is not None:
+            inicio = relogio()
+        
+        chave = ('relatorio', limite, assinatura_competencias(perfil_usuario.competencias))
+        recomendacoes = self._consultar_cache(chave)
+        
+        if recomendacoes is None:
+            pontos, total_futuro = self._pontuar_com_preparacao(perfil_usuario)
+            recomendacoes = self.recomendacoes_com_gaps(perfil_usuario, pontos, limite)
+            self._guardar_cache(chave, recomendacoes)
+            preparacao = perfil_usuario.classificar_preparacao(total_futuro)
+        else:
+            preparacao = perfil_usuario.nivel_preparacao_futuro()
+        
+        relatorio = RelatorioCarreiras(perfil_usuario.nome, len(perfil_usuario.competencias),
+                                       recomendacoes, preparacao)
+        
+        if metricas is not None:
+            metricas.registrar('relatorio', relogio() - inicio)
+        
+        return relatorio
+    
+    def _pontuar_com_preparacao(self, perfil_usuario):
+        # Uma passada pelas competências: pontos por carreira e soma dos níveis
+        # das competências de preparação para o futuro.
+        linhas = self._matriz.linhas
+        preparacao = frozenset(perfil_usuario.COMPETENCIAS_PREPARACAO)
+        pontos = {}
+        total_futuro = 0
+        
+        for competencia, nivel in perfil_usuario.competencias.items():
+            if competencia in preparacao:
+                total_futuro += nivel
+            linha = linhas.get(competencia)
+            if linha:
+                for indice, peso in linha.items():
+                    pontos[indice] = pontos.get(indice, 0) + nivel * peso
+        
+        return pontos, total_futuro
+    
+    def recomendacoes_com_gaps(self, perfil_usuario, pontos, limite):
+        """
+        Seleciona as melhores carreiras a partir dos pontos e calcula os gaps de cada uma.
+        
+        Args:
+            perfil_usuario (Perfil): Perfil do usuário
+            pontos (dict): {indice_carreira: pontos} do perfil na matriz atual
+            limite (int): Número de recomendações
+            
+        Returns:
+            tuple: RecomendacaoCarreira, da maior para a menor compatibilidade
+        """
+        competencias = perfil_usuario.competencias
+        return tuple(
+            RecomendacaoCarreira(carreira, compatibilidade,
+                                 tuple(self._gaps(competencias, carreira.compilar().competencias)))
+            for carreira, compatibilidade in self._matriz.melhores(pontos, limite)
+        )
+    
     def gerar_relatorio_simples(self, perfil_usuario):
         """
         Gera relatório simples de recomendações.
@@ -110,22 +678,14 @@ class SistemaRecomendacao:
         Returns:
             dict: Relatório com recomendações e análises
         """
-        recomendacoes = self.recomendar_carreiras(perfil_usuario)
+        relatorio = self.gerar_relatorio_completo(perfil_usuario)
+        recomendacoes = relatorio.recomendacoes
         
-        # Pega a melhor recomendação para análise de gaps
-        if recomendacoes:
-            melhor_carreira = recomendacoes[0][0]
-            gaps = self.identificar_gaps(perfil_usuario, melhor_carreira)
-        else:
-            melhor_carreira = None
-            gaps = []
-        
-        relatorio = {
-            'perfil': perfil_usuario.nome,
-            'total_competencias': len(perfil_usuario.competencias),
-            'recomendacoes': recomendacoes,
-            'areas_desenvolver': gaps,
-            'preparacao_futuro': perfil_usuario.nivel_preparacao_futuro()
+        return {
+            'perfil': relatorio.perfil,
+            'total_competencias': relatorio.total_competencias,
+            'recomendacoes': [(r.carreira, r.compatibilidade) for r in recomendacoes],
+            # Gaps da melhor recomendação
+            'areas_desenvolver': list(recomendacoes[0].gaps) if recomendacoes else [],
+            'preparacao_futuro': relatorio.preparacao_futuro
         }
-        
-        return relatorio
\ No newline at end of file
@@ -1,51 +1,263 @@
 # Módulo de validadores e funções auxiliares.
 
 import re
-from datetime import datetime
+import time
 
-def validar_nome(nome):
-    # Valida se o nome é válido.
-   
+# Códigos de erro dos validadores (0 = válido)
+VALIDO = 0
+NOME_VAZIO = 1
+NOME_CURTO = 2
+NOME_LONGO = 3
+NOME_CARACTERES = 4
+IDADE_NAO_INTEIRA = 5
+IDADE_MINIMA = 6
+IDADE_MAXIMA = 7
+NIVEL_NAO_INTEIRO = 8
+NIVEL_FORA_FAIXA = 9
+
+MENSAGENS_ERRO = {
+    NOME_VAZIO: "Nome não pode ser vazio",
+    NOME_CURTO: "Nome deve ter pelo menos 2 caracteres",
+    NOME_LONGO: "Nome deve ter no máximo 50 caracteres",
+    NOME_CARACTERES: "Nome deve conter apenas letras e espaços",
+    IDADE_NAO_INTEIRA: "Idade deve ser um número inteiro",
+    IDADE_MINIMA: "Idade mínima é 14 anos",
+    IDADE_MAXIMA: "Idade máxima é 100 anos",
+    NIVEL_NAO_INTEIRO: "Nível deve ser um número inteiro",
+    NIVEL_FORA_FAIXA: "Nível deve ser entre 1 e 5",
+}
+
+# Regex para permitir apenas letras, espaços e acentos (compilada uma vez)
+PADRAO_NOME = re.compile(r'^[a-zA-ZÀ-ÿ\s]+$')
+
+# Vários nomes válidos separados por "|" (validação em lote)
+_PADRAO_NOMES_UNIDOS = re.compile(r'[a-zA-ZÀ-ÿ\s]+(?:\|[a-zA-ZÀ-ÿ\s]+)*')
+
+# Código de cada valor de byte (0-255) em uma coluna de níveis
+_TABELA_NIVEIS = bytes(VALIDO if 1 <= valor <= 5 else NIVEL_FORA_FAIXA for valor in range(256))
+
+# Converte um código de erro em 1 (erro) ou 0 (válido)
+_TABELA_MASCARA = bytes([0] + [1] * 255)
+
+def _codigo_nome(nome):
+    # Código de erro de um nome.
     if not nome or not isinstance(nome, str):
-        return False, "Nome não pode ser vazio"
+        return NOME_VAZIO
     
     nome = nome.strip()
     
     if len(nome) < 2:
-        return False, "Nome deve ter pelo menos 2 caracteres"
+        return NOME_CURTO
     
     if len(nome) > 50:
-        return False, "Nome deve ter no máximo 50 caracteres"
+        return NOME_LONGO
     
-    # Regex para permitir apenas letras, espaços e acentos
-    if not re.match(r'^[a-zA-ZÀ-ÿ\s]+$', nome):
-        return False, "Nome deve conter apenas letras e espaços"
+    if not PADRAO_NOME.match(nome):
+        return NOME_CARACTERES
     
-    return True, "Nome válido"
+    return VALIDO
 
-def validar_idade(idade):
-    # Valida se a idade é válida.
+def _codigo_idade(idade):
+    # Código de erro de uma idade.
     if not isinstance(idade, int):
-        return False, "Idade deve ser um número inteiro"
+        return IDADE_NAO_INTEIRA
     
     if idade < 14:
-        return False, "Idade mínima é 14 anos"
+        return IDADE_MINIMA
     
     if idade > 100:
-        return False, "Idade máxima é 100 anos"
+        return IDADE_MAXIMA
     
-    return True, "Idade válida"
+    return VALIDO
 
-def validar_nivel(nivel):
-    # Valida se o nível de competência é válido.
+def _codigo_nivel(nivel):
+    # Código de erro de um nível de competência.
     if not isinstance(nivel, int):
-        return False, "Nível deve ser um número inteiro"
+        return NIVEL_NAO_INTEIRO
     
     if nivel < 1 or nivel > 5:
-        return False, "Nível deve ser entre 1 e 5"
+        return NIVEL_FORA_FAIXA
+    
+    return VALIDO
+
+def validar_nome(nome):
+    # Valida se o nome é válido.
+    codigo = _codigo_nome(nome)
+    if codigo:
+        return False, MENSAGENS_ERRO[codigo]
+    
+    return True, "Nome válido"
+
+def validar_idade(idade):
+    # Valida se a idade é válida.
+    codigo = _codigo_idade(idade)
+    if codigo:
+        return False, MENSAGENS_ERRO[codigo]
+    
+    return True, "Idade válida"
+
+def validar_nivel(nivel):
+    # Valida se o nível de competência é válido.
+    codigo = _codigo_nivel(nivel)
+    if codigo:
+        return False, MENSAGENS_ERRO[codigo]
     
     return True, "Nível válido"
 
+def _como_lista(coluna):
+    # Converte array.array, memoryview ou arrays NumPy em lista de valores do Python.
+    tolist = getattr(coluna, 'tolist', None)
+    return tolist() if tolist is not None else coluna
+
+def _validar_faixa(valores, minimo, maximo, codigo_tipo, codigo_menor, codigo_maior):
+    # Códigos de uma coluna de inteiros; min/max resolvem o caso comum sem laço.
+    if not valores:
+        return bytearray()
+    
+    if set(map(type, valores)) == {int} and \
+            minimo <= min(valores) and max(valores) <= maximo:
+        return bytearray(len(valores))
+    
+    return bytearray(
+        codigo_tipo if not isinstance(valor, int)
+        else codigo_menor if valor < minimo
+        else codigo_maior if valor > maximo
+        else VALIDO
+        for valor in valores
+    )
+
+def validar_nomes_lote(nomes):
+    """
+    Valida uma coluna de nomes.
+    
+    Args:
+        nomes (iterable): Nomes, um por linha
+        
+    Returns:
+        bytearray: Código de erro de cada linha (0 = válido)
+    """
+    nomes = list(nomes)
+    
+    # Caso comum (todos válidos): uma única passada da regex sobre os nomes unidos
+    if set(map(type, nomes)) <= {str}:
+        limpos = [nome.strip() for nome in nomes]
+        tamanhos = list(map(len, limpos))
+        unidos = '|'.join(limpos)
+        # O separador não pode aparecer dentro de um nome
+        if not limpos or (2 <= min(tamanhos) and max(tamanhos) <= 50
+                          and unidos.count('|') == len(limpos) - 1
+                          and _PADRAO_NOMES_UNIDOS.fullmatch(unidos)):
+            return bytearray(len(nomes))
+    
+    return bytearray(map(_codigo_nome, nomes))
+
+def validar_idades_lote(idades):
+    """
+    Valida uma coluna de idades.
+    
+    Args:
+        idades (sequence): Idades (lista, array.array ou array NumPy)
+        
+    Returns:
+        bytearray: Código de erro de cada linha (0 = válido)
+    """
+    return _validar_faixa(_como_lista(idades), 14, 100,
+                          IDADE_NAO_INTEIRA, IDADE_MINIMA, IDADE_MAXIMA)
+
+def validar_niveis_lote(niveis):
+    """
+    Valida uma coluna de níveis de competência.
+    
+    Colunas de 1 byte por valor (bytes, array('b'), memoryview, NumPy int8)
+    são traduzidas de uma vez por uma tabela de 256 posições.
+    
+    Args:
+        niveis (sequence): Níveis, um por linha
+        
+    Returns:
+        bytearray: Código de erro de cada linha (0 = válido)
+    """
+    if isinstance(niveis, (bytes, bytearray)) or getattr(niveis, 'itemsize', None) == 1:
+        return bytearray(bytes(niveis).translate(_TABELA_NIVEIS))
+    
+    return _validar_faixa(_como_lista(niveis), 1, 5,
+                          NIVEL_NAO_INTEIRO, NIVEL_FORA_FAIXA, NIVEL_FORA_FAIXA)
+
+class ValidacaoLote:
+    """
+    Resultado da validação de várias colunas com o mesmo número de linhas.
+    
+    Atributos:
+        codigos (dict): {coluna: bytearray com o código de erro de cada linha}
+        mascara (bytearray): 1 nas linhas com algum erro, 0 nas válidas
+        total_invalidas (int): Número de linhas com erro
+    """
+    
+    def __init__(self, codigos):
+        """
+        Combina os códigos das colunas na máscara de erros.
+        
+        Args:
+            codigos (dict): {coluna: bytearray de códigos}
+        """
+        tamanhos = {len(coluna) for coluna in codigos.values()}
+        if len(tamanhos) > 1:
+            raise ValueError("Todas as colunas devem ter o mesmo número de linhas")
+        
+        total = tamanhos.pop() if tamanhos else 0
+        
+        # OU bit a bit das colunas (códigos -> 0/1) usando inteiros grandes, sem laço por linha
+        mascara = 0
+        for coluna in codigos.values():
+            mascara |= int.from_bytes(coluna.translate(_TABELA_MASCARA), 'big')
+        
+        self.codigos = codigos
+        self.mascara = bytearray(mascara.to_bytes(total, 'big'))
+        self.total_invalidas = len(self.mascara) - self.mascara.count(0)
+    
+    def linhas_invalidas(self):
+        """Retorna os índices das linhas com erro, em ordem."""
+        return [linha for linha, erro in enumerate(self.mascara) if erro]
+    
+    def mensagens(self):
+        """
+        Monta as mensagens de erro, apenas para as linhas com erro.
+        
+        Returns:
+            dict: {linha: [mensagens]} na ordem das colunas
+        """
+        return {linha: [MENSAGENS_ERRO[coluna[linha]] for coluna in self.codigos.values()
+                        if coluna[linha]]
+                for linha in self.linhas_invalidas()}
+    
+    def __len__(self):
+        return len(self.mascara)
+    
+    def __repr__(self):
+        return f"ValidacaoLote(linhas={len(self.mascara)}, invalidas={self.total_invalidas})"
+
+def validar_colunas(nomes=None, idades=None, niveis=None):
+    """
+    Valida colunas inteiras de dados de perfis de uma vez.
+    
+    Args:
+        nomes (iterable): Coluna de nomes
+        idades (sequence): Coluna de idades
+        niveis (sequence): Coluna de níveis de competência
+        
+    Returns:
+        ValidacaoLote: Códigos por coluna, máscara de erros e mensagens sob demanda
+    """
+    codigos = {}
+    if nomes is not None:
+        codigos['nome'] = validar_nomes_lote(nomes)
+    if idades is not None:
+        codigos['idade'] = validar_idades_lote(idades)
+    if niveis is not None:
+        codigos['nivel'] = validar_niveis_lote(niveis)
+    
+    return ValidacaoLote(codigos)
+
 def validar_area_atuacao(area):
     # Valida se a área de atuação é válida.
    
@@ -93,7 +305,7 @@ def calcular_percentual_compatibilidade(score_atual, score_maximo):
 def obter_timestamp():
     # Obtém timestamp atual formatado.
     
-    return datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return time.strftime("%Y-%m-%d %H:%M:%S")
 
 def formatar_salario(valor):
     # Formata valor de salário para exibição.
@@ -118,7 +330,7 @@ def gerar_codigo_perfil(nome):
     # Gera código único para o perfil.
     
     nome_limpo = re.sub(r'[^a-zA-Z]', '', nome)[:3].upper()
-    timestamp = datetime.now().strftime("%m%d%H%M")
+    timestamp = time.strftime("%m%d%H%M")
     return f"{nome_limpo}{timestamp}"
 
 # Constantes úteis (tuplas e listas)
@@ -0,0 +1,167 @@
+# Vocabulário de competências: nomes internados em ids inteiros pequenos.
+
+from array import array
+from collections.abc import MutableMapping
+
+from .dados_mock import obter_competencias_base
+
+
+class VocabularioCompetencias:
+    """
+    Associa cada nome de competência a um id inteiro sequencial (0, 1, 2, ...).
+
+    Atributos:
+        nomes (list): Nomes das competências, na posição do seu id
+    """
+
+    def __init__(self, nomes=()):
+        """
+        Inicializa o vocabulário.
+
+        Args:
+            nomes (iterable): Nomes a internar, na ordem dos ids
+        """
+        self.nomes = []
+        self._ids = {}
+
+        for nome in nomes:
+            self.obter_id(nome)
+
+    def obter_id(self, nome):
+        """
+        Retorna o id da competência, internando o nome se ainda não existir.
+
+        Args:
+            nome (str): Nome da competência
+
+        Returns:
+            int: Id da competência
+        """
+        id_competencia = self._ids.get(nome)
+
+        if id_competencia is None:
+            id_competencia = len(self.nomes)
+            self._ids[nome] = id_competencia
+            self.nomes.append(nome)
+
+        return id_competencia
+
+    def buscar_id(self, nome):
+        """Retorna o id da competência ou None, sem internar o nome."""
+        return self._ids.get(nome)
+
+    def obter_nome(self, id_competencia):
+        """Retorna o nome da competência com o id informado."""
+        return self.nomes[id_competencia]
+
+    def __len__(self):
+        return len(self.nomes)
+
+    def __contains__(self, nome):
+        return nome in self._ids
+
+    def __iter__(self):
+        return iter(self.nomes)
+
+    def __repr__(self):
+        return f"VocabularioCompetencias(competencias={len(self.nomes)})"
+
+
+# Vocabulário global, iniciado com as competências base do sistema
+VOCABULARIO = VocabularioCompetencias(obter_competencias_base())
+
+
+class CompetenciasCompactas(MutableMapping):
+    """
+    Dicionário {nome_competencia: nivel} guardado em um vetor de bytes.
+
+    Cada posição do vetor (array('b')) é o nível da competência com aquele
+    id no vocabulário; 0 indica que o perfil não possui a competência. O
+    vetor só cresce até o maior id usado, então um perfil com poucas
+    competências ocupa poucos bytes.
+
+    Atributos:
+        vocabulario (VocabularioCompetencias): Vocabulário dos ids
+        niveis (array): Nível de cada competência, indexado pelo id
+    """
+
+    __slots__ = ('vocabulario', 'niveis', '_total')
+
+    # Tupla com níveis que podem ser guardados
+    NIVEIS_VALIDOS = (1, 2, 3, 4, 5)
+
+    def __init__(self, vocabulario=None, competencias=None):
+        """
+        Inicializa o armazenamento.
+
+        Args:
+            vocabulario (VocabularioCompetencias): Vocabulário (padrão: VOCABULARIO)
+            competencias (dict): Competências iniciais {nome: nivel}
+        """
+        self.vocabulario = vocabulario if vocabulario is not None else VOCABULARIO
+        self.niveis = array('b')
+        self._total = 0
+
+        if competencias:
+            self.update(competencias)
+
+    def obter_nivel_id(self, id_competencia):
+        """Retorna o nível da competência pelo id (0 se não possuir)."""
+        if id_competencia < len(self.niveis):
+            return self.niveis[id_competencia]
+        return 0
+
+    def itens_por_id(self):
+        """Gera pares (id_competencia, nivel) das competências do perfil."""
+        for id_competencia, nivel in enumerate(self.niveis):
+            if nivel:
+                yield id_competencia, nivel
+
+    def get(self, nome, padrao=None):
+        id_competencia = self.vocabulario.buscar_id(nome)
+        if id_competencia is not None and id_competencia < len(self.niveis):
+            nivel = self.niveis[id_competencia]
+            if nivel:
+                return nivel
+        return padrao
+
+    def __getitem__(self, nome):
+        nivel = self.get(nome)
+        if nivel is None:
+            raise KeyError(nome)
+        return nivel
+
+    def __setitem__(self, nome, nivel):
+        if nivel not in self.NIVEIS_VALIDOS:
+            raise ValueError(f"Nível deve ser um dos: {self.NIVEIS_VALIDOS}")
+
+        id_competencia = self.vocabulario.obter_id(nome)
+        if id_competencia >= len(self.niveis):
+            self.niveis.frombytes(bytes(id_competencia + 1 - len(self.niveis)))
+
+        if not self.niveis[id_competencia]:
+            self._total += 1
+        self.niveis[id_competencia] = nivel
+
+    def __delitem__(self, nome):
+        id_competencia = self.vocabulario.buscar_id(nome)
+        if not self.get(nome):
+            raise KeyError(nome)
+
+        self.niveis[id_competencia] = 0
+        self._total -= 1
+
+    def __iter__(self):
+        nomes = self.vocabulario.nomes
+        for id_competencia, nivel in enumerate(self.niveis):
+            if nivel:
+                yield nomes[id_competencia]
+
+    def __len__(self):
+        return self._total
+
+    def __contains__(self, nome):
+        return self.get(nome) is not None
+
+    def __repr__(self):
+        return f"CompetenciasCompactas({dict(self)})"
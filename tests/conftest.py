@@ -0,0 +1,63 @@
+# Dados compartilhados pelos testes: catálogos e perfis pequenos e determinísticos.
+
+import pytest
+
+from orientacao_carreiras.carreira import Carreira
+from orientacao_carreiras.dados_mock import obter_carreiras_futuro
+from orientacao_carreiras.dados_sinteticos import (gerar_competencias, gerar_carreiras,
+                                                   gerar_perfis)
+from orientacao_carreiras.perfil import Perfil
+from orientacao_carreiras.sistema_recomendacao import SistemaRecomendacao
+
+
+def criar_perfil(competencias, nome="Ana Souza", idade=30, area="Tecnologia"):
+    """Cria um Perfil com as competências {nome: nivel} informadas."""
+    perfil = Perfil(nome, idade, area)
+    for competencia, nivel in competencias.items():
+        perfil.adicionar_competencia(competencia, nivel)
+    return perfil
+
+
+def recomendacoes_referencia(sistema, perfil, limite):
+    """Recomendações por força bruta: todas as compatibilidades, ordenação estável."""
+    pares = [(carreira, sistema.calcular_compatibilidade(perfil, carreira))
+             for carreira in sistema.obter_matriz().carreiras]
+    pares.sort(key=lambda par: -par[1])
+    return pares[:limite]
+
+
+@pytest.fixture
+def carreiras_mock():
+    return obter_carreiras_futuro()
+
+
+@pytest.fixture
+def sistema_mock(carreiras_mock):
+    return SistemaRecomendacao(carreiras_mock)
+
+
+@pytest.fixture(scope='session')
+def competencias_sinteticas():
+    return list(gerar_competencias(120))
+
+
+@pytest.fixture
+def carreiras_sinteticas(competencias_sinteticas):
+    return list(gerar_carreiras(competencias_sinteticas, 400))
+
+
+@pytest.fixture
+def perfis_sinteticos(competencias_sinteticas):
+    return list(gerar_perfis(competencias_sinteticas, 40, por_perfil=(1, 12)))
+
+
+@pytest.fixture
+def carreiras_empatadas():
+    # Carreiras com requisitos idênticos (mesma compatibilidade para qualquer perfil)
+    carreiras = []
+    for nome in ("Zeta", "Alfa", "Meio"):
+        carreira = Carreira(nome, crescimento_projetado=100, salario_medio=5000.0)
+        carreira.adicionar_competencia_essencial("programacao")
+        carreira.adicionar_competencia_desejavel("design")
+        carreiras.append(carreira)
+    return carreiras
@@ -0,0 +1,58 @@
+import pytest
+
+from orientacao_carreiras.analise_gaps import MotorGaps
+from orientacao_carreiras.carreira import Carreira
+from orientacao_carreiras.sistema_recomendacao import SistemaRecomendacao
+
+from .conftest import criar_perfil
+
+
+def test_gaps_iguais_a_identificar_gaps(carreiras_sinteticas, perfis_sinteticos):
+    sistema = SistemaRecomendacao(carreiras_sinteticas)
+    motor = MotorGaps(sistema)
+
+    for perfil, analise in zip(perfis_sinteticos, motor.analisar_lote(perfis_sinteticos, 5)):
+        esperadas = sistema.recomendar_carreiras(perfil, 5)
+        assert [(r.carreira, r.compatibilidade) for r in analise.recomendacoes] == esperadas
+        for recomendacao in analise.recomendacoes:
+            assert list(recomendacao.gaps) == sistema.identificar_gaps(perfil, recomendacao.carreira)
+
+
+def test_trilha_ordenada_pelo_ganho(sistema_mock, carreiras_mock):
+    perfil = criar_perfil({'programacao': 2, 'design': 4})
+    analise = MotorGaps(sistema_mock).analisar(perfil, carreiras_mock)
+
+    chaves = [(-gap.ganho_compatibilidade, -gap.prioridade, gap.competencia)
+              for gap in analise.trilha]
+    assert chaves == sorted(chaves)
+    programacao = next(gap for gap in analise.trilha if gap.competencia == 'programacao')
+    assert (programacao.nivel_atual, programacao.nivel_alvo) == (2, 3)
+    assert 'design' not in {gap.competencia for gap in analise.trilha}
+
+
+def test_nivel_minimo_invalido(sistema_mock):
+    with pytest.raises(ValueError, match='essenciais'):
+        MotorGaps(sistema_mock, {'essenciais': 6, 'importantes': 3, 'desejaveis': 2})
+
+
+def test_requisitos_descartados_quando_o_catalogo_muda(sistema_mock):
+    motor = MotorGaps(sistema_mock)
+    perfil = criar_perfil({'programacao': 4})
+    motor.analisar(perfil, limite=4)
+    assert len(motor._requisitos) == 4
+
+    nova = Carreira("Especialista em Ética de IA", crescimento_projetado=300)
+    nova.adicionar_competencia_essencial('etica_digital')
+    sistema_mock.adicionar_carreira(nova)
+    analise = motor.analisar(perfil, [nova])
+
+    assert len(motor._requisitos) == 1
+    assert analise.recomendacoes[0].gaps == ('etica_digital',)
+
+
+def test_cache_de_requisitos_limitado(carreiras_sinteticas, perfis_sinteticos):
+    motor = MotorGaps(SistemaRecomendacao(carreiras_sinteticas), tamanho_cache=8)
+    for perfil in perfis_sinteticos:
+        motor.analisar(perfil, carreiras_sinteticas[:50])
+
+    assert len(motor._requisitos) == 8
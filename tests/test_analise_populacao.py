@@ -0,0 +1,85 @@
+import pytest
+
+from orientacao_carreiras.analise_populacao import (AgregadoPopulacao, AnalisadorPopulacao,
+                                                    _pontos_minimos)
+from orientacao_carreiras.repositorio_perfis import RepositorioPerfis
+from orientacao_carreiras.sistema_recomendacao import SistemaRecomendacao
+from orientacao_carreiras.vocabulario import VocabularioCompetencias
+
+
+@pytest.fixture
+def sistema(carreiras_sinteticas):
+    return SistemaRecomendacao(carreiras_sinteticas, tamanho_cache=0)
+
+
+@pytest.fixture
+def diretorio(tmp_path, perfis_sinteticos, competencias_sinteticas):
+    caminho = str(tmp_path / 'repo')
+    with RepositorioPerfis.gravar(caminho, perfis_sinteticos,
+                                  VocabularioCompetencias(competencias_sinteticas)) as repositorio:
+        assert len(repositorio) == len(perfis_sinteticos)
+    return caminho
+
+
+def sem_medias(painel):
+    # Médias em ponto flutuante dependem da ordem da soma
+    return {chave: valor for chave, valor in painel.items()
+            if chave not in ('score_medio', 'media_competencias')}
+
+
+@pytest.mark.parametrize('limiar', [10, 33.3, 70])
+def test_compativeis_iguais_a_forca_bruta(sistema, perfis_sinteticos, limiar):
+    agregado = AnalisadorPopulacao(sistema, limiar).agregar(iter(perfis_sinteticos))
+
+    compatibilidades = sistema.compatibilidades_lote(perfis_sinteticos)
+    assert agregado.compativeis == [sum(linha[indice] >= limiar for linha in compatibilidades)
+                                    for indice in range(len(sistema.carreiras))]
+    assert agregado.total == len(perfis_sinteticos)
+    assert agregado.soma_score == sum(p.calcular_score_total() for p in perfis_sinteticos)
+
+
+def test_repositorio_e_paralelo_iguais_aos_perfis(sistema, perfis_sinteticos, diretorio):
+    analisador = AnalisadorPopulacao(sistema, 40)
+    esperado = analisador.agregar(perfis_sinteticos).para_dict(sistema.carreiras)
+
+    with RepositorioPerfis(diretorio) as repositorio:
+        colunar = analisador.agregar_repositorio(repositorio).para_dict(sistema.carreiras)
+    paralelo = analisador.agregar_paralelo(diretorio, trabalhadores=2, tamanho_bloco=7)
+
+    assert sem_medias(colunar) == sem_medias(esperado)
+    assert sem_medias(paralelo.para_dict(sistema.carreiras)) == sem_medias(esperado)
+    assert paralelo.soma_media == pytest.approx(
+        sum(p.calcular_media_competencias() for p in perfis_sinteticos))
+
+
+def test_combinar_faixas_igual_ao_total(sistema, perfis_sinteticos):
+    analisador = AnalisadorPopulacao(sistema)
+    total = analisador.agregar(perfis_sinteticos)
+    partes = analisador.agregar(perfis_sinteticos[:15]).combinar(
+        analisador.agregar(perfis_sinteticos[15:]))
+
+    assert sem_medias(partes.para_dict()) == sem_medias(total.para_dict())
+    with pytest.raises(ValueError):
+        partes.combinar(AgregadoPopulacao(len(sistema.carreiras), limiar=50))
+
+
+@pytest.mark.parametrize('limiar', [0, -5, 101])
+def test_limiar_invalido(sistema, limiar):
+    with pytest.raises(ValueError):
+        AnalisadorPopulacao(sistema, limiar)
+
+
+def test_populacao_vazia(sistema):
+    agregado = AnalisadorPopulacao(sistema).agregar([])
+
+    assert agregado.distribuicao_preparacao() == {}
+    assert agregado.proporcao_compativeis() == [0.0] * len(sistema.carreiras)
+
+
+@pytest.mark.parametrize('limiar', [10, 33.3, 70, 99.95, 100])
+@pytest.mark.parametrize('maximo', [15, 3995, 4000, 4010, 12345, 50000])
+def test_pontos_minimos_iguais_a_forca_bruta(maximo, limiar):
+    esperado = next((pontos for pontos in range(maximo + 1)
+                     if round((pontos / maximo) * 100, 1) >= limiar), maximo + 1)
+
+    assert _pontos_minimos([maximo], limiar) == [esperado]
@@ -0,0 +1,54 @@
+import json
+
+import pytest
+
+from orientacao_carreiras import bench
+
+
+def test_regressao_acima_da_tolerancia():
+    baseline = {'top_k': [{'catalogo': 1000, 'limite': 3, 'heap_ms': 1.0, 'sort_ms': 2.0}]}
+    atual = {'top_k': [{'catalogo': 1000, 'limite': 3, 'heap_ms': 1.2, 'sort_ms': 3.0}]}
+
+    regressoes = bench.comparar_baseline(atual, baseline, tolerancia=0.25)
+
+    assert [(r['metrica'], r['chave']) for r in regressoes] == \
+        [('sort_ms', {'catalogo': 1000, 'limite': 3})]
+    assert regressoes[0]['variacao'] == pytest.approx(0.5)
+
+
+def test_metricas_maiores_sao_melhores_e_linhas_sem_par_sao_ignoradas():
+    baseline = {'aproximado': [{'catalogo': 5000, 'sondas': 4, 'recall': 0.9,
+                                'perfis_por_segundo': 1000.0, 'busca_ms': 0.0}]}
+    atual = {'aproximado': [{'catalogo': 5000, 'sondas': 4, 'recall': 0.95,
+                             'perfis_por_segundo': 600.0, 'busca_ms': 5.0},
+                            {'catalogo': 9999, 'sondas': 4, 'recall': 0.1}]}
+
+    regressoes = bench.comparar_baseline(atual, baseline)
+
+    # busca_ms tem baseline 0 (sem referência) e a linha de 9999 não existe na baseline
+    assert [r['metrica'] for r in regressoes] == ['perfis_por_segundo']
+
+
+def test_main_grava_json_e_falha_com_regressao(tmp_path, monkeypatch, capsys):
+    monkeypatch.setitem(bench.ESCALAS['rapida'], 'top_k', {'tamanhos': (200,)})
+    caminho = tmp_path / 'atual.json'
+    bench.main(['top_k', '--escala', 'rapida', '--json', str(caminho)])
+
+    documento = json.loads(caminho.read_text(encoding='utf-8'))
+    assert documento['escala'] == 'rapida'
+    assert {r['limite'] for r in documento['cenarios']['top_k']} == {1, 2, 3, 4, 10, 20}
+
+    # Baseline impossível de alcançar: toda métrica piora
+    for resultado in documento['cenarios']['top_k']:
+        resultado['heap_ms'] = resultado['sort_ms'] = 1e-9
+    baseline = tmp_path / 'baseline.json'
+    baseline.write_text(json.dumps(documento), encoding='utf-8')
+    with pytest.raises(SystemExit) as saida:
+        bench.main(['top_k', '--escala', 'rapida', '--baseline', str(baseline)])
+    assert saida.value.code == 1
+    assert 'REGRESSAO top_k' in capsys.readouterr().out
+
+
+def test_cenario_desconhecido():
+    with pytest.raises(SystemExit):
+        bench.main(['inexistente'])
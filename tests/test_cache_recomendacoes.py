@@ -0,0 +1,98 @@
+import pytest
+
+from orientacao_carreiras.cache_recomendacoes import CacheLRU, assinatura_competencias
+from orientacao_carreiras.carreira import Carreira
+from orientacao_carreiras.sistema_recomendacao import SistemaRecomendacao
+
+from .conftest import criar_perfil
+
+
+class RelogioFalso:
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self):
+        return self.agora
+
+
+def test_assinatura_nao_depende_da_ordem():
+    assert assinatura_competencias({'design': 2, 'programacao': 4}) == \
+        assinatura_competencias({'programacao': 4, 'design': 2})
+    assert assinatura_competencias({'design': 2}) != assinatura_competencias({'design': 3})
+
+
+def test_lru_descarta_o_menos_usado():
+    cache = CacheLRU(2)
+    cache.guardar('a', 1)
+    cache.guardar('b', 2)
+    cache.obter('a')
+    cache.guardar('c', 3)
+
+    assert 'b' not in cache and cache.obter('a') == 1 and cache.obter('c') == 3
+    assert cache.estatisticas()['remocoes'] == 1
+
+
+def test_itens_expiram_apos_a_validade():
+    relogio = RelogioFalso()
+    cache = CacheLRU(4, validade=10, relogio=relogio)
+    cache.guardar('a', 1)
+
+    relogio.agora = 9.9
+    assert cache.obter('a') == 1
+    relogio.agora = 10.0
+    assert cache.obter('a') is None
+    assert cache.estatisticas()['expiracoes'] == 1
+
+
+@pytest.mark.parametrize('tamanho, validade', [(0, None), (4, 0), (4, -1)])
+def test_parametros_invalidos(tamanho, validade):
+    with pytest.raises(ValueError):
+        CacheLRU(tamanho, validade)
+
+
+def test_tamanho_zero_desativa_o_cache(carreiras_mock):
+    sistema = SistemaRecomendacao(carreiras_mock, tamanho_cache=0)
+    perfil = criar_perfil({'programacao': 4})
+
+    assert sistema.recomendar_carreiras(perfil) == sistema.recomendar_carreiras(perfil)
+    assert sistema.estatisticas_cache() == {}
+
+
+def test_perfis_com_as_mesmas_competencias_reaproveitam_o_resultado(sistema_mock):
+    primeiro = sistema_mock.recomendar_carreiras(criar_perfil({'programacao': 4, 'design': 2}))
+    segundo = sistema_mock.recomendar_carreiras(
+        criar_perfil({'design': 2, 'programacao': 4}, nome="Bruno"))
+
+    assert segundo == primeiro
+    assert sistema_mock.estatisticas_cache()['acertos'] == 1
+    # O resultado devolvido é uma cópia: alterá-lo não afeta o cache
+    segundo.clear()
+    assert sistema_mock.recomendar_carreiras(criar_perfil({'programacao': 4, 'design': 2})) == \
+        primeiro
+
+
+def test_cache_descartado_quando_o_catalogo_muda(sistema_mock, carreiras_mock):
+    perfil = criar_perfil({'etica_digital': 5})
+    antes = sistema_mock.recomendar_carreiras(perfil, 1)
+
+    nova = Carreira("Especialista em Ética de IA")
+    nova.adicionar_competencia_essencial('etica_digital')
+    sistema_mock.adicionar_carreira(nova)
+    assert sistema_mock.recomendar_carreiras(perfil, 1) == [(nova, 100.0)] != antes
+
+    carreiras_mock[0].adicionar_competencia_essencial('etica_digital')
+    assert sistema_mock.recomendar_carreiras(perfil, 2)[1][0] is carreiras_mock[0]
+
+    sistema_mock.recompilar_catalogo()
+    sistema_mock.recomendar_carreiras(perfil, 2)
+    assert sistema_mock.estatisticas_cache()['acertos'] == 0
+
+
+def test_limpar_cache(sistema_mock):
+    perfil = criar_perfil({'programacao': 4})
+    sistema_mock.recomendar_carreiras(perfil)
+    sistema_mock.limpar_cache()
+    sistema_mock.recomendar_carreiras(perfil)
+
+    estatisticas = sistema_mock.estatisticas_cache()
+    assert (estatisticas['acertos'], estatisticas['falhas'], estatisticas['itens']) == (0, 2, 1)
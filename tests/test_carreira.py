@@ -0,0 +1,42 @@
+from orientacao_carreiras.carreira import Carreira
+
+
+def criar_carreira():
+    carreira = Carreira("Analista", crescimento_projetado=120, salario_medio=7000.0)
+    carreira.adicionar_competencia_essencial('analise_dados')
+    carreira.adicionar_competencia_importante('comunicacao')
+    carreira.adicionar_competencia_desejavel('design')
+    return carreira
+
+
+def test_requisitos_compilados():
+    compilada = criar_carreira().compilar()
+
+    assert compilada.competencias == ('analise_dados', 'comunicacao', 'design')
+    assert compilada.pesos == (3, 2, 1)
+    assert compilada.pontos_maximos == 5 * (3 + 2 + 1)
+
+
+def test_compilacao_reutilizada_ate_mudar_os_requisitos():
+    carreira = criar_carreira()
+    compilada = carreira.compilar()
+    assert carreira.compilar() is compilada
+
+    # Requisito repetido na mesma categoria não altera a carreira
+    carreira.adicionar_competencia_essencial('analise_dados')
+    assert carreira.compilar() is compilada
+
+    carreira.adicionar_competencia_importante('lideranca')
+    assert carreira.compilar().competencias == ('analise_dados', 'comunicacao', 'lideranca',
+                                                 'design')
+    assert carreira.compilar().pontos_maximos == compilada.pontos_maximos + 5 * 2
+
+
+def test_descartar_compilacao_apos_edicao_direta():
+    carreira = criar_carreira()
+    carreira.compilar()
+
+    carreira.requisitos['desejaveis'].append('inovacao')
+    carreira.descartar_compilacao()
+
+    assert carreira.compilar().competencias[-1] == 'inovacao'
@@ -0,0 +1,114 @@
+import csv
+import json
+import os
+
+import pytest
+
+from orientacao_carreiras.catalogo import (abrir_catalogo, carregar_catalogo, gravar_snapshot,
+                                           CatalogoCompilado)
+from orientacao_carreiras.dados_mock import obter_competencias_base
+from orientacao_carreiras.dados_sinteticos import registro_carreira
+from orientacao_carreiras.sistema_recomendacao import SistemaRecomendacao
+
+from .conftest import criar_perfil
+
+
+@pytest.fixture
+def arquivos(tmp_path, carreiras_mock):
+    # Catálogo de dados_mock em JSON e CSV, com o arquivo de competências
+    competencias = obter_competencias_base()
+    caminhos = {'json': tmp_path / 'carreiras.json', 'csv': tmp_path / 'carreiras.csv',
+                'competencias': tmp_path / 'competencias.json'}
+    caminhos['json'].write_text(json.dumps([registro_carreira(c) for c in carreiras_mock]),
+                                encoding='utf-8')
+    caminhos['competencias'].write_text(
+        json.dumps([c.to_dict() for c in competencias.values()]), encoding='utf-8')
+    with open(caminhos['csv'], 'w', encoding='utf-8', newline='') as arquivo:
+        escritor = csv.writer(arquivo)
+        escritor.writerow(['nome', 'descricao', 'crescimento_projetado', 'salario_medio',
+                           'essenciais', 'importantes', 'desejaveis'])
+        for carreira in carreiras_mock:
+            escritor.writerow([carreira.nome, carreira.descricao, carreira.crescimento_projetado,
+                               carreira.salario_medio]
+                              + [';'.join(carreira.requisitos[categoria])
+                                 for categoria in ('essenciais', 'importantes', 'desejaveis')])
+    return {chave: str(caminho) for chave, caminho in caminhos.items()}
+
+
+@pytest.mark.parametrize('formato', ['json', 'csv'])
+def test_snapshot_recomenda_igual_ao_sistema(arquivos, carreiras_mock, formato):
+    sistema = SistemaRecomendacao(carreiras_mock)
+    perfis = [criar_perfil({'programacao': 4, 'comunicacao': 3}), criar_perfil({})]
+
+    with abrir_catalogo(arquivos[formato], arquivos['competencias']) as catalogo:
+        assert [c.to_dict() for c in catalogo.carreiras()] == [c.to_dict() for c in carreiras_mock]
+        assert set(catalogo.competencias()) == set(obter_competencias_base())
+        for perfil in perfis:
+            for limite in (1, 3, 10):
+                esperado = sistema.recomendar_carreiras(perfil, limite)
+                nomes = [(c.nome, x) for c, x in esperado]
+                assert [(c.nome, x) for c, x in catalogo.recomendar(perfil, limite)] == nomes
+                assert [(c.nome, x) for c, x in
+                        catalogo.criar_sistema().recomendar_carreiras(perfil, limite)] == nomes
+
+
+def test_registros_invalidos_listados_por_linha(tmp_path):
+    caminho = tmp_path / 'carreiras.jsonl'
+    caminho.write_text('{"nome": "Boa", "requisitos": {"essenciais": ["programacao"]}}\n'
+                       '{"nome": "Ruim", "salario_medio": "x"}\n'
+                       'não é json\n'
+                       '{"nome": "Boa"}\n', encoding='utf-8')
+
+    with pytest.raises(ValueError) as erro:
+        carregar_catalogo(str(caminho))
+
+    mensagem = str(erro.value)
+    assert 'linha 2' in mensagem and 'linha 3' in mensagem and 'linha 4' in mensagem
+    assert 'linha 1' not in mensagem
+
+
+def test_snapshot_desatualizado_e_recompilado(arquivos):
+    catalogo = abrir_catalogo(arquivos['json'])
+    with open(arquivos['json'], encoding='utf-8') as arquivo:
+        registros = json.load(arquivo)
+    registros[0]['crescimento_projetado'] = 999
+    with open(arquivos['json'], 'w', encoding='utf-8') as arquivo:
+        json.dump(registros, arquivo)
+
+    assert catalogo.desatualizado(arquivos['json'])
+    with abrir_catalogo(arquivos['json']) as novo:
+        assert novo.hash != catalogo.hash
+        assert novo.obter_carreira(0).crescimento_projetado == 999
+    # O snapshot antigo, ainda mapeado, não foi reescrito no lugar
+    assert catalogo.obter_carreira(0).crescimento_projetado == 200
+    assert catalogo.recomendar(criar_perfil({'programacao': 5}), 1)[0][1] > 0
+    catalogo.fechar()
+
+
+def test_snapshot_e_reaproveitado_sem_mudanca(arquivos):
+    with abrir_catalogo(arquivos['json']) as catalogo:
+        diretorio, hash_origem = catalogo.diretorio, catalogo.hash
+    meta = os.path.join(diretorio, 'meta.json')
+    modificado = os.stat(meta).st_mtime_ns
+
+    with abrir_catalogo(arquivos['json']) as catalogo:
+        assert catalogo.hash == hash_origem
+    assert os.stat(meta).st_mtime_ns == modificado
+
+
+def test_nao_sobrescreve_diretorio_alheio(tmp_path, carreiras_mock):
+    (tmp_path / 'notas.txt').write_text('importante', encoding='utf-8')
+
+    with pytest.raises(ValueError):
+        gravar_snapshot(str(tmp_path), carreiras_mock)
+    assert (tmp_path / 'notas.txt').exists()
+
+
+def test_snapshot_incompleto_nao_abre(tmp_path, carreiras_mock):
+    diretorio = str(tmp_path / 'snapshot')
+    gravar_snapshot(diretorio, carreiras_mock).fechar()
+    os.remove(os.path.join(diretorio, 'meta.json'))
+
+    with pytest.raises(OSError):
+        CatalogoCompilado(diretorio)
+    assert os.listdir(str(tmp_path)) == ['snapshot']
@@ -0,0 +1,69 @@
+import json
+import random
+
+import pytest
+
+from orientacao_carreiras.carreira import Carreira
+from orientacao_carreiras.dados_mock import obter_competencias_base
+from orientacao_carreiras.dados_sinteticos import (REQUISITOS_POR_CARREIRA, SorteadorZipf,
+                                                   gerar_carreiras, gerar_competencias,
+                                                   gerar_registros_perfis, main,
+                                                   registro_carreira)
+from orientacao_carreiras.pipeline import validar_registro
+
+
+def test_mesma_semente_gera_os_mesmos_dados(competencias_sinteticas):
+    def gerar(semente):
+        carreiras = gerar_carreiras(competencias_sinteticas, 50, semente)
+        return ([registro_carreira(carreira) for carreira in carreiras],
+                list(gerar_registros_perfis(competencias_sinteticas, 50, semente)))
+
+    assert gerar(3) == gerar(3)
+    assert gerar(3) != gerar(4)
+    assert list(gerar_competencias(200)) == list(gerar_competencias(200))
+
+
+def test_competencias_comecam_pelas_de_dados_mock():
+    competencias = gerar_competencias(50)
+
+    assert len(competencias) == 50
+    assert list(competencias)[:len(obter_competencias_base())] == list(obter_competencias_base())
+
+
+def test_requisitos_dentro_das_faixas(competencias_sinteticas):
+    for carreira in gerar_carreiras(competencias_sinteticas, 200):
+        for categoria, minimo, maximo in REQUISITOS_POR_CARREIRA:
+            assert minimo <= len(carreira.requisitos[categoria]) <= maximo
+        todas = carreira.obter_todas_competencias()
+        assert len(todas) == len(set(todas))
+
+
+def test_perfis_gerados_sao_validos(competencias_sinteticas):
+    for registro in gerar_registros_perfis(competencias_sinteticas, 200, por_perfil=(1, 5)):
+        perfil, erros = validar_registro(registro)
+        assert erros == [] and 1 <= len(perfil.competencias) <= 5
+
+
+def test_zipf_favorece_as_primeiras_posicoes():
+    sorteador = SorteadorZipf(100, expoente=1.0)
+    gerador = random.Random(1)
+    contagem = [0] * 100
+    for _ in range(20_000):
+        contagem[sorteador.sortear(gerador)] += 1
+
+    assert contagem[0] > contagem[9] > contagem[99]
+    assert sorted(sorteador.sortear_distintos(gerador, 500)) == list(range(100))
+    with pytest.raises(ValueError):
+        SorteadorZipf(0)
+
+
+def test_main_grava_jsonl(tmp_path, capsys):
+    perfis, carreiras = tmp_path / 'perfis.jsonl', tmp_path / 'carreiras.jsonl'
+    main(['--perfis', '30', '--saida', str(perfis), '--competencias', '40',
+          '--carreiras', '10', '--saida-carreiras', str(carreiras)])
+
+    linhas = perfis.read_text(encoding='utf-8').splitlines()
+    assert len(linhas) == 30
+    assert all(validar_registro(json.loads(linha))[1] == [] for linha in linhas)
+    registros = [json.loads(linha) for linha in carreiras.read_text(encoding='utf-8').splitlines()]
+    assert [Carreira.from_dict(r).nome for r in registros] == [f"Carreira {i}" for i in range(10)]
@@ -0,0 +1,74 @@
+import random
+
+import pytest
+
+from orientacao_carreiras.carreira import Carreira
+from orientacao_carreiras.fronteira_pareto import fronteira_pareto
+from orientacao_carreiras.sistema_recomendacao import SistemaRecomendacao
+
+from .conftest import criar_perfil
+
+
+def domina(a, b):
+    return all(x >= y for x, y in zip(a, b)) and a != b
+
+
+def fronteira_referencia(pontos):
+    return [i for i, ponto in enumerate(pontos)
+            if not any(domina(outro, ponto) for outro in pontos)]
+
+
+def pareto_referencia(sistema, perfil, compatibilidade_minima=0):
+    # Força bruta sobre todo o catálogo, na ordem de recomendar_pareto
+    candidatas = [(carreira, sistema.calcular_compatibilidade(perfil, carreira))
+                  for carreira in sistema.obter_matriz().carreiras]
+    candidatas = [(carreira, compatibilidade) for carreira, compatibilidade in candidatas
+                  if compatibilidade >= compatibilidade_minima]
+    pontos = [(compatibilidade, carreira.crescimento_projetado, carreira.salario_medio)
+              for carreira, compatibilidade in candidatas]
+    selecionadas = [candidatas[i] for i in fronteira_referencia(pontos)]
+    return sorted(selecionadas, key=lambda par: -par[1])
+
+
+@pytest.mark.parametrize('dimensoes', [2, 3])
+def test_fronteira_igual_a_forca_bruta(dimensoes):
+    gerador = random.Random(dimensoes)
+    for _ in range(50):
+        # Valores repetidos geram empates e pontos idênticos
+        pontos = [tuple(gerador.randint(0, 6) for _ in range(dimensoes))
+                  for _ in range(gerador.randint(0, 40))]
+        assert fronteira_pareto(pontos) == fronteira_referencia(pontos)
+
+
+@pytest.mark.parametrize('compatibilidade_minima', [0, 20, 50.5])
+def test_recomendar_pareto_igual_a_forca_bruta(carreiras_sinteticas, perfis_sinteticos,
+                                               compatibilidade_minima):
+    sistema = SistemaRecomendacao(carreiras_sinteticas)
+
+    for perfil in perfis_sinteticos:
+        assert sistema.recomendar_pareto(perfil, compatibilidade_minima) == \
+            pareto_referencia(sistema, perfil, compatibilidade_minima)
+
+    assert list(sistema.recomendar_pareto_lote(perfis_sinteticos, compatibilidade_minima)) == \
+        [sistema.recomendar_pareto(perfil, compatibilidade_minima) for perfil in perfis_sinteticos]
+
+
+def test_carreiras_identicas_ficam_todas_na_ordem_do_catalogo(carreiras_empatadas):
+    sistema = SistemaRecomendacao(carreiras_empatadas)
+
+    fronteira = sistema.recomendar_pareto(criar_perfil({'programacao': 4}))
+
+    assert [carreira.nome for carreira, _ in fronteira] == ['Zeta', 'Alfa', 'Meio']
+
+
+def test_fronteira_atualizada_quando_o_catalogo_muda(sistema_mock):
+    perfil = criar_perfil({'programacao': 2})
+    sistema_mock.recomendar_pareto(perfil)
+
+    # Sem requisitos em comum com o perfil, mas domina as demais em crescimento e salário
+    nova = Carreira("Pesquisador Quântico", crescimento_projetado=900, salario_medio=90000.0)
+    nova.adicionar_competencia_essencial('fisica_quantica')
+    sistema_mock.adicionar_carreira(nova)
+
+    assert nova in [carreira for carreira, _ in sistema_mock.recomendar_pareto(perfil)]
+    assert sistema_mock.recomendar_pareto(perfil) == pareto_referencia(sistema_mock, perfil)
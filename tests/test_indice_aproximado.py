@@ -0,0 +1,71 @@
+from orientacao_carreiras.carreira import Carreira
+from orientacao_carreiras.indice_aproximado import IndiceAproximado
+from orientacao_carreiras.sistema_recomendacao import SistemaRecomendacao
+
+from .conftest import criar_perfil
+
+
+def test_todas_as_sondas_da_o_resultado_exato(carreiras_sinteticas, perfis_sinteticos):
+    sistema = SistemaRecomendacao(carreiras_sinteticas, tamanho_cache=0)
+    indice = sistema.construir_indice_aproximado(grupos=10)
+
+    for perfil in perfis_sinteticos:
+        for limite in (1, 5):
+            assert sistema.recomendar_aproximado(perfil, limite, sondas=indice.total_grupos) == \
+                sistema.recomendar_carreiras(perfil, limite)
+
+
+def test_compatibilidades_aproximadas_sao_exatas(carreiras_sinteticas, perfis_sinteticos):
+    sistema = SistemaRecomendacao(carreiras_sinteticas, tamanho_cache=0)
+    sistema.construir_indice_aproximado(grupos=10, sondas=1)
+
+    for perfil in perfis_sinteticos:
+        recomendacoes = sistema.recomendar_aproximado(perfil, 5)
+        assert len(recomendacoes) == 5
+        assert all(sistema.calcular_compatibilidade(perfil, carreira) == compatibilidade
+                   for carreira, compatibilidade in recomendacoes)
+
+
+def test_catalogo_vazio():
+    sistema = SistemaRecomendacao([])
+    perfil = criar_perfil({'programacao': 4})
+
+    assert sistema.recomendar_aproximado(perfil) == []
+    assert sistema.recomendar_carreiras(perfil) == []
+    assert sistema.construir_indice_aproximado().total_grupos == 0
+
+
+def test_indice_fica_desatualizado_quando_o_catalogo_muda(carreiras_mock):
+    sistema = SistemaRecomendacao(carreiras_mock[:-1])
+    indice = IndiceAproximado(sistema.obter_matriz())
+
+    sistema.adicionar_carreira(carreiras_mock[-1])
+
+    assert indice.desatualizado
+
+
+def test_parada_antecipada_nao_perde_empates():
+    # Cota de "Analista" soma 61.2499... em ponto flutuante, mas a compatibilidade
+    # é 49/80 = 61.3, empatada com "Consultor" (46/75), sondado antes por ter cota maior
+    analista = Carreira("Analista")
+    for competencia in ('a1', 'a2', 'a3'):
+        analista.adicionar_competencia_essencial(competencia)
+    for competencia in ('a4', 'a5'):
+        analista.adicionar_competencia_importante(competencia)
+    for competencia in ('a6', 'a7', 'a8'):
+        analista.adicionar_competencia_desejavel(competencia)
+    consultor = Carreira("Consultor")
+    for competencia in ('c1', 'c2', 'c3', 'c4'):
+        consultor.adicionar_competencia_essencial(competencia)
+    consultor.adicionar_competencia_importante('c5')
+    consultor.adicionar_competencia_desejavel('c6')
+
+    perfil = criar_perfil({'a1': 1, 'a2': 4, 'a3': 4, 'a4': 4, 'a5': 3, 'a6': 1, 'a7': 4, 'a8': 3,
+                           'c1': 2, 'c2': 3, 'c3': 5, 'c4': 2, 'c5': 4, 'c6': 2})
+    sistema = SistemaRecomendacao([analista, consultor], tamanho_cache=0)
+    indice = sistema.construir_indice_aproximado(grupos=2)
+    assert indice.tamanhos == [1, 1]
+
+    esperado = sistema.recomendar_carreiras(perfil, 1)
+    assert esperado == [(analista, 61.3)]
+    assert sistema.recomendar_aproximado(perfil, 1, sondas=indice.total_grupos) == esperado
@@ -0,0 +1,62 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import orientacao_carreiras
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _modulos_carregados(codigo):
+    # Módulos de orientacao_carreiras (e alguns da biblioteca padrão) após executar o código.
+    verificacao = (f"{codigo}\nimport sys\n"
+                   "print(sorted(m for m in sys.modules if m.startswith('orientacao_carreiras')"
+                   " or m in ('csv', 'json', 'argparse', 'mmap')))")
+    processo = subprocess.run([sys.executable, '-c', verificacao], capture_output=True, text=True,
+                              cwd=RAIZ, env=dict(os.environ, PYTHONPATH=RAIZ), check=True)
+    return set(eval(processo.stdout))
+
+
+def test_importar_o_pacote_nao_carrega_submodulos():
+    assert _modulos_carregados('import orientacao_carreiras') == {'orientacao_carreiras'}
+
+
+def test_importar_main_nao_carrega_o_pipeline():
+    assert _modulos_carregados('import main') == set()
+
+
+def test_sistema_nao_carrega_cli_nem_validadores():
+    carregados = _modulos_carregados('from orientacao_carreiras import SistemaRecomendacao')
+
+    assert 'orientacao_carreiras.sistema_recomendacao' in carregados
+    assert not carregados & {'orientacao_carreiras.cli', 'orientacao_carreiras.validadores',
+                             'orientacao_carreiras.pipeline', 'json', 'mmap'}
+
+
+def test_nomes_publicos_resolvem_sob_demanda():
+    for nome in orientacao_carreiras.__all__:
+        assert getattr(orientacao_carreiras, nome) is not None
+    assert set(orientacao_carreiras.__all__) <= set(dir(orientacao_carreiras))
+
+    with pytest.raises(AttributeError):
+        orientacao_carreiras.NaoExiste
+
+
+def test_main_em_lote(tmp_path, capsys):
+    import main
+
+    entrada = tmp_path / 'perfis.jsonl'
+    entrada.write_text(json.dumps({"nome": "Ana Souza", "idade": 30,
+                                   "competencias": {"programacao": 5}}) + '\n', encoding='utf-8')
+    saida = tmp_path / 'saida.jsonl'
+    metricas = tmp_path / 'metricas.json'
+
+    main.executar_lote(['recomendar', '--entrada', str(entrada), '--saida', str(saida),
+                        '--metricas', str(metricas)])
+
+    assert "Perfis processados: 1" in capsys.readouterr().out
+    assert json.loads(saida.read_text(encoding='utf-8'))['nome'] == "Ana Souza"
+    assert 'validacao' in json.loads(metricas.read_text(encoding='utf-8'))['etapas']
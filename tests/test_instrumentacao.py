@@ -0,0 +1,63 @@
+import pytest
+
+from orientacao_carreiras.instrumentacao import Histograma, Metricas
+from orientacao_carreiras.sistema_recomendacao import SistemaRecomendacao
+
+from .conftest import criar_perfil
+
+
+def test_metricas_nao_alteram_os_resultados(carreiras_sinteticas, perfis_sinteticos):
+    sistema = SistemaRecomendacao(carreiras_sinteticas, tamanho_cache=0)
+    sem_metricas = [sistema.recomendar_carreiras(perfil, 3) for perfil in perfis_sinteticos]
+
+    metricas = sistema.ativar_metricas()
+    assert [sistema.recomendar_carreiras(perfil, 3) for perfil in perfis_sinteticos] == \
+        sem_metricas
+    assert sistema.recomendar_carreiras_lote(perfis_sinteticos, 3) == sem_metricas
+
+    etapas = metricas.para_dict()['etapas']
+    assert {'selecao_candidatos', 'pontuacao', 'ordenacao'} <= set(etapas)
+    assert etapas['pontuacao']['total'] == 2 * len(perfis_sinteticos)
+    assert metricas.contadores['carreiras_pontuadas'] > 0
+
+
+def test_etapas_de_gaps_e_relatorio(sistema_mock):
+    metricas = sistema_mock.ativar_metricas(Metricas())
+    perfil = criar_perfil({'programacao': 4})
+    sistema_mock.gerar_relatorio_completo(perfil)
+    sistema_mock.identificar_gaps(perfil, sistema_mock.carreiras[0])
+
+    assert {'relatorio', 'gaps'} <= set(metricas.histogramas)
+
+    sistema_mock.desativar_metricas()
+    sistema_mock.identificar_gaps(perfil, sistema_mock.carreiras[0])
+    assert metricas.histogramas['gaps'].total == 1
+
+
+def test_histograma_percentis_e_combinacao():
+    histograma = Histograma((0.001, 0.01, 0.1))
+    for duracao in (0.0005, 0.0005, 0.005, 0.05, 2.0):
+        histograma.observar(duracao)
+
+    assert histograma.acumuladas() == [2, 3, 4, 5]
+    assert (histograma.percentil(40), histograma.percentil(80)) == (0.001, 0.1)
+    assert histograma.percentil(100) == float('inf')
+
+    outro = Histograma((0.001, 0.01, 0.1))
+    outro.observar(0.005)
+    histograma.combinar(outro)
+    assert histograma.total == 6 and histograma.contagens == [2, 2, 1, 1]
+    with pytest.raises(ValueError):
+        histograma.combinar(Histograma((1.0,)))
+
+
+def test_exportacao_prometheus():
+    metricas = Metricas((0.01,))
+    metricas.registrar('pontuacao', 0.002)
+    metricas.contar('carreiras_pontuadas', 7)
+
+    texto = metricas.para_prometheus()
+
+    assert 'orientacao_carreiras_etapa_segundos_bucket{etapa="pontuacao",le="0.01"} 1' in texto
+    assert 'orientacao_carreiras_etapa_segundos_count{etapa="pontuacao"} 1' in texto
+    assert 'orientacao_carreiras_carreiras_pontuadas_total 7' in texto
@@ -0,0 +1,77 @@
+import random
+
+import pytest
+
+from orientacao_carreiras.matriz_pesos import MatrizPesos, selecionar_esparso, selecionar_melhores
+from orientacao_carreiras.sistema_recomendacao import SistemaRecomendacao
+
+from .conftest import criar_perfil
+
+
+def referencia(compatibilidades, limite):
+    # Ordenação estável decrescente seguida de [:limite]
+    return sorted(range(len(compatibilidades)), key=lambda i: -compatibilidades[i])[:limite]
+
+
+def matriz_equivalente(matriz, outra):
+    # Mesmas linhas, máximos e colunas
+    return (matriz.linhas == outra.linhas and matriz.pontos_maximos == outra.pontos_maximos
+            and matriz.carreiras == outra.carreiras)
+
+
+@pytest.mark.parametrize('limite', [1, 2, 5, 40, 1000, 0, -3])
+def test_selecionar_melhores_igual_a_ordenacao(limite):
+    gerador = random.Random(7)
+    # Poucos valores distintos em um catálogo grande: muitos empates, caminho do heap
+    compatibilidades = [gerador.choice([0, 12.5, 33.3, 50.0, 100.0]) for _ in range(2000)]
+
+    assert selecionar_melhores(compatibilidades, limite) == referencia(compatibilidades, limite)
+
+
+@pytest.mark.parametrize('limite', [1, 3, 50, 300, 0, -1])
+def test_selecionar_esparso_igual_a_ordenacao(limite):
+    gerador = random.Random(11)
+    maximos = [gerador.choice([0, 10, 15, 30]) for _ in range(300)]
+    pontos = {i: gerador.randint(1, maximo) for i, maximo in enumerate(maximos)
+              if maximo and gerador.random() < 0.2}
+    compatibilidades = [round(pontos.get(i, 0) / m * 100, 1) if m else 0
+                        for i, m in enumerate(maximos)]
+
+    esperado = [(i, compatibilidades[i]) for i in referencia(compatibilidades, limite)]
+    assert selecionar_esparso(pontos, maximos, limite) == esperado
+
+
+def test_limite_superior_limita_a_compatibilidade(carreiras_sinteticas, perfis_sinteticos):
+    matriz = MatrizPesos(carreiras_sinteticas)
+
+    for perfil in perfis_sinteticos:
+        limite = sum(nivel * matriz.limite_superior(competencia)
+                     for competencia, nivel in perfil.competencias.items())
+        # Folga do arredondamento para uma casa decimal
+        assert max(matriz.compatibilidades(perfil)) <= limite + 0.05
+
+
+def test_requisito_adicionado_atualiza_o_indice(carreiras_mock):
+    sistema = SistemaRecomendacao(carreiras_mock)
+    perfil = criar_perfil({'etica_digital': 5})
+    assert sistema.recomendar_carreiras(perfil, 1)[0][1] == 0.0
+
+    carreiras_mock[2].adicionar_competencia_essencial('etica_digital')
+
+    assert sistema.recomendar_carreiras(perfil, 4) == \
+        SistemaRecomendacao(carreiras_mock).recomendar_carreiras(perfil, 4)
+    assert sistema.recomendar_carreiras(perfil, 1)[0][0] is carreiras_mock[2]
+    assert matriz_equivalente(sistema.obter_matriz(), MatrizPesos(carreiras_mock))
+
+
+def test_csr_ida_e_volta(carreiras_sinteticas, perfis_sinteticos):
+    matriz = MatrizPesos(carreiras_sinteticas)
+    vetores = matriz.para_csr()
+
+    lida = MatrizPesos.de_csr(matriz.carreiras, matriz.vocabulario, vetores['inicios'],
+                              vetores['indices'], vetores['pesos'], vetores['maximos'])
+
+    assert matriz_equivalente(lida, matriz)
+    assert lida.linhas_id == matriz.linhas_id
+    assert all(lida.compatibilidades(perfil) == matriz.compatibilidades(perfil)
+               for perfil in perfis_sinteticos)
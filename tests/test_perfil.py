@@ -0,0 +1,48 @@
+from datetime import datetime
+
+import pytest
+
+from orientacao_carreiras.carreira import Carreira
+from orientacao_carreiras.competencia import Competencia
+from orientacao_carreiras.perfil import Perfil, PerfilCompacto
+
+from .conftest import criar_perfil
+
+
+@pytest.mark.parametrize('objeto', [
+    Perfil("Ana"), PerfilCompacto("Ana"), Carreira("Analista"),
+    Competencia("programacao", "tecnica"),
+])
+def test_sem_dict_por_instancia(objeto):
+    assert not hasattr(objeto, '__dict__')
+    with pytest.raises(AttributeError):
+        objeto.atributo_novo = 1
+
+
+def test_objetivos_alocados_so_quando_usados():
+    perfil = Perfil("Ana")
+    assert perfil.obter_objetivos() == ()
+    assert perfil._objetivos is None
+
+    perfil.objetivos.append("Empreender")
+    assert perfil.obter_objetivos() == ("Empreender",)
+
+
+def test_data_criacao_em_segundos():
+    perfil = Perfil("Ana")
+    perfil.data_criacao = datetime(2025, 3, 4, 10, 30, 15)
+
+    assert perfil.data_criacao == datetime(2025, 3, 4, 10, 30, 15)
+    assert perfil.timestamp_criacao == int(datetime(2025, 3, 4, 10, 30, 15).timestamp())
+
+
+def test_to_dict_ida_e_volta():
+    perfil = criar_perfil({'programacao': 4, 'lideranca': 2})
+    perfil.objetivos = ["Liderar projetos e equipes"]
+    perfil.data_criacao = datetime(2025, 3, 4, 10, 30)
+
+    dados = perfil.to_dict()
+    copia = Perfil.from_dict(dados)
+
+    assert copia.to_dict() == dados
+    assert dados['total_competencias'] == 2 and dados['score_total'] == 6
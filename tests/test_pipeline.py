@@ -0,0 +1,82 @@
+import json
+
+from orientacao_carreiras.pipeline import (executar_recomendacao, validar_registro, em_lotes,
+                                           ler_registros)
+
+REGISTRO_VALIDO = {"nome": "Ana Souza", "idade": 30, "area_atuacao": "Tecnologia",
+                   "competencias": {"programacao": 4}, "objetivos": ["Empreender"]}
+
+
+def _executar(tmp_path, linhas, sistema):
+    entrada = tmp_path / 'perfis.jsonl'
+    saida = tmp_path / 'saida.jsonl'
+    entrada.write_text('\n'.join(linhas) + '\n', encoding='utf-8')
+    totais = executar_recomendacao(str(entrada), str(saida), sistema, tamanho_lote=2)
+    resultados = [json.loads(linha) for linha in saida.read_text(encoding='utf-8').splitlines()]
+    return totais, resultados
+
+
+def test_registro_valido_cria_perfil():
+    perfil, erros = validar_registro(REGISTRO_VALIDO)
+
+    assert erros == []
+    assert perfil.nome == "Ana Souza"
+    assert perfil.competencias == {"programacao": 4}
+    assert perfil.objetivos == ["Empreender"]
+
+
+def test_objetivos_com_tipo_errado_sao_rejeitados():
+    for objetivos in (5, "Empreender", [1, 2], ["ok", ""], {"a": 1}):
+        perfil, erros = validar_registro(dict(REGISTRO_VALIDO, objetivos=objetivos))
+        assert perfil is None
+        assert any("Objetivos" in erro for erro in erros), objetivos
+
+
+def test_nome_de_competencia_nao_textual_e_rejeitado():
+    perfil, erros = validar_registro(dict(REGISTRO_VALIDO, competencias={1: 3, "design": 9}))
+
+    assert perfil is None
+    assert len(erros) == 2
+
+
+def test_registro_malformado_nao_interrompe_o_lote(tmp_path, sistema_mock):
+    linhas = [
+        json.dumps(REGISTRO_VALIDO),
+        json.dumps(dict(REGISTRO_VALIDO, objetivos=5)),
+        '{json quebrado',
+        json.dumps(dict(REGISTRO_VALIDO, nome="Bruno Lima", competencias={"design": 5})),
+    ]
+    totais, resultados = _executar(tmp_path, linhas, sistema_mock)
+
+    assert totais == {'processados': 4, 'validos': 2, 'invalidos': 2}
+    assert [resultado['linha'] for resultado in resultados] == [1, 2, 3, 4]
+    assert 'erros' in resultados[1] and 'erros' in resultados[2]
+    assert resultados[3]['nome'] == "Bruno Lima"
+
+
+def test_recomendacoes_iguais_ao_sistema(tmp_path, sistema_mock):
+    _, resultados = _executar(tmp_path, [json.dumps(REGISTRO_VALIDO)], sistema_mock)
+    perfil, _ = validar_registro(REGISTRO_VALIDO)
+
+    esperado = [{'carreira': carreira.nome, 'compatibilidade': compatibilidade}
+                for carreira, compatibilidade in sistema_mock.recomendar_carreiras(perfil)]
+    assert resultados[0]['recomendacoes'] == esperado
+
+
+def test_csv_converte_colunas_compostas(tmp_path):
+    caminho = tmp_path / 'perfis.csv'
+    caminho.write_text("nome,idade,area_atuacao,competencias,objetivos\n"
+                       "Ana Souza,30,TI,programacao:4;design:3,Empreender|Aumentar salário\n"
+                       "Bruno Lima,x,TI,,\n", encoding='utf-8')
+    with open(caminho, encoding='utf-8', newline='') as arquivo:
+        registros = list(ler_registros(arquivo, 'csv'))
+
+    numero, registro = registros[0]
+    assert numero == 2
+    assert registro['competencias'] == {'programacao': 4, 'design': 3}
+    assert registro['objetivos'] == ['Empreender', 'Aumentar salário']
+    assert validar_registro(registros[1][1])[0] is None
+
+
+def test_em_lotes():
+    assert list(em_lotes(range(5), 2)) == [[0, 1], [2, 3], [4]]
@@ -0,0 +1,51 @@
+from multiprocessing import shared_memory
+
+import pytest
+
+from orientacao_carreiras import processamento_paralelo
+from orientacao_carreiras.processamento_paralelo import RecomendadorParalelo
+from orientacao_carreiras.sistema_recomendacao import SistemaRecomendacao
+
+from .conftest import criar_perfil
+
+
+def test_paralelo_igual_ao_serial_e_na_ordem(carreiras_sinteticas, perfis_sinteticos):
+    sistema = SistemaRecomendacao(carreiras_sinteticas, tamanho_cache=0)
+    # Competência fora do catálogo não pontua e não quebra o vetor de níveis
+    perfis = perfis_sinteticos + [criar_perfil({'competencia_fora_do_catalogo': 5})]
+
+    resultados = list(sistema.recomendar_paralelo(iter(perfis), limite=4, trabalhadores=2,
+                                                  tamanho_lote=3))
+
+    assert resultados == [sistema.recomendar_carreiras(perfil, 4) for perfil in perfis]
+
+
+def test_recomendador_reaproveitado(sistema_mock, perfis_sinteticos):
+    with RecomendadorParalelo(sistema_mock, trabalhadores=1, tamanho_lote=7) as recomendador:
+        for limite in (1, 0):
+            assert list(recomendador.recomendar(perfis_sinteticos, limite)) == \
+                [sistema_mock.recomendar_carreiras(perfil, limite) for perfil in perfis_sinteticos]
+
+
+def test_tamanho_de_lote_invalido(sistema_mock):
+    with pytest.raises(ValueError):
+        RecomendadorParalelo(sistema_mock, tamanho_lote=0)
+
+
+def test_memoria_liberada_se_o_executor_falha(sistema_mock, monkeypatch):
+    blocos = []
+
+    class MemoriaRegistrada(shared_memory.SharedMemory):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            blocos.append(self.name)
+
+    monkeypatch.setattr(processamento_paralelo.shared_memory, 'SharedMemory', MemoriaRegistrada)
+
+    # ProcessPoolExecutor recusa max_workers negativo
+    with pytest.raises(ValueError):
+        RecomendadorParalelo(sistema_mock, trabalhadores=-1)
+
+    assert len(blocos) == 1
+    with pytest.raises(FileNotFoundError):
+        shared_memory.SharedMemory(name=blocos[0])
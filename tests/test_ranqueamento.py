@@ -0,0 +1,104 @@
+import pytest
+
+from orientacao_carreiras.ranqueamento import (Pontuador, PontuadorDinamico, PontuadorEstatico,
+                                               Ranqueador, radicais)
+from orientacao_carreiras.sistema_recomendacao import SistemaRecomendacao
+
+from .conftest import criar_perfil
+
+
+def _referencia(ranqueador, perfil, matriz, limite):
+    # Média ponderada de todos os pontuadores em todas as carreiras, ordenação estável.
+    pontos = matriz.pontuar_esparso(perfil)
+    totais = [0.0] * len(matriz)
+    for nome, pontuador in ranqueador.pontuadores.items():
+        fracao = ranqueador.pesos[nome] / sum(ranqueador.pesos.values())
+        if pontuador.estatico:
+            valores = dict(enumerate(pontuador.coluna(matriz)))
+        else:
+            valores = pontuador.pontuar(perfil, matriz, pontos, pontuador.preparar(matriz))
+        for indice, valor in valores.items():
+            totais[indice] += fracao * valor
+    ordem = sorted(range(len(totais)), key=lambda indice: -totais[indice])
+    return [round(totais[indice] * 100, 1) for indice in ordem[:limite]]
+
+
+@pytest.mark.parametrize('pesos', [None, {'crescimento': 1, 'salario': 1},
+                                   {'compatibilidade': 0.5, 'objetivos': 0.5, 'atratividade': 0.2}])
+def test_ranqueamento_igual_a_forca_bruta(carreiras_sinteticas, perfis_sinteticos, pesos):
+    sistema = SistemaRecomendacao(carreiras_sinteticas)
+    ranqueador = sistema.configurar_ranqueamento(pesos)
+    matriz = sistema.obter_matriz()
+
+    for perfil in perfis_sinteticos:
+        for limite in (1, 5):
+            obtido = sistema.recomendar_ranqueado(perfil, limite)
+            assert [item.pontuacao for item in obtido] == \
+                _referencia(ranqueador, perfil, matriz, limite)
+
+
+def test_so_compatibilidade_igual_a_recomendar_carreiras(carreiras_sinteticas, perfis_sinteticos):
+    sistema = SistemaRecomendacao(carreiras_sinteticas)
+    sistema.configurar_ranqueamento({'compatibilidade': 1})
+
+    for perfil, lote in zip(perfis_sinteticos, sistema.recomendar_ranqueado_lote(perfis_sinteticos, 4)):
+        esperado = sistema.recomendar_carreiras(perfil, 4)
+        assert [(item.carreira, item.compatibilidade) for item in lote] == esperado
+
+
+def test_objetivos_aproximam_carreiras_relacionadas(sistema_mock):
+    perfil = criar_perfil({})
+    perfil.adicionar_objetivo("Liderar projetos e equipes")
+    sistema_mock.configurar_ranqueamento({'objetivos': 1})
+
+    [melhor] = sistema_mock.recomendar_ranqueado(perfil, 1)
+
+    assert melhor.carreira.nome == "Gerente de Projetos"
+    assert melhor.componentes == {'objetivos': 1.0}
+    assert perfil.obter_objetivos() == ("Liderar projetos e equipes",)
+    assert radicais("Análise de DADOS") == {'analis', 'dados'}
+
+
+def test_pontuador_personalizado(sistema_mock, carreiras_mock):
+    class PontuadorNome(PontuadorEstatico):
+        nome = 'nome_curto'
+
+        def coluna(self, matriz):
+            return [1.0 if len(carreira.nome) < 18 else 0.0 for carreira in matriz.carreiras]
+
+    sistema_mock.configurar_ranqueamento({'nome_curto': 1}, [PontuadorNome()])
+    melhores = sistema_mock.recomendar_ranqueado(criar_perfil({}), 1)
+
+    assert melhores[0].carreira is next(c for c in carreiras_mock if len(c.nome) < 18)
+
+
+def test_pontuadores_abstratos():
+    with pytest.raises(TypeError):
+        PontuadorEstatico()
+    with pytest.raises(TypeError):
+        PontuadorDinamico()
+
+    class SemPontuar(PontuadorDinamico):
+        nome = 'incompleto'
+
+    with pytest.raises(TypeError):
+        SemPontuar()
+    with pytest.raises(TypeError):
+        Ranqueador({'compatibilidade': 1}, [Pontuador()])
+
+
+@pytest.mark.parametrize('pesos', [{'inexistente': 1}, {'salario': -1}, {'salario': True},
+                                   {'salario': 0}])
+def test_pesos_invalidos(pesos):
+    with pytest.raises(ValueError):
+        Ranqueador(pesos)
+
+
+def test_colunas_recalculadas_quando_o_catalogo_muda(carreiras_mock):
+    sistema = SistemaRecomendacao(carreiras_mock[:-1])
+    ranqueador = sistema.configurar_ranqueamento({'salario': 1})
+    antes = ranqueador.colunas(sistema.obter_matriz())['salario']
+
+    sistema.adicionar_carreira(carreiras_mock[-1])
+
+    assert len(ranqueador.colunas(sistema.obter_matriz())['salario']) == len(antes) + 1
@@ -0,0 +1,56 @@
+import pytest
+
+from orientacao_carreiras.sistema_recomendacao import SistemaRecomendacao
+
+from .conftest import criar_perfil, recomendacoes_referencia
+
+
+def relatorio_referencia(sistema, perfil):
+    # gerar_relatorio_simples original: recomendações, gaps da melhor e preparação
+    recomendacoes = recomendacoes_referencia(sistema, perfil, 3)
+    return {
+        'perfil': perfil.nome,
+        'total_competencias': len(perfil.competencias),
+        'recomendacoes': recomendacoes,
+        'areas_desenvolver': (sistema.identificar_gaps(perfil, recomendacoes[0][0])
+                              if recomendacoes else []),
+        'preparacao_futuro': perfil.nivel_preparacao_futuro(),
+    }
+
+
+def test_relatorio_simples_igual_ao_calculo_separado(carreiras_sinteticas, perfis_sinteticos):
+    sistema = SistemaRecomendacao(carreiras_sinteticas)
+
+    for perfil in perfis_sinteticos:
+        assert sistema.gerar_relatorio_simples(perfil) == relatorio_referencia(sistema, perfil)
+        # Segunda chamada vem do cache e é igual
+        assert sistema.gerar_relatorio_simples(perfil) == relatorio_referencia(sistema, perfil)
+
+
+@pytest.mark.parametrize('limite', [1, 5])
+def test_relatorio_completo_tem_gaps_de_todas_as_recomendacoes(sistema_mock, limite):
+    perfil = criar_perfil({'programacao': 4, 'comunicacao': 2, 'adaptabilidade': 5})
+
+    relatorio = sistema_mock.gerar_relatorio_completo(perfil, limite)
+
+    assert [(r.carreira, r.compatibilidade) for r in relatorio.recomendacoes] == \
+        sistema_mock.recomendar_carreiras(perfil, limite)
+    for recomendacao in relatorio.recomendacoes:
+        assert list(recomendacao.gaps) == \
+            sistema_mock.identificar_gaps(perfil, recomendacao.carreira)
+    assert relatorio.preparacao_futuro == perfil.nivel_preparacao_futuro()
+
+
+def test_relatorio_de_catalogo_vazio():
+    relatorio = SistemaRecomendacao([]).gerar_relatorio_simples(criar_perfil({'programacao': 4}))
+
+    assert relatorio['recomendacoes'] == [] and relatorio['areas_desenvolver'] == []
+
+
+def test_preparacao_recalculada_com_resultado_em_cache(sistema_mock):
+    # Perfis com as mesmas competências compartilham o cache, mas não o nome
+    sistema_mock.gerar_relatorio_completo(criar_perfil({'inovacao': 5}, nome="Ana"))
+    relatorio = sistema_mock.gerar_relatorio_completo(criar_perfil({'inovacao': 5}, nome="Bia"))
+
+    assert relatorio.perfil == "Bia"
+    assert relatorio.preparacao_futuro == criar_perfil({'inovacao': 5}).nivel_preparacao_futuro()
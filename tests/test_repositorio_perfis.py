@@ -0,0 +1,60 @@
+import pytest
+
+from orientacao_carreiras.perfil import Perfil
+from orientacao_carreiras.repositorio_perfis import EscritorPerfis, RepositorioPerfis
+from orientacao_carreiras.sistema_recomendacao import SistemaRecomendacao
+from orientacao_carreiras.vocabulario import VocabularioCompetencias
+
+
+@pytest.fixture
+def vocabulario(competencias_sinteticas):
+    return VocabularioCompetencias(competencias_sinteticas)
+
+
+def test_ida_e_volta(tmp_path, perfis_sinteticos, vocabulario):
+    perfis_sinteticos[0].objetivos = ["Empreender", "Trabalhar no exterior"]
+    with RepositorioPerfis.gravar(str(tmp_path / 'repo'), perfis_sinteticos,
+                                  vocabulario) as repositorio:
+        assert len(repositorio) == len(perfis_sinteticos)
+        for original, lido in zip(perfis_sinteticos, repositorio):
+            assert lido.to_dict() == original.to_dict()
+        assert repositorio.materializar(3, compacto=True).competencias == \
+            perfis_sinteticos[3].competencias
+
+
+def test_recomendar_repositorio_igual_aos_perfis(tmp_path, carreiras_sinteticas,
+                                                perfis_sinteticos, vocabulario):
+    sistema = SistemaRecomendacao(carreiras_sinteticas, tamanho_cache=0)
+    with RepositorioPerfis.gravar(str(tmp_path / 'repo'), perfis_sinteticos,
+                                  vocabulario) as repositorio:
+        resultados = list(sistema.recomendar_repositorio(repositorio, 5, inicio=2, fim=30))
+
+    assert resultados == [sistema.recomendar_carreiras(perfil, 5)
+                          for perfil in perfis_sinteticos[2:30]]
+
+
+def test_competencia_fora_do_vocabulario(tmp_path):
+    perfil = Perfil("Ana Souza", 30)
+    perfil.adicionar_competencia("desconhecida", 3)
+
+    with EscritorPerfis(str(tmp_path), VocabularioCompetencias(['programacao'])) as escritor:
+        with pytest.raises(ValueError):
+            escritor.adicionar(perfil)
+        assert escritor.total == 0
+
+
+def test_excecao_durante_a_gravacao_nao_deixa_repositorio_valido(tmp_path, perfis_sinteticos,
+                                                                vocabulario):
+    diretorio = str(tmp_path / 'repo')
+    RepositorioPerfis.gravar(diretorio, perfis_sinteticos[:5], vocabulario).fechar()
+
+    def perfis_com_falha():
+        yield from perfis_sinteticos
+        raise RuntimeError("entrada interrompida")
+
+    with pytest.raises(RuntimeError):
+        RepositorioPerfis.gravar(diretorio, perfis_com_falha(), vocabulario)
+
+    # Nem o repositório truncado nem o meta.json anterior podem ser abertos
+    with pytest.raises(FileNotFoundError):
+        RepositorioPerfis(diretorio)
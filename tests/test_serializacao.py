@@ -0,0 +1,79 @@
+import pytest
+
+from orientacao_carreiras.carreira import Carreira
+from orientacao_carreiras.serializacao import (CodificadorBinario, DecodificadorBinario,
+                                               codificar, decodificar_carreira,
+                                               decodificar_perfil, decodificar_relatorio,
+                                               relatorio_para_dict)
+
+from .conftest import criar_perfil
+
+
+def test_perfil_ida_e_volta():
+    perfil = criar_perfil({'programacao': 4, 'design': 2}, nome="José Ávila", idade=41)
+    perfil.adicionar_objetivo("Liderar projetos e equipes")
+
+    lido = decodificar_perfil(codificar(perfil))
+
+    assert (lido.nome, lido.idade, lido.area_atuacao) == ("José Ávila", 41, "Tecnologia")
+    assert lido.competencias == perfil.competencias
+    assert lido.obter_objetivos() == perfil.obter_objetivos()
+    assert lido.data_criacao == perfil.data_criacao
+
+
+def test_carreira_e_relatorio_ida_e_volta(carreiras_mock, sistema_mock):
+    for carreira in carreiras_mock:
+        lida = decodificar_carreira(codificar(carreira))
+        assert (lida.nome, lida.descricao, lida.crescimento_projetado, lida.salario_medio) == \
+            (carreira.nome, carreira.descricao, carreira.crescimento_projetado,
+             carreira.salario_medio)
+        assert lida.requisitos == carreira.requisitos
+
+    relatorio = sistema_mock.gerar_relatorio_completo(criar_perfil({'programacao': 4}))
+    assert decodificar_relatorio(codificar(relatorio)) == relatorio_para_dict(relatorio)
+
+
+@pytest.mark.parametrize('campo, alterar', [
+    ('idade', lambda perfil: setattr(perfil, 'idade', 40000)),
+    ('nome', lambda perfil: setattr(perfil, 'nome', 'a' * 70000)),
+    ('objetivos', lambda perfil: setattr(perfil, 'objetivos', [f'objetivo {i}' for i in range(300)])),
+    ('competencias[programacao]', lambda perfil: perfil.competencias.update(programacao=300)),
+    ('area_atuacao', lambda perfil: setattr(perfil, 'area_atuacao', 'á' * 40000)),
+])
+def test_perfil_fora_do_limite_nomeia_o_campo(campo, alterar):
+    perfil = criar_perfil({'programacao': 4})
+    alterar(perfil)
+
+    with pytest.raises(ValueError, match=campo.replace('[', r'\[').replace(']', r'\]')):
+        codificar(perfil)
+
+
+@pytest.mark.parametrize('campo, carreira', [
+    ('crescimento_projetado', Carreira("Estável", crescimento_projetado=2 ** 31)),
+    ('salario_medio', Carreira("Estável", salario_medio="alto")),
+    ('nome', Carreira("x" * 65536)),
+])
+def test_carreira_fora_do_limite_nomeia_o_campo(campo, carreira):
+    with pytest.raises(ValueError, match=campo):
+        codificar(carreira)
+
+
+def test_erro_nao_corrompe_o_fluxo(carreiras_mock):
+    # Um registro recusado não é gravado e os seguintes continuam legíveis
+    codificador = CodificadorBinario()
+    codificador.escrever(carreiras_mock[0])
+    with pytest.raises(ValueError, match='idade'):
+        codificador.escrever(criar_perfil({'competencia_nova': 3}, idade=-40000))
+    codificador.escrever(carreiras_mock[1])
+
+    lidas = list(DecodificadorBinario(codificador.obter_bytes()))
+    assert [carreira.nome for carreira in lidas] == [c.nome for c in carreiras_mock[:2]]
+    assert codificador.registros == 2
+
+
+def test_mais_de_65535_textos_novos_em_um_registro():
+    carreira = Carreira("Generalista")
+    carreira.requisitos['importantes'].extend(f'c{i}' for i in range(35000))
+    carreira.requisitos['desejaveis'].extend(f'c{i}' for i in range(35000, 70000))
+
+    assert decodificar_carreira(codificar(carreira)).requisitos == carreira.requisitos
@@ -0,0 +1,182 @@
+import asyncio
+import json
+
+from orientacao_carreiras.carreira import Carreira
+from orientacao_carreiras.pipeline import validar_registro
+from orientacao_carreiras.serializacao import relatorio_para_dict
+from orientacao_carreiras.servidor import (AgrupadorLotes, ErroRequisicao, ServicoRecomendacao,
+                                           TAMANHO_MAXIMO_CORPO)
+
+PERFIL = {"nome": "Ana Souza", "idade": 30, "competencias": {"programacao": 5}}
+
+
+def _requisicao(caminho, dados=None, corpo=None, cabecalhos=''):
+    if corpo is None:
+        corpo = json.dumps(dados).encode('utf-8')
+    return (f"POST {caminho} HTTP/1.1\r\nContent-Length: {len(corpo)}\r\n{cabecalhos}\r\n"
+            .encode('latin-1') + corpo)
+
+
+async def _ler_resposta(leitor):
+    # Retorna (status, cabeçalhos, dados) de uma resposta, ou None se a conexão fechou.
+    linha = await leitor.readline()
+    if not linha:
+        return None
+    status = int(linha.split()[1])
+    cabecalhos = {}
+    while True:
+        linha = await leitor.readline()
+        if linha in (b'\r\n', b''):
+            break
+        nome, _, valor = linha.decode('latin-1').partition(':')
+        cabecalhos[nome.strip().lower()] = valor.strip()
+    corpo = await leitor.readexactly(int(cabecalhos['content-length']))
+    return status, cabecalhos, json.loads(corpo)
+
+
+def _conversar(sistema, *requisicoes):
+    # Envia as requisições em uma conexão e coleta as respostas até o servidor fechar.
+    async def executar():
+        servico = ServicoRecomendacao(sistema, janela=0.001)
+        servidor = await servico.iniciar('127.0.0.1', 0)
+        porta = servidor.sockets[0].getsockname()[1]
+        try:
+            leitor, escritor = await asyncio.open_connection('127.0.0.1', porta)
+            escritor.write(b''.join(requisicoes))
+            await escritor.drain()
+            respostas = []
+            while len(respostas) < len(requisicoes):
+                resposta = await asyncio.wait_for(_ler_resposta(leitor), 5)
+                if resposta is None:
+                    break
+                respostas.append(resposta)
+            escritor.close()
+            return respostas
+        finally:
+            await servico.parar(servidor)
+
+    return asyncio.run(executar())
+
+
+def test_recomendacoes_iguais_ao_sistema(sistema_mock):
+    [(status, _, dados)] = _conversar(sistema_mock,
+                                      _requisicao('/recomendacoes', {'perfil': PERFIL, 'limite': 2}))
+    perfil, _ = validar_registro(PERFIL)
+
+    assert status == 200
+    assert dados['recomendacoes'] == [
+        {'carreira': carreira.nome, 'compatibilidade': compatibilidade}
+        for carreira, compatibilidade in sistema_mock.recomendar_carreiras(perfil, 2)]
+
+
+def test_campos_com_tipo_errado_retornam_400(sistema_mock):
+    respostas = _conversar(
+        sistema_mock,
+        _requisicao('/gaps', {'perfil': PERFIL, 'carreira': []}),
+        _requisicao('/gaps', {'perfil': PERFIL, 'carreira': ['Designer Digital']}),
+        _requisicao('/gaps', {'perfil': dict(PERFIL, objetivos=5)}),
+        _requisicao('/recomendacoes', {'perfil': PERFIL, 'limite': True}),
+        _requisicao('/gaps', {'perfil': PERFIL, 'carreira': 'Designer Digital'}),
+    )
+
+    assert [status for status, _, _ in respostas] == [400, 400, 400, 400, 200]
+    assert all(cabecalhos['connection'] == 'keep-alive' for _, cabecalhos, _ in respostas)
+
+
+def test_erro_inesperado_retorna_500(sistema_mock):
+    def falhar(perfil, carreira):
+        raise RuntimeError("falha")
+    sistema_mock.identificar_gaps = falhar
+
+    [(status, cabecalhos, dados)] = _conversar(
+        sistema_mock, _requisicao('/gaps', {'perfil': PERFIL, 'carreira': 'Designer Digital'}))
+
+    assert status == 500
+    assert dados == {'erros': ["Erro interno do servidor"]}
+    assert cabecalhos['connection'] == 'close'
+
+
+def test_corpo_grande_demais_fecha_a_conexao(sistema_mock):
+    # O corpo anunciado não é lido; o que vem depois não pode virar a próxima requisição
+    cabecalho = (f"POST /recomendacoes HTTP/1.1\r\n"
+                 f"Content-Length: {TAMANHO_MAXIMO_CORPO + 1}\r\n\r\n").encode('latin-1')
+    respostas = _conversar(sistema_mock, cabecalho,
+                           _requisicao('/recomendacoes', {'perfil': PERFIL}))
+
+    assert len(respostas) == 1
+    status, cabecalhos, _ = respostas[0]
+    assert status == 413
+    assert cabecalhos['connection'] == 'close'
+
+
+def test_rota_e_metodo_invalidos(sistema_mock):
+    respostas = _conversar(sistema_mock, _requisicao('/nada', {}),
+                           b"GET /gaps HTTP/1.1\r\n\r\n",
+                           _requisicao('/gaps', corpo=b'[1]'))
+
+    assert [status for status, _, _ in respostas] == [404, 405, 400]
+
+
+def test_pedidos_concorrentes_agrupados_em_um_lote(sistema_mock, perfis_sinteticos):
+    async def executar():
+        agrupador = AgrupadorLotes(sistema_mock, janela=0.05)
+        agrupador.iniciar()
+        try:
+            return agrupador, await asyncio.gather(*(
+                agrupador.recomendar(perfil, 1 + indice % 4)
+                for indice, perfil in enumerate(perfis_sinteticos[:12])))
+        finally:
+            await agrupador.parar()
+
+    agrupador, resultados = asyncio.run(executar())
+
+    assert resultados == [sistema_mock.recomendar_carreiras(perfil, 1 + indice % 4)
+                          for indice, perfil in enumerate(perfis_sinteticos[:12])]
+    assert (agrupador.lotes, agrupador.pedidos) == (1, 12)
+
+
+def test_relatorio_e_gaps_iguais_ao_sistema(sistema_mock):
+    respostas = _conversar(sistema_mock, _requisicao('/relatorio', {'perfil': PERFIL}),
+                           _requisicao('/gaps', {'perfil': PERFIL}),
+                           _requisicao('/relatorio', {'perfil': PERFIL, 'limite': 4}))
+    perfil, _ = validar_registro(PERFIL)
+    esperado = sistema_mock.gerar_relatorio_simples(perfil)
+
+    [(_, _, relatorio), (_, _, gaps), (_, _, relatorio_4)] = respostas
+    assert relatorio == relatorio_para_dict(sistema_mock.gerar_relatorio_completo(perfil))
+    assert relatorio['areas_desenvolver'] == esperado['areas_desenvolver']
+    assert gaps == {'perfil': PERFIL['nome'], 'carreira': esperado['recomendacoes'][0][0].nome,
+                    'gaps': esperado['areas_desenvolver']}
+
+    # O limite do corpo vale como em /recomendacoes, com os gaps de cada recomendação
+    assert relatorio_4['recomendacoes'] == [
+        {'carreira': carreira.nome, 'compatibilidade': compatibilidade,
+         'gaps': sistema_mock.identificar_gaps(perfil, carreira)}
+        for carreira, compatibilidade in sistema_mock.recomendar_carreiras(perfil, 4)]
+
+
+def test_gaps_usa_o_catalogo_recompilado(sistema_mock):
+    async def gaps(servico, nome):
+        corpo = json.dumps({'perfil': PERFIL, 'carreira': nome}).encode('utf-8')
+        try:
+            return await servico._responder('POST', '/gaps', corpo)
+        except ErroRequisicao as erro:
+            return erro.status, erro.erros
+
+    async def executar():
+        servico = ServicoRecomendacao(sistema_mock)
+        antes = await gaps(servico, 'Designer Digital')
+
+        # Mesmo número de carreiras, com uma delas trocada
+        nova = Carreira("Designer de Experiência")
+        nova.adicionar_competencia_essencial('design')
+        sistema_mock.carreiras[1] = nova
+        sistema_mock.recompilar_catalogo()
+        return antes, [await gaps(servico, nome)
+                       for nome in ('Designer Digital', 'Designer de Experiência')]
+
+    antes, depois = asyncio.run(executar())
+
+    assert antes[0] == 200
+    assert [status for status, _ in depois] == [404, 200]
+    assert depois[1][1]['gaps'] == ['design']
@@ -0,0 +1,50 @@
+import random
+
+from orientacao_carreiras.carreira import Carreira
+from orientacao_carreiras.sistema_recomendacao import SistemaRecomendacao
+
+from .conftest import criar_perfil
+
+
+def test_alteracoes_incrementais_iguais_ao_recalculo(carreiras_sinteticas,
+                                                     competencias_sinteticas):
+    sistema = SistemaRecomendacao(carreiras_sinteticas, tamanho_cache=0)
+    perfil = criar_perfil({})
+    gerador = random.Random(3)
+    nomes = competencias_sinteticas[:30]
+
+    with sistema.iniciar_sessao(perfil) as sessao:
+        for _ in range(200):
+            competencia = gerador.choice(nomes)
+            if competencia in perfil.competencias and gerador.random() < 0.3:
+                perfil.remover_competencia(competencia)
+            else:
+                perfil.adicionar_competencia(competencia, gerador.randint(1, 5))
+
+            assert sessao.pontos() == sistema.obter_matriz().pontuar_esparso(perfil)
+        assert sessao.recomendar(5) == sistema.recomendar_carreiras(perfil, 5)
+        assert sessao.compatibilidades() == sistema.compatibilidades_lote([perfil])[0]
+        assert sessao.relatorio() == sistema.gerar_relatorio_completo(perfil)
+        assert sessao.recalculos == 1 and sessao.atualizacoes > 0
+
+
+def test_recalcula_quando_o_catalogo_muda(sistema_mock):
+    perfil = criar_perfil({'programacao': 3})
+    sessao = sistema_mock.iniciar_sessao(perfil)
+
+    nova = Carreira("Especialista em Ética de IA")
+    nova.adicionar_competencia_essencial('etica_digital')
+    sistema_mock.adicionar_carreira(nova)
+    perfil.adicionar_competencia('etica_digital', 5)
+
+    assert sessao.recomendar(1) == [(nova, 100.0)]
+    assert sessao.recalculos == 2
+
+
+def test_fechar_deixa_de_observar_o_perfil(sistema_mock):
+    perfil = criar_perfil({'programacao': 3})
+    sessao = sistema_mock.iniciar_sessao(perfil)
+    sessao.fechar()
+
+    perfil.adicionar_competencia('programacao', 5)
+    assert sessao.atualizacoes == 0
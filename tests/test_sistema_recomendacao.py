@@ -0,0 +1,89 @@
+import pytest
+
+from orientacao_carreiras.carreira import Carreira
+from orientacao_carreiras.sistema_recomendacao import SistemaRecomendacao
+
+from .conftest import criar_perfil, recomendacoes_referencia
+
+
+@pytest.mark.parametrize('limite', [1, 3, 10, 0, -2])
+def test_recomendacoes_iguais_a_forca_bruta(carreiras_sinteticas, perfis_sinteticos, limite):
+    sistema = SistemaRecomendacao(carreiras_sinteticas, tamanho_cache=0)
+
+    for perfil in perfis_sinteticos:
+        assert sistema.recomendar_carreiras(perfil, limite) == \
+            recomendacoes_referencia(sistema, perfil, limite)
+
+
+def test_empates_seguem_a_ordem_do_catalogo(carreiras_empatadas):
+    sistema = SistemaRecomendacao(carreiras_empatadas)
+    perfil = criar_perfil({'programacao': 3})
+
+    assert [carreira.nome for carreira, _ in sistema.recomendar_carreiras(perfil, 3)] == \
+        ['Zeta', 'Alfa', 'Meio']
+
+
+def test_perfil_sem_competencias_completa_com_o_catalogo(sistema_mock, carreiras_mock):
+    recomendacoes = sistema_mock.recomendar_carreiras(criar_perfil({}), 3)
+
+    assert recomendacoes == [(carreira, 0.0) for carreira in carreiras_mock[:3]]
+
+
+def test_compatibilidade_de_carreira_sem_requisitos():
+    sistema = SistemaRecomendacao([Carreira("Vazia")])
+
+    assert sistema.calcular_compatibilidade(criar_perfil({'programacao': 5}), Carreira("Vazia")) == 0
+
+
+def test_carreiras_retornadas_correspondem_a_pontuacao(carreiras_mock):
+    # Edição direta de sistema.carreiras só vale após recompilar_catalogo
+    sistema = SistemaRecomendacao(list(carreiras_mock), tamanho_cache=0)
+    perfil = criar_perfil({'programacao': 5, 'analise_dados': 4})
+    antes = sistema.recomendar_carreiras(perfil, 3)
+
+    sistema.carreiras.reverse()
+    for limite in (3, 0):
+        recomendacoes = sistema.recomendar_carreiras(perfil, limite)
+        assert all(sistema.calcular_compatibilidade(perfil, carreira) == compatibilidade
+                   for carreira, compatibilidade in recomendacoes)
+    assert sistema.recomendar_carreiras(perfil, 3) == antes
+
+    sistema.recompilar_catalogo()
+    assert sistema.recomendar_carreiras(perfil, 3) == recomendacoes_referencia(sistema, perfil, 3)
+
+
+def test_compatibilidades_lote_iguais_ao_calculo_individual(carreiras_sinteticas,
+                                                           perfis_sinteticos):
+    sistema = SistemaRecomendacao(carreiras_sinteticas)
+
+    lote = sistema.compatibilidades_lote(perfis_sinteticos)
+
+    assert lote == [[sistema.calcular_compatibilidade(perfil, carreira)
+                     for carreira in carreiras_sinteticas] for perfil in perfis_sinteticos]
+    assert sistema.recomendar_carreiras_lote(perfis_sinteticos, 5) == \
+        [sistema.recomendar_carreiras(perfil, 5) for perfil in perfis_sinteticos]
+
+
+def test_competencia_repetida_nos_requisitos_conta_em_cada_categoria():
+    carreira = Carreira("Repetida")
+    carreira.adicionar_competencia_essencial('programacao')
+    carreira.adicionar_competencia_desejavel('programacao')
+    carreira.adicionar_competencia_importante('design')
+    sistema = SistemaRecomendacao([carreira])
+    perfil = criar_perfil({'programacao': 4, 'design': 1})
+
+    assert sistema.compatibilidades_lote([perfil]) == \
+        [[sistema.calcular_compatibilidade(perfil, carreira)]]
+    # programacao conta como essencial (3) e desejável (1); pontos máximos: 5 x (3 + 1 + 2)
+    assert sistema.calcular_compatibilidade(perfil, carreira) == \
+        round((4 * 3 + 1 * 2 + 4 * 1) / 30 * 100, 1)
+
+
+def test_adicionar_carreira_entra_na_matriz(sistema_mock):
+    nova = Carreira("Engenheiro de Dados")
+    nova.adicionar_competencia_essencial('analise_dados')
+    sistema_mock.adicionar_carreira(nova)
+    perfil = criar_perfil({'analise_dados': 5})
+
+    assert sistema_mock.recomendar_carreiras(perfil, 1) == [(nova, 100.0)]
+    assert sistema_mock.compatibilidades_lote([perfil])[0][-1] == 100.0
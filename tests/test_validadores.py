@@ -0,0 +1,52 @@
+from array import array
+
+import pytest
+
+from orientacao_carreiras.validadores import (MENSAGENS_ERRO, NIVEL_FORA_FAIXA, VALIDO,
+                                              _codigo_idade, _codigo_nivel, _codigo_nome,
+                                              validar_colunas, validar_idades_lote,
+                                              validar_niveis_lote, validar_nomes_lote)
+
+NOMES = ["Ana Souza", "José", "A", "x" * 51, "Ana|Bia", "R2D2", "", None, 42, "  Lia  ", "Ana|"]
+IDADES = [30, 14, 100, 13, 101, 30.5, "30", True, -5]
+NIVEIS = [1, 5, 0, 6, -1, 3.0, None, True]
+
+
+def test_lote_igual_ao_validador_individual():
+    assert list(validar_nomes_lote(NOMES)) == [_codigo_nome(nome) for nome in NOMES]
+    assert list(validar_idades_lote(IDADES)) == [_codigo_idade(idade) for idade in IDADES]
+    assert list(validar_niveis_lote(NIVEIS)) == [_codigo_nivel(nivel) for nivel in NIVEIS]
+
+
+@pytest.mark.parametrize('coluna', [
+    [1, 2, 3, 4, 5],
+    array('b', [3, 0, -1, 5, 6]),
+    array('i', [3, 0, 200, 5]),
+    bytes([1, 5, 9, 0]),
+])
+def test_colunas_de_niveis_tipadas(coluna):
+    assert list(validar_niveis_lote(coluna)) == [_codigo_nivel(nivel) for nivel in coluna]
+
+
+def test_colunas_validas_e_vazias():
+    assert validar_nomes_lote(["Ana", "Bruno Lima"]) == bytearray(2)
+    assert validar_idades_lote(array('i', [20, 40])) == bytearray(2)
+    assert validar_nomes_lote([]) == validar_idades_lote([]) == bytearray()
+
+
+def test_validar_colunas_combina_os_erros():
+    validacao = validar_colunas(nomes=["Ana", "B", "Caio"], idades=[20, 30, 10],
+                                niveis=[3, 3, 9])
+
+    assert validacao.linhas_invalidas() == [1, 2]
+    assert validacao.total_invalidas == 2 and len(validacao) == 3
+    assert validacao.mensagens() == {
+        1: [MENSAGENS_ERRO[_codigo_nome("B")]],
+        2: [MENSAGENS_ERRO[_codigo_idade(10)], MENSAGENS_ERRO[NIVEL_FORA_FAIXA]],
+    }
+    assert validacao.codigos['nome'][0] == VALIDO
+
+
+def test_colunas_de_tamanhos_diferentes():
+    with pytest.raises(ValueError):
+        validar_colunas(nomes=["Ana"], idades=[20, 30])
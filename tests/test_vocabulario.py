@@ -0,0 +1,55 @@
+import pytest
+
+from orientacao_carreiras.perfil import PerfilCompacto
+from orientacao_carreiras.sistema_recomendacao import SistemaRecomendacao
+from orientacao_carreiras.vocabulario import CompetenciasCompactas, VocabularioCompetencias
+
+
+def test_ids_sequenciais_e_estaveis():
+    vocabulario = VocabularioCompetencias(['programacao', 'design'])
+
+    assert vocabulario.obter_id('design') == 1
+    assert vocabulario.obter_id('etica_digital') == 2
+    assert vocabulario.obter_id('programacao') == 0
+    assert vocabulario.buscar_id('inexistente') is None
+    assert 'inexistente' not in vocabulario
+    assert vocabulario.obter_nome(2) == 'etica_digital'
+    assert len(vocabulario) == 3
+
+
+def test_competencias_compactas_funcionam_como_dicionario():
+    vocabulario = VocabularioCompetencias(['programacao', 'design', 'lideranca'])
+    competencias = CompetenciasCompactas(vocabulario, {'lideranca': 2, 'programacao': 5})
+
+    assert dict(competencias) == {'programacao': 5, 'lideranca': 2}
+    assert competencias.get('design') is None and 'design' not in competencias
+    assert list(competencias.itens_por_id()) == [(0, 5), (2, 2)]
+
+    competencias['lideranca'] = 4
+    del competencias['programacao']
+    assert dict(competencias) == {'lideranca': 4}
+    assert len(competencias) == 1
+    with pytest.raises(KeyError):
+        del competencias['programacao']
+
+
+@pytest.mark.parametrize('nivel', [0, 6, -1])
+def test_nivel_invalido(nivel):
+    with pytest.raises(ValueError):
+        CompetenciasCompactas(VocabularioCompetencias())['programacao'] = nivel
+
+
+@pytest.mark.parametrize('vocabulario', [None, VocabularioCompetencias()])
+def test_perfil_compacto_recomenda_igual_ao_perfil(carreiras_sinteticas, perfis_sinteticos,
+                                                   vocabulario):
+    # Com o vocabulário global a matriz pontua pelos ids; com outro, pelos nomes
+    sistema = SistemaRecomendacao(carreiras_sinteticas, tamanho_cache=0)
+
+    for perfil in perfis_sinteticos:
+        compacto = PerfilCompacto(perfil.nome, perfil.idade, perfil.area_atuacao, vocabulario)
+        for competencia, nivel in perfil.competencias.items():
+            compacto.adicionar_competencia(competencia, nivel)
+
+        assert dict(compacto.competencias) == dict(perfil.competencias)
+        assert sistema.recomendar_carreiras(compacto, 5) == \
+            sistema.recomendar_carreiras(perfil, 5)